@@ -1,3 +1,208 @@
 import pygame
-import os
 
+# ===== carrega sprite strip e divide em frames =====
+def load_strip(path, frames_count):
+    return split_strip(pygame.image.load(path).convert_alpha(), frames_count)
+
+def split_strip(img, frames_count):
+    """Frames da strip como cópias de pedaços dela (no mesmo formato de pixels de 'img')."""
+    w, h = img.get_size()
+    frame_w = w // frames_count
+    return [img.subsurface(pygame.Rect(i * frame_w, 0, frame_w, h)).copy() for i in range(frames_count)]
+
+def load_gif_frames(path):
+    from PIL import Image # Pillow só é importado se algum GIF precisar ser decodificado
+    frames = []
+    pil_image = Image.open(path)
+    try:
+        while True:
+            # Converte frame atual para RGBA (transparente)
+            frame = pil_image.convert("RGBA")
+            # Converte para Surface compatível com pygame
+            pygame_image = pygame.image.fromstring(frame.tobytes(), frame.size, frame.mode)
+            frames.append(pygame_image.copy())
+            pil_image.seek(pil_image.tell() + 1)
+    except EOFError:
+        pass  # acabou o GIF
+
+    return frames
+
+# ===== Formato de exibição =====
+# Uma superfície fora do formato da tela é convertida pixel a pixel em todo blit.
+# normalize_surface() deixa cada superfície no formato mais barato de copiar:
+#   - sem transparência: convert() (formato da tela, sem alfa)
+#   - alfa binário (cada pixel 0 ou 255): convert() + colorkey com RLEACCEL; o RLE
+#     pula os trechos transparentes inteiros em vez de misturar pixel a pixel
+#   - alfa de verdade (bordas suavizadas, texto): convert_alpha()
+# O resultado do blit é o mesmo nos três casos. python auditoria.py lista tudo que
+# foi carregado com formato, flags e custo medido de blit.
+COLORKEY = (255, 0, 255)
+_normalize = True
+
+def set_surface_normalization(enabled):
+    """Liga/desliga normalize_surface() (desligada: só convert/convert_alpha, como antes)."""
+    global _normalize
+    _normalize = enabled
+
+def has_binary_alpha(surface):
+    """True se todo pixel é totalmente opaco ou totalmente transparente."""
+    return pygame.mask.from_surface(surface, 254).count() == pygame.mask.from_surface(surface, 0).count()
+
+def normalize_surface(surface):
+    """Cópia de 'surface' no formato de blit mais rápido para a tela (sem janela: a própria)."""
+    if pygame.display.get_surface() is None:
+        return surface  # sem modo de vídeo não há formato de tela (ferramentas de build)
+    if surface.get_colorkey() is not None:
+        return surface  # já normalizada
+    if not surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert()
+    if _normalize and has_binary_alpha(surface):
+        opaque = pygame.Surface(surface.get_size()).convert()
+        opaque.fill(COLORKEY)
+        opaque.blit(surface, (0, 0))
+        w, h = surface.get_size()
+        transparent = w * h - pygame.mask.from_surface(surface, 254).count()
+        # só vale se a cor-chave não aparecer em nenhum pixel opaco
+        if pygame.mask.from_threshold(opaque, COLORKEY, (1, 1, 1, 255)).count() == transparent:
+            opaque.set_colorkey(COLORKEY, pygame.RLEACCEL)
+            return opaque
+    return surface.convert_alpha()
+
+def unkeyed(surface):
+    """Versão com alfa por pixel de uma superfície com colorkey, para transformar.
+
+    smoothscale ignora o colorkey e mistura a cor dos pixels transparentes nas bordas:
+    eles voltam como (0, 0, 0, 0), como saem dos arquivos decodificados, e não magenta."""
+    if surface.get_colorkey() is None:
+        return surface
+    surf = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+    surf.blit(surface, (0, 0))
+    return surf
+
+# ===== Filtro de redimensionamento (config.QUALITY_PRESETS: sprite_filter) =====
+_resize = pygame.transform.smoothscale
+
+def set_sprite_filter(name):
+    """"smooth" (smoothscale, padrão) ou "fast" (scale, vizinho mais próximo) para sprites.
+
+    Vale para o que ainda não foi redimensionado; o pacote pré-compilado guarda os
+    frames já prontos com smoothscale."""
+    global _resize
+    _resize = pygame.transform.scale if name == "fast" else pygame.transform.smoothscale
+
+def resize(surface, size):
+    return _resize(unkeyed(surface), size)
+
+# ===== Cache de animações (compartilhado pelo processo inteiro) =====
+# Chave: (caminho, quantidade de frames, tamanho final, espelhado).
+# frames_count=None indica GIF (lido pelo Pillow); um número indica strip horizontal.
+# As tuplas devolvidas são compartilhadas entre todas as instâncias: ninguém deve
+# desenhar por cima desses frames.
+_animation_cache = {}
+_cache_stats = {"hits": 0, "misses": 0}
+_bundle = None  # pacote pré-compilado (pacote.py), consultado antes de decodificar
+
+def use_bundle(bundle):
+    global _bundle
+    _bundle = bundle
+
+def get_bundle():
+    return _bundle
+
+def get_animation(path, frames_count=None, size=None, flip=False):
+    """Retorna a tupla de frames de 'path', decodificando o arquivo só na primeira vez."""
+    key = (path, frames_count, size, flip)
+    frames = _animation_cache.get(key)
+    if frames is not None:
+        _cache_stats["hits"] += 1
+        return frames
+    _cache_stats["misses"] += 1
+
+    if _bundle is not None:
+        frames = _bundle.animation(path, frames_count, size, flip)
+        if frames is not None:
+            _animation_cache[key] = frames
+            return frames
+
+    # todo frame novo sai já no formato da tela (normalize_surface)
+    if flip:
+        # espelha a partir da versão já redimensionada (também em cache)
+        base = get_animation(path, frames_count, size, False)
+        frames = tuple(normalize_surface(pygame.transform.flip(unkeyed(f), True, False)) for f in base)
+    elif size is not None:
+        base = get_animation(path, frames_count, None, False)
+        frames = tuple(
+            normalize_surface(_resize(unkeyed(f), size)) if f.get_size() != size else f
+            for f in base
+        )
+    elif frames_count is None:
+        frames = tuple(normalize_surface(f) for f in load_gif_frames(path))
+    else:
+        frames = tuple(normalize_surface(f) for f in load_strip(path, frames_count))
+
+    _animation_cache[key] = frames
+    return frames
+
+# ===== Carregamento em duas etapas (usado pelo carregador em threads) =====
+def decode_animation(path, frames_count=None):
+    """Parte pesada da leitura, que pode rodar fora da thread principal:
+    os frames do GIF ou a imagem inteira da strip (ainda sem convert)."""
+    if frames_count is None:
+        return load_gif_frames(path)
+    return pygame.image.load(path)
+
+def store_animation(path, frames_count, decoded):
+    """Guarda no cache o resultado de decode_animation (na thread principal: normalize_surface)."""
+    if frames_count is None:
+        frames = tuple(normalize_surface(f) for f in decoded)
+    else:
+        frames = tuple(normalize_surface(f) for f in split_strip(decoded.convert_alpha(), frames_count))
+    _animation_cache[(path, frames_count, None, False)] = frames
+    return frames
+
+def animation_cache_stats():
+    """Contadores do cache: acertos, faltas e quantidade de entradas guardadas."""
+    return {"hits": _cache_stats["hits"], "misses": _cache_stats["misses"], "entries": len(_animation_cache)}
+
+def animation_cache_items():
+    """Pares (chave, frames) de tudo que está no cache (usado para gerar o pacote)."""
+    return list(_animation_cache.items())
+
+def clear_animation_cache():
+    _animation_cache.clear()
+    _cache_stats["hits"] = 0
+    _cache_stats["misses"] = 0
+
+# ===== Carimbos: formas simples rasterizadas uma vez só =====
+# Círculos (orbes, tiros, corações e slots do HUD) e retângulos arredondados são
+# desenhados uma vez numa superfície com alfa e depois só copiados com blit, sem
+# rasterizar de novo a cada frame. Os pixels são os mesmos do pygame.draw direto na tela.
+_stamp_cache = {}
+
+def _stamp(key, size, draw):
+    surf = _stamp_cache.get(key)
+    if surf is None:
+        surf = pygame.Surface(size, pygame.SRCALPHA)
+        draw(surf)
+        surf = normalize_surface(surf)  # círculos sem antialiasing: colorkey + RLE
+        _stamp_cache[key] = surf
+    return surf
+
+def circle_stamp(radius, color, width=0):
+    """Círculo de raio 'radius' (só o contorno se width > 0); blit em (centro x - radius, centro y - radius)."""
+    color = tuple(color)
+    return _stamp(("circulo", radius, color, width), (radius * 2, radius * 2),
+                  lambda surf: pygame.draw.circle(surf, color, (radius, radius), radius, width))
+
+def rounded_rect_stamp(size, color, border_radius):
+    """Retângulo cheio de tamanho 'size' com cantos arredondados."""
+    color = tuple(color)
+    return _stamp(("retangulo", tuple(size), color, border_radius), size,
+                  lambda surf: pygame.draw.rect(surf, color, surf.get_rect(), border_radius=border_radius))
+
+def stamp_cache_items():
+    """Pares (chave, superfície) de todos os carimbos já criados."""
+    return list(_stamp_cache.items())
+
+def clear_stamp_cache():
+    _stamp_cache.clear()
@@ -0,0 +1,151 @@
+"""Áudio do jogo: música em streaming e efeitos num conjunto fixo de canais.
+
+- A música (Rising.ogg) toca pelo pygame.mixer.music, que lê e decodifica o arquivo
+  aos poucos enquanto toca: não ocupa memória nem trava o carregamento.
+- Os efeitos são decodificados uma vez só (nos workers do AssetLoader) já no formato
+  do mixer, que é fixado antes do pygame.init() por pre_init(): todo Sound fica com a
+  mesma taxa de amostragem e nada é convertido na hora de tocar.
+- Cada efeito tem um limite de vozes simultâneas e uma prioridade. Um tiro novo com
+  todas as vozes de tiro ocupadas rouba a voz de tiro mais antiga; sem canal livre,
+  rouba a voz mais antiga de prioridade menor ou igual, e se nem isso der o som é
+  descartado. Tocar um som nunca aloca nem espera: em rajada o custo é o mesmo.
+"""
+import os
+
+import pygame
+
+# formato do mixer: 44.1 kHz, 16 bits com sinal, estéreo; buffer pequeno = pouca latência
+FREQUENCY = 44100
+SAMPLE_SIZE = -16
+CHANNELS = 2
+BUFFER = 512
+
+SFX_VOICES = 8  # canais do mixer reservados aos efeitos
+
+MUSIC_FILE = os.path.join("assets", "snd", "Rising.ogg")
+MUSIC_VOLUME = 0.6
+
+# efeitos: nome -> caminho, volume, vozes simultâneas, prioridade (maior ganha), duração máxima (ms, 0 = inteira)
+SOUNDS = {
+    "tiro": {"path": os.path.join("assets", "snd", "gunfire_sfx.wav"), "volume": 0.5,
+             "max_voices": 3, "priority": 0, "maxtime": 500},
+    "pulo": {"path": os.path.join("assets", "snd", "SFX_Jump_03.wav"), "volume": 0.8,
+             "max_voices": 2, "priority": 1, "maxtime": 0},
+    "golpe": {"path": os.path.join("assets", "snd", "golpe.mp3"), "volume": 1.0,
+              "max_voices": 1, "priority": 2, "maxtime": 0},
+}
+
+def pre_init():
+    """Fixa o formato do mixer; precisa vir antes do pygame.init()/mixer.init()."""
+    pygame.mixer.pre_init(FREQUENCY, SAMPLE_SIZE, CHANNELS, BUFFER)
+
+class AudioEngine:
+    """Efeitos com vozes limitadas e roubo de voz + música em streaming.
+
+    Sem mixer (sem placa de som, SDL_AUDIODRIVER=dummy falhando...) tudo vira no-op.
+    """
+
+    def __init__(self, voices=SFX_VOICES):
+        self.enabled = pygame.mixer.get_init() is not None
+        self._effects = {}   # nome -> (Sound, max_voices, priority, maxtime)
+        self._voices = []    # por canal: [nome, prioridade, ordem em que começou] ou None
+        self._channels = []
+        self._order = 0
+        self.played = 0
+        self.stolen = 0
+        self.dropped = 0
+        if self.enabled:
+            pygame.mixer.set_num_channels(voices)
+            self._channels = [pygame.mixer.Channel(i) for i in range(voices)]
+            self._voices = [None] * voices
+
+    def add(self, name, sound, volume=1.0, max_voices=1, priority=0, maxtime=0):
+        """Registra um efeito já carregado (None = arquivo faltando: o efeito fica mudo)."""
+        if sound is None or not self.enabled:
+            return
+        sound.set_volume(volume)
+        self._effects[name] = (sound, max_voices, priority, maxtime)
+
+    def add_from(self, loader, sounds=SOUNDS):
+        for name, spec in sounds.items():
+            self.add(name, loader.get(name), spec["volume"], spec["max_voices"], spec["priority"], spec["maxtime"])
+
+    # ----- efeitos -----
+    def play(self, name):
+        effect = self._effects.get(name)
+        if effect is None:
+            return
+        sound, max_voices, priority, maxtime = effect
+
+        free = None
+        same = []      # canais tocando este mesmo efeito
+        weaker = []    # canais tocando algo de prioridade menor ou igual
+        for i, channel in enumerate(self._channels):
+            voice = self._voices[i]
+            if voice is None or not channel.get_busy():
+                self._voices[i] = None
+                if free is None:
+                    free = i
+                continue
+            if voice[0] == name:
+                same.append(i)
+            if voice[1] <= priority:
+                weaker.append(i)
+
+        if len(same) >= max_voices:
+            target = min(same, key=lambda i: self._voices[i][2])
+            self.stolen += 1
+        elif free is not None:
+            target = free
+        elif weaker:
+            target = min(weaker, key=lambda i: (self._voices[i][1], self._voices[i][2]))
+            self.stolen += 1
+        else:
+            self.dropped += 1
+            return
+
+        self._order += 1
+        self._voices[target] = [name, priority, self._order]
+        self._channels[target].play(sound, maxtime=maxtime)
+        self.played += 1
+
+    def play_all(self, names):
+        for name in names:
+            self.play(name)
+
+    def stop_all(self):
+        for i, channel in enumerate(self._channels):
+            channel.stop()
+            self._voices[i] = None
+
+    # ----- música -----
+    def play_music(self, path=MUSIC_FILE, volume=MUSIC_VOLUME, fade_ms=1000):
+        """Toca a música em loop, lida do disco aos poucos pelo mixer.music."""
+        if not self.enabled:
+            return False
+        if not os.path.exists(path):
+            print(f"Aviso: música {path} não encontrada; o jogo vai rodar sem música")
+            return False
+        try:
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play(-1, fade_ms=fade_ms)  # -1 = loop infinito
+        except pygame.error as e:
+            print(f"Aviso: não foi possível tocar a música: {e}")
+            return False
+        return True
+
+    def stop_music(self, fade_ms=500):
+        if self.enabled:
+            pygame.mixer.music.fadeout(fade_ms)
+
+    # ----- estatísticas -----
+    def stats(self):
+        busy = sum(1 for channel in self._channels if channel.get_busy())
+        return {"tocados": self.played, "roubados": self.stolen, "descartados": self.dropped,
+                "vozes_ativas": busy, "vozes": len(self._channels)}
+
+    def stats_line(self):
+        s = self.stats()
+        return (f"áudio: {s['vozes_ativas']}/{s['vozes']} vozes  "
+                f"{s['roubados']} roubadas  {s['descartados']} descartadas")
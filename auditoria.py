@@ -0,0 +1,199 @@
+"""Auditoria das superfícies carregadas: formato de pixels, flags e custo medido de blit.
+
+Carrega sem janela o que uma partida usa, pelos mesmos caminhos do jogo (telas e
+ícones pelo AssetLoader, sprites pelo cache de animações, carimbos do mundo, uma
+camada estática e os glifos do timer), e mede quanto custa copiar cada superfície
+para uma superfície no formato da tela. Mostra o que ficou fora do formato de
+exibição e o que usa alfa por pixel onde colorkey + RLE bastaria
+(assets.normalize_surface).
+
+Exemplos:
+    python auditoria.py                     # uma linha por superfície, mais cara primeiro
+    python auditoria.py --sem-normalizar    # só convert/convert_alpha, para comparar
+    python auditoria.py --qualidade baixa   # sprites reduzidos sem filtro (alfa binário)
+    python auditoria.py --json auditoria.json
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import sys
+import time
+
+import pygame
+
+import assets
+from config import WIDTH, HEIGHT, QUALITY, QUALITY_PRESETS
+
+# ===== Formato =====
+def pixel_format(surface):
+    """Ordem dos canais e bits por pixel, ex.: "ARGB32" ou "RGB32"."""
+    channels = sorted(((mask, name) for mask, name in zip(surface.get_masks(), "RGBA") if mask), reverse=True)
+    return "".join(name for _, name in channels) + str(surface.get_bitsize())
+
+def flag_names(surface):
+    flags = surface.get_flags()
+    names = []
+    if flags & pygame.SRCALPHA:
+        names.append("SRCALPHA")
+    if surface.get_colorkey() is not None:
+        names.append("colorkey")
+    if flags & pygame.RLEACCEL:
+        names.append("RLEACCEL")
+    elif flags & pygame.RLEACCELOK:
+        names.append("RLEACCELOK")
+    return names
+
+def display_formats():
+    """(formato da tela sem alfa, formato de convert_alpha()) para comparar."""
+    probe = pygame.Surface((1, 1))
+    return pixel_format(probe.convert()), pixel_format(probe.convert_alpha())
+
+def classify(surface, formats):
+    """Tipo da superfície e, se for o caso, o que daria para melhorar."""
+    opaque_fmt, alpha_fmt = formats
+    fmt = pixel_format(surface)
+    if surface.get_colorkey() is not None:
+        kind = "colorkey"
+        note = "" if fmt == opaque_fmt else "fora do formato da tela"
+    elif surface.get_flags() & pygame.SRCALPHA:
+        kind = "alfa"
+        if fmt != alpha_fmt:
+            note = "fora do formato da tela"
+        elif assets.has_binary_alpha(surface):
+            note = "alfa binário: colorkey + RLE serviria"
+        else:
+            note = ""
+    else:
+        kind = "opaco"
+        note = "" if fmt == opaque_fmt else "fora do formato da tela"
+    return kind, note
+
+# ===== Medição =====
+def blit_cost_us(target, surface, budget_px=2_000_000, repeat=3):
+    """Microssegundos por blit de 'surface' em 'target' (a passada mais rápida)."""
+    w, h = surface.get_size()
+    count = max(5, min(1000, budget_px // max(1, w * h)))
+    target.blit(surface, (0, 0))  # o primeiro blit monta o RLE
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(count):
+            target.blit(surface, (0, 0))
+        elapsed = (time.perf_counter() - start) / count
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e6
+
+# ===== Coleta =====
+def collect():
+    """Lista de (origem, nome, superfície) com tudo que o jogo carrega."""
+    from carregador import AssetLoader, IMAGES
+    from desenho import WorldRenderer, build_static_chunk
+    from entidades import SPRITE_FILES
+    from headless import DEFAULT_SCRIPT, ScriptedInput, parse_script
+    from pacote import open_bundle
+    from simulacao import Game, INPUT_SHOOT
+    from texto import GlyphAtlas
+
+    assets.use_bundle(open_bundle())
+    loader = AssetLoader()
+    for name, (path, size, alpha) in IMAGES.items():
+        loader.image(name, path, size, alpha)
+    for sprite_path, sprite_frames in SPRITE_FILES:
+        loader.animation(sprite_path, sprite_frames)
+    loader.wait_all()
+    loader.shutdown()
+
+    found = [("imagem", name, loader.get(name)) for name in IMAGES if loader.get(name) is not None]
+    background = loader.get("background") or pygame.Surface((WIDTH, HEIGHT)).convert()
+
+    # alguns frames de partida (com tiros) criam os sprites redimensionados e os carimbos
+    game = Game(0, weapon="espalhado")
+    renderer = WorldRenderer(pygame.Surface((WIDTH, HEIGHT)).convert(), background, level=game.level)
+    inputs = ScriptedInput(parse_script(DEFAULT_SCRIPT))
+    for tick in range(240):
+        game.tick(inputs.next() | (INPUT_SHOOT if tick % 10 == 0 else 0))
+        view = game.cam.view(1.0)
+        renderer.begin(view)
+        renderer.draw_game(game, view)
+        renderer.present()
+
+    for (path, frames_count, size, flip), frames in assets.animation_cache_items():
+        label = f"{path} {'x'.join(map(str, size)) if size else 'original'}{' espelhado' if flip else ''}"
+        found.extend(("sprite", f"{label} #{i}", frame) for i, frame in enumerate(frames))
+    for key, stamp in assets.stamp_cache_items():
+        found.append(("carimbo", " ".join(str(part) for part in key), stamp))
+    found.append(("camada", "chunk 0 da camada estática", build_static_chunk(game.level, 0, background)))
+    pygame.font.init()
+    glyphs = GlyphAtlas(pygame.font.Font(pygame.font.get_default_font(), 24), (255, 255, 255))
+    found.extend(("glifo", f"timer {ch!r}", surf) for ch, surf in glyphs.glyphs.items())
+    return found
+
+def audit():
+    formats = display_formats()
+    target = pygame.Surface((WIDTH, HEIGHT)).convert()
+    rows = []
+    for origin, name, surface in collect():
+        kind, note = classify(surface, formats)
+        cost = blit_cost_us(target, surface)
+        w, h = surface.get_size()
+        rows.append({"origem": origin, "nome": name, "tamanho": [w, h], "formato": pixel_format(surface),
+                     "flags": flag_names(surface), "tipo": kind, "us_por_blit": round(cost, 2),
+                     "ns_por_pixel": round(cost * 1000 / (w * h), 3), "obs": note})
+    rows.sort(key=lambda row: -row["us_por_blit"])
+    return formats, rows
+
+def summary(rows):
+    """Por tipo: quantidade, custo somado de um blit de cada e ns por pixel médio."""
+    result = {}
+    for row in rows:
+        entry = result.setdefault(row["tipo"], {"superficies": 0, "us_total": 0.0, "pixels": 0})
+        entry["superficies"] += 1
+        entry["us_total"] += row["us_por_blit"]
+        entry["pixels"] += row["tamanho"][0] * row["tamanho"][1]
+    for entry in result.values():
+        entry["ns_por_pixel"] = round(entry["us_total"] * 1000 / entry["pixels"], 3)
+        entry["us_total"] = round(entry["us_total"], 1)
+    return result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lista as superfícies carregadas com formato, flags e custo de blit.")
+    parser.add_argument("--sem-normalizar", action="store_true",
+                        help="carrega só com convert/convert_alpha (sem colorkey + RLE)")
+    parser.add_argument("--qualidade", choices=list(QUALITY_PRESETS), default=QUALITY,
+                        help="preset de config.QUALITY_PRESETS (filtro dos sprites)")
+    parser.add_argument("--limite", type=int, help="mostra só as N superfícies mais caras")
+    parser.add_argument("--json", help="salva a auditoria completa neste arquivo")
+    args = parser.parse_args(argv)
+
+    from headless import init_headless
+    init_headless()
+    assets.set_surface_normalization(not args.sem_normalizar)
+    assets.set_sprite_filter(QUALITY_PRESETS[args.qualidade]["sprite_filter"])
+
+    formats, rows = audit()
+    print(f"formato da tela: {formats[0]} (opaco), {formats[1]} (convert_alpha)")
+    print(f"{'us/blit':>9} {'ns/px':>7} {'tamanho':>10}  {'formato':<8} {'flags':<28} origem   nome")
+    for row in rows[:args.limite]:
+        size = "x".join(map(str, row["tamanho"]))
+        obs = f"  <-- {row['obs']}" if row["obs"] else ""
+        print(f"{row['us_por_blit']:9.2f} {row['ns_por_pixel']:7.3f} {size:>10}  {row['formato']:<8} "
+              f"{','.join(row['flags']) or '-':<28} {row['origem']:<8} {row['nome']}{obs}")
+    totals = summary(rows)
+    print("Resumo por tipo:")
+    for kind, entry in totals.items():
+        print(f"  {kind:<9} {entry['superficies']:>4} superfícies  {entry['us_total']:>9.1f} us somados  "
+              f"{entry['ns_por_pixel']:.3f} ns/px")
+    pending = sum(1 for row in rows if row["obs"])
+    print(f"{len(rows)} superfícies, {pending} com sugestão")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"formato_tela": formats, "superficies": rows, "resumo": totals}, f, ensure_ascii=False, indent=2)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,313 @@
+"""Benchmarks reprodutíveis da simulação e do desenho (sem janela).
+
+Cada cenário usa sementes fixas e o roteiro padrão do headless.py, então duas rodadas
+fazem exatamente o mesmo trabalho. Para cada cenário são medidos:
+  - update: ticks por segundo, pico de memória e blocos alocados que ficaram vivos (tracemalloc)
+  - draw: frames por segundo desenhando o mundo numa superfície fora da tela, idem memória
+
+Os números podem ser gravados como baseline (JSON) e comparados nas próximas rodadas.
+Com --replay, partidas reais gravadas (replay.py) viram cenários também: a entrada
+de cada tick vem do arquivo, que se repete enquanto houver ticks a medir.
+
+Exemplos:
+    python benchmark.py                          # roda tudo e compara com benchmarks/baseline.json
+    python benchmark.py --salvar-baseline        # grava os números atuais como baseline
+    python benchmark.py --cenario chuva_de_balas --vetorizado
+    python benchmark.py --replay replays/ultima_partida.fjr
+    python benchmark.py --qualidade baixa            # desenho em resolução interna menor + ampliação
+    python benchmark.py --backend textura            # desenho com texturas do SDL em vez de blits
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+
+import pygame
+
+from assets import set_sprite_filter
+from config import WIDTH, HEIGHT, QUALITY, QUALITY_PRESETS, BACKEND, BACKENDS
+from desenho import WorldRenderer
+from headless import DEFAULT_SCRIPT, ScriptedInput, parse_script, init_headless
+from mundo import Level, DEFAULT_LEVEL, read_level_data, widen_level, spawn_all
+from replay import Replay, ReplayInput, new_game
+from simulacao import Game, INPUT_SHOOT
+
+BASELINE_FILE = os.path.join("benchmarks", "baseline.json")
+
+# ===== Cenários =====
+# ticks: ticks de simulação medidos; frames: frames desenhados no teste de draw.
+# Quando a partida acaba antes, ela é reiniciada (mesma sequência de sementes).
+SCENARIOS = {
+    "nivel_atual": {"ticks": 3000, "frames": 600},
+    "inimigos_10x": {"ticks": 3000, "frames": 600, "enemy_factor": 10},
+    "chuva_de_balas": {"ticks": 3000, "frames": 600, "weapon": "espalhado", "rajada": True, "bullet_capacity": 256},
+    "sessao_longa": {"ticks": 30000, "frames": 600},
+    "mapa_longo": {"ticks": 3000, "frames": 600, "level_copies": 20},
+}
+
+def replay_scenario(path):
+    """Cenário (nome, parâmetros) que repete a partida gravada em 'path'."""
+    replay = Replay.load(path)
+    name = "replay_" + os.path.splitext(os.path.basename(path))[0]
+    ticks = max(replay.ticks, 600)
+    return name, {"ticks": ticks, "frames": 600, "replay": replay}
+
+# métricas em que maior é melhor (as outras: menor é melhor)
+HIGHER_IS_BETTER = ("ticks_por_segundo", "frames_por_segundo")
+# diferença mínima para uma métrica de memória contar como regressão (ruído do alocador)
+MIN_ABS_CHANGE = {"pico_kb": 32, "blocos_retidos": 256}
+
+class ScenarioRun:
+    """Uma partida (ou sequência de partidas) de um cenário, tick a tick."""
+
+    def __init__(self, params, seed=0, vectorized=False):
+        self.params = params
+        self.seed = seed
+        self.steps = parse_script(DEFAULT_SCRIPT)
+        self.extra = INPUT_SHOOT if params.get("rajada") else 0
+        self.replay = params.get("replay")
+        if self.replay is not None:
+            self.inputs = ReplayInput(self.replay)
+            self.game = new_game(self.replay, vectorized)
+            return
+        self.inputs = ScriptedInput(self.steps)
+        level = None
+        if params.get("level_copies"):
+            # o nível padrão repetido lado a lado: mapa de dezenas de telas em chunks
+            level = Level(widen_level(read_level_data(DEFAULT_LEVEL), params["level_copies"]))
+        self.game = Game(seed, vectorized=vectorized, weapon=params.get("weapon", "simples"),
+                         bullet_capacity=params.get("bullet_capacity"), level=level)
+        self._populate()
+
+    def _populate(self):
+        for _ in range(self.params.get("enemy_factor", 1) - 1):
+            self.game.add_enemies(spawn_all(self.game.level, self.game.rng, self.game.tuning["enemy_speed"]))
+
+    def step(self):
+        game = self.game
+        if self.replay is not None:
+            if game.finished or self.inputs.done:
+                game.reset(self.replay.seed)
+                self.inputs = ReplayInput(self.replay)
+        elif game.finished:
+            game.reset()
+            self._populate()
+            self.inputs = ScriptedInput(self.steps)
+        game.tick(self.inputs.next() | self.extra)
+
+def _measure(setup, body, count, repeat=3):
+    """Roda body() 'count' vezes: 'repeat' passadas cronometradas e uma sob tracemalloc.
+
+    setup() monta o estado do zero e devolve o que body recebe, para todas as passadas
+    fazerem o mesmo trabalho. Devolve (segundos, memória): o tempo é o da passada mais
+    rápida (menos ruído) e memória traz o pico de bytes alocados durante a passada e
+    quantos blocos alocados nela ficaram vivos.
+    """
+    elapsed = None
+    for _ in range(repeat):
+        state = setup()
+        gc.collect()
+        total = 0.0
+        for _ in range(count):
+            total += body(state)
+        elapsed = total if elapsed is None else min(elapsed, total)
+
+    state = setup()
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    base_current = tracemalloc.get_traced_memory()[0]
+    for _ in range(count):
+        body(state)
+    peak = tracemalloc.get_traced_memory()[1] - base_current
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    retained = sum(stat.count_diff for stat in after.compare_to(before, "filename"))
+    memory = {
+        "pico_kb": round(peak / 1024, 1),
+        "blocos_retidos": retained,
+    }
+    return elapsed, memory
+
+def bench_update(params, vectorized=False, repeat=3):
+    def setup():
+        return ScenarioRun(params, vectorized=vectorized)
+
+    def body(run):
+        start = time.perf_counter()
+        run.step()
+        return time.perf_counter() - start
+
+    ticks = params["ticks"]
+    elapsed, memory = _measure(setup, body, ticks, repeat)
+    result = {"ticks": ticks, "segundos": round(elapsed, 4),
+              "ticks_por_segundo": round(ticks / elapsed) if elapsed > 0 else None}
+    result.update(memory)
+    return result
+
+def bench_draw(params, background, vectorized=False, repeat=3, quality=QUALITY, display=None):
+    """Desenha o mundo (camada estática + sprites) a cada tick numa superfície fora da tela.
+
+    Com 'display' (textura.TextureDisplay) o desenho é feito com texturas na janela escondida dele."""
+    def setup():
+        run = ScenarioRun(params, vectorized=vectorized)
+        if display is not None:
+            from textura import TextureRenderer
+            return run, TextureRenderer(display, background, level=run.game.level)
+        target = pygame.Surface((WIDTH, HEIGHT)).convert()
+        return run, WorldRenderer(target, background, level=run.game.level, **QUALITY_PRESETS[quality])
+
+    def body(state):
+        run, renderer = state
+        run.step()  # a simulação avança fora do cronômetro
+        start = time.perf_counter()
+        view = run.game.cam.view(0.5)
+        renderer.begin(view)
+        renderer.draw_game(run.game, view, 0.5)
+        renderer.present()
+        return time.perf_counter() - start
+
+    frames = params["frames"]
+    elapsed, memory = _measure(setup, body, frames, repeat)
+    result = {"frames": frames, "segundos": round(elapsed, 4),
+              "frames_por_segundo": round(frames / elapsed) if elapsed > 0 else None}
+    result.update(memory)
+    return result
+
+def run_benchmarks(names, vectorized=False, repeat=3, scenarios=SCENARIOS, quality=QUALITY, backend=BACKEND):
+    init_headless()
+    set_sprite_filter(QUALITY_PRESETS[quality]["sprite_filter"])
+    image = pygame.image.load("assets/background.jpg").convert()
+    background = pygame.transform.scale(image, (WIDTH, HEIGHT))
+    Game(0, vectorized=vectorized)  # aquece o cache de sprites fora das medições
+    display = None
+    if backend != "superficie":
+        from textura import TextureDisplay
+        display = TextureDisplay((WIDTH, HEIGHT), software=backend == "textura_software", hidden=True)
+        print(f"renderer de texturas: {'GPU' if display.accelerated else 'software'}")
+
+    results = {}
+    for name in names:
+        params = scenarios[name]
+        results[name] = {
+            "update": bench_update(params, vectorized, repeat),
+            "draw": bench_draw(params, background, vectorized, repeat, quality, display),
+        }
+        upd, drw = results[name]["update"], results[name]["draw"]
+        print(f"{name:<16} update {upd['ticks_por_segundo']:>8} ticks/s  pico {upd['pico_kb']:>8} KB"
+              f"  |  draw {drw['frames_por_segundo']:>6} fps  pico {drw['pico_kb']:>8} KB")
+    return results
+
+# ===== Baseline =====
+def environment():
+    return {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "plataforma": platform.platform(),
+    }
+
+def load_baseline(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        print(f"Aviso: não foi possível ler o baseline {path}: {e}")
+        return None
+
+def save_baseline(path, mode, results):
+    data = load_baseline(path) or {}
+    data[mode] = {"ambiente": environment(), "resultados": results}
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def compare(results, baseline, tolerance):
+    """Compara com o baseline e devolve a lista de regressões (acima da tolerância)."""
+    regressions = []
+    for name, parts in results.items():
+        base_parts = baseline.get(name)
+        if not base_parts:
+            continue
+        for part, metrics in parts.items():
+            for metric, value in metrics.items():
+                base = base_parts.get(part, {}).get(metric)
+                if metric in ("ticks", "frames", "segundos") or not base or value is None:
+                    continue
+                change = (value - base) / base
+                if metric in HIGHER_IS_BETTER:
+                    worse = change < -tolerance
+                else:
+                    worse = change > tolerance and value - base > MIN_ABS_CHANGE.get(metric, 0)
+                mark = "  <-- regressão" if worse else ""
+                print(f"  {name}.{part}.{metric}: {base} -> {value} ({change:+.1%}){mark}")
+                if worse:
+                    regressions.append(f"{name}.{part}.{metric}")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks reprodutíveis de Forest Jump.")
+    parser.add_argument("--cenario", action="append", choices=sorted(SCENARIOS),
+                        help="roda só este cenário (pode repetir)")
+    parser.add_argument("--replay", action="append", default=[],
+                        help="acrescenta um cenário com a partida gravada neste arquivo (pode repetir)")
+    parser.add_argument("--vetorizado", action="store_true", help="usa inimigos/tiros em arrays NumPy")
+    parser.add_argument("--qualidade", choices=list(QUALITY_PRESETS), default=QUALITY,
+                        help="preset de renderização usado no teste de desenho")
+    parser.add_argument("--backend", choices=BACKENDS, default=BACKEND,
+                        help="backend de desenho medido (superfícies ou texturas do SDL)")
+    parser.add_argument("--repeticoes", type=int, default=3, help="passadas cronometradas por medição (vale a mais rápida)")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="arquivo de baseline")
+    parser.add_argument("--salvar-baseline", action="store_true", help="grava os resultados como baseline")
+    parser.add_argument("--tolerancia", type=float, default=0.15, help="piora aceita antes de acusar regressão")
+    parser.add_argument("--json", help="salva os resultados desta rodada neste arquivo")
+    args = parser.parse_args(argv)
+
+    scenarios = dict(SCENARIOS)
+    names = list(args.cenario or ([] if args.replay else SCENARIOS))
+    for path in args.replay:
+        name, params = replay_scenario(path)
+        scenarios[name] = params
+        names.append(name)
+    mode = "vetorizado" if args.vetorizado else "objetos"
+    if args.qualidade != QUALITY:
+        mode += "_" + args.qualidade  # cada preset tem o próprio baseline
+    if args.backend != BACKEND:
+        mode += "_" + args.backend  # idem para cada backend
+    results = run_benchmarks(names, args.vetorizado, args.repeticoes, scenarios, args.qualidade, args.backend)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"modo": mode, "ambiente": environment(), "resultados": results}, f, ensure_ascii=False, indent=2)
+
+    if args.salvar_baseline:
+        save_baseline(args.baseline, mode, results)
+        print(f"Baseline ({mode}) salvo em {args.baseline}")
+        return 0
+
+    baseline = (load_baseline(args.baseline) or {}).get(mode)
+    if baseline is None:
+        print(f"Sem baseline ({mode}) em {args.baseline}; use --salvar-baseline para criar um.")
+        return 0
+    if baseline.get("ambiente") != environment():
+        print("Aviso: o baseline foi gravado em outro ambiente; os tempos podem não ser comparáveis")
+    print(f"Comparando com {args.baseline} (tolerância {args.tolerancia:.0%}):")
+    regressions = compare(results, baseline["resultados"], args.tolerancia)
+    if regressions:
+        print(f"{len(regressions)} regressão(ões): {', '.join(regressions)}")
+        return 1
+    print("Nenhuma regressão.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
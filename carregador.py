@@ -0,0 +1,125 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from assets import decode_animation, store_animation, get_bundle, normalize_surface
+from config import WIDTH, HEIGHT
+
+# telas e ícones do jogo: nome -> (caminho, tamanho final, tem transparência)
+IMAGES = {
+    "tela_inicial": (os.path.join("assets", "tela_inicial.png"), (WIDTH, HEIGHT), False),
+    "lobby": (os.path.join("assets", "lobby_jogo.jpg"), (WIDTH, HEIGHT), False),
+    "background": (os.path.join("assets", "background.jpg"), (WIDTH, HEIGHT), False),
+    "timer": (os.path.join("assets", "timer_pygame.png"), (28, 28), True),
+    "creditos": (os.path.join("assets", "tela_creditos.png"), (WIDTH, HEIGHT), False),
+}
+
+# ===== Carregador de assets em segundo plano =====
+# A leitura/decodificação dos arquivos (a parte lenta) roda num pool de threads.
+# O que precisa da thread principal (convert/convert_alpha, que dependem da janela)
+# fica para quando o asset é pedido com get(). Assets 'lazy' só começam a carregar
+# no primeiro get(). Com o pacote pré-compilado aberto (assets.use_bundle), imagens
+# e sprites que estão nele não são decodificados de novo.
+class AssetLoader:
+    def __init__(self, workers=4):
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="assets")
+        self._jobs = {}      # nome -> [future (None se lazy e ainda não pedido), load, finish, lazy]
+        self._values = {}    # nome -> asset pronto
+        self.timings = {}    # nome -> {"decode_ms": ..., "finish_ms": ...}
+
+    # ----- registro -----
+    def submit(self, name, load, finish=None, lazy=False):
+        """Agenda load() num worker; finish(resultado) roda na thread principal no get()."""
+        future = None if lazy else self._pool.submit(self._decode, name, load)
+        self._jobs[name] = [future, load, finish, lazy]
+
+    def image(self, name, path, size=None, alpha=False, lazy=False):
+        bundle = get_bundle()
+        if bundle is not None and bundle.has_image(path, size, alpha):
+            self.submit(name, lambda: bundle.image(path, size, alpha, convert=False),
+                        normalize_surface if alpha else (lambda s: s.convert()), lazy)
+            return
+
+        def load():
+            surf = pygame.image.load(path)
+            if size is not None and surf.get_size() != size:
+                scale = pygame.transform.smoothscale if alpha else pygame.transform.scale
+                surf = scale(surf, size)
+            return surf
+        self.submit(name, load, normalize_surface if alpha else (lambda s: s.convert()), lazy)
+
+    def sound(self, name, path, lazy=False):
+        self.submit(name, lambda: pygame.mixer.Sound(path), lazy=lazy)
+
+    def animation(self, path, frames_count=None):
+        """Pré-carrega um sprite no cache do assets.py (get_animation passa a achá-lo pronto)."""
+        bundle = get_bundle()
+        if bundle is not None and bundle.has_animation(path, frames_count):
+            return  # o get_animation vai tirar do pacote
+        self.submit(path, lambda: decode_animation(path, frames_count),
+                    lambda decoded: store_animation(path, frames_count, decoded))
+
+    def _decode(self, name, load):
+        start = time.perf_counter()
+        try:
+            return load()
+        finally:
+            self.timings.setdefault(name, {})["decode_ms"] = round((time.perf_counter() - start) * 1000, 2)
+
+    # ----- consulta -----
+    def get(self, name):
+        """Devolve o asset pronto, esperando pelo worker se preciso (None se falhou ou não foi pedido)."""
+        if name in self._values:
+            return self._values[name]
+        job = self._jobs.get(name)
+        if job is None:
+            return None
+        if job[0] is None:
+            job[0] = self._pool.submit(self._decode, name, job[1])
+        future, _, finish, _ = job
+        value = None
+        try:
+            value = future.result()
+            if finish is not None:
+                start = time.perf_counter()
+                value = finish(value)
+                self.timings.setdefault(name, {})["finish_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        except Exception as e:
+            print(f"Aviso: não foi possível carregar {name}: {e}")
+            value = None
+        self._values[name] = value
+        return value
+
+    def ready(self, name):
+        if name in self._values:
+            return True
+        future = self._jobs[name][0]
+        return future is not None and future.done()
+
+    def progress(self):
+        """(prontos, total) dos assets que não são lazy."""
+        eager = [name for name, job in self._jobs.items() if not job[3]]
+        return sum(1 for name in eager if self.ready(name)), len(eager)
+
+    def finish_ready(self):
+        """Finaliza (convert etc.) o que os workers já terminaram; para chamar a cada frame."""
+        for name, job in self._jobs.items():
+            if name not in self._values and job[0] is not None and job[0].done():
+                self.get(name)
+
+    def wait_all(self):
+        for name, job in self._jobs.items():
+            if not job[3]:
+                self.get(name)
+
+    def shutdown(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def report(self):
+        """Uma linha por asset com o tempo de decodificação (worker) e de finalização (thread principal)."""
+        lines = []
+        for name, t in sorted(self.timings.items(), key=lambda item: -sum(item[1].values())):
+            lines.append(f"{name:<45} decode {t.get('decode_ms', 0):8.2f} ms   finish {t.get('finish_ms', 0):7.2f} ms")
+        return lines
@@ -0,0 +1,227 @@
+"""Telas paradas (tela inicial, lobby, créditos, tela final) movidas a eventos.
+
+Essas telas mostram uma imagem fixa e esperam uma tecla. Em vez de redesenhar e
+chamar display.update() 60 vezes por segundo, o SceneManager desenha a tela uma
+vez e dorme em pygame.event.wait até chegar um evento ou até a cena pedir para
+acordar (barra de carregamento, fade). Só redesenha quando algo mudou ou quando
+a janela pede (WINDOWEXPOSED). Parado no lobby, o processo praticamente não usa CPU.
+
+O SceneManager guarda, por tela, tempo na tela, tempo de CPU do processo, quadros
+desenhados e quantas vezes acordou (report()). Para comparar com o loop antigo:
+    python cenas.py --medir                 # cada tela por 5 s, orientada a eventos e a 60 fps
+    python cenas.py --medir --segundos 10
+"""
+import os
+import sys
+import time
+
+import pygame
+
+from config import WIDTH, HEIGHT, IDLE_WAKE_MS
+
+# ===== Cena =====
+class Scene:
+    """Uma tela parada. Quem herda implementa draw() e, se preciso, handle_event(),
+    needs_redraw() e wake_in(). A cena termina quando 'result' deixa de ser None."""
+    name = "tela"
+
+    def __init__(self):
+        self.result = None
+
+    def enter(self, now):
+        """Chamado toda vez que a cena volta para a tela."""
+        self.result = None
+
+    def handle_event(self, event):
+        pass
+
+    def needs_redraw(self, now):
+        """True se a tela mudou desde o último draw()."""
+        return False
+
+    def wake_in(self, now):
+        """Milissegundos até a cena precisar acordar sem evento (None = só com evento)."""
+        return None
+
+    def draw(self, window, now):
+        raise NotImplementedError
+
+class ImageScene(Scene):
+    """Imagem em tela cheia; as teclas de 'keys' encerram a cena com o valor associado.
+
+    Com 'loader', enquanto ainda há assets carregando, acorda a cada IDLE_WAKE_MS para
+    finalizá-los (loader.finish_ready) e redesenha só quando a barra de progresso muda."""
+
+    def __init__(self, name, image, keys, loader=None):
+        super().__init__()
+        self.name = name
+        self.image = image
+        self.keys = keys
+        self.loader = loader
+        self._progress = None
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key in self.keys:
+            self.result = self.keys[event.key]
+
+    def _loading(self):
+        if self.loader is None:
+            return False
+        done, total = self.loader.progress()
+        return done < total
+
+    def needs_redraw(self, now):
+        if self.loader is None:
+            return False
+        self.loader.finish_ready()
+        return self.loader.progress() != self._progress
+
+    def wake_in(self, now):
+        return IDLE_WAKE_MS if self._loading() else None
+
+    def draw(self, window, now):
+        if self.image:
+            window.blit(self.image, (0, 0))
+        else:
+            window.fill((0, 0, 0))
+        if self.loader is not None:
+            self._progress = self.loader.progress()
+            draw_loading_bar(window, self._progress)
+
+def draw_loading_bar(window, progress):
+    """Barra fina no rodapé enquanto ainda há assets carregando."""
+    done, total = progress
+    if done < total:
+        width, height = window.get_size()
+        pygame.draw.rect(window, (40, 40, 40), (0, height - 6, width, 6))
+        pygame.draw.rect(window, (255, 200, 0), (0, height - 6, width * done // total, 6))
+
+# ===== Gerenciador =====
+# eventos em que a janela precisa ser desenhada de novo (voltou a aparecer, foi descoberta...)
+_EXPOSE_EVENTS = (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE)
+# com o backend de texturas a janela de formato fica aberta, e fechar a do jogo só gera WINDOWCLOSE
+_QUIT_EVENTS = (pygame.QUIT, pygame.WINDOWCLOSE)
+
+class SceneManager:
+    """Roda cenas paradas no 'display' (pygame.display ou textura.TextureDisplay).
+
+    Com 'redraw_fps' volta ao loop antigo (redesenha tudo a essa taxa, sem esperar
+    eventos); serve só para medir a diferença."""
+
+    def __init__(self, display, redraw_fps=None):
+        self.display = display
+        self.redraw_fps = redraw_fps
+        self.clock = pygame.time.Clock()
+        self.stats = {}  # nome da tela -> {"segundos", "cpu_s", "quadros", "despertares"}
+
+    def run(self, scene, on_first_frame=None):
+        """Mostra 'scene' até ela terminar e devolve scene.result.
+
+        on_first_frame() é chamado depois que o primeiro quadro chega à tela."""
+        window = self.display.get_surface()
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        frames = wakeups = 0
+        scene.enter(pygame.time.get_ticks())
+        dirty = True
+        try:
+            while scene.result is None:
+                now = pygame.time.get_ticks()
+                if dirty or scene.needs_redraw(now) or self.redraw_fps:
+                    scene.draw(window, now)
+                    self.display.update()
+                    frames += 1
+                    dirty = False
+                    if on_first_frame is not None:
+                        callback, on_first_frame = on_first_frame, None
+                        callback()
+
+                if self.redraw_fps:
+                    self.clock.tick(self.redraw_fps)
+                    events = pygame.event.get()
+                else:
+                    timeout = scene.wake_in(now)
+                    # wait(0) esperaria para sempre: um timeout sempre é de pelo menos 1 ms
+                    first = pygame.event.wait() if timeout is None else pygame.event.wait(max(1, int(timeout)))
+                    events = [first] + pygame.event.get()
+                wakeups += 1
+
+                for event in events:
+                    if event.type in _QUIT_EVENTS:
+                        pygame.quit()
+                        raise SystemExit()
+                    if event.type in _EXPOSE_EVENTS:
+                        dirty = True
+                    scene.handle_event(event)
+        finally:
+            entry = self.stats.setdefault(scene.name, {"segundos": 0.0, "cpu_s": 0.0, "quadros": 0, "despertares": 0})
+            entry["segundos"] += time.perf_counter() - wall_start
+            entry["cpu_s"] += time.process_time() - cpu_start
+            entry["quadros"] += frames
+            entry["despertares"] += wakeups
+        return scene.result
+
+    def report(self):
+        """Uma linha por tela: tempo nela, CPU do processo (% de um núcleo) e quadros."""
+        lines = []
+        for name, entry in self.stats.items():
+            seconds = entry["segundos"]
+            usage = entry["cpu_s"] / seconds * 100 if seconds > 0 else 0.0
+            lines.append(f"{name:<12} {seconds:7.1f} s   CPU {usage:5.1f}%   {entry['quadros']:6d} quadros   "
+                         f"{entry['despertares']:6d} despertares")
+        return lines
+
+# ===== Medição =====
+def _press_space_after(ms):
+    """Agenda um ESPAÇO falso: a tela fica parada 'ms' e depois sai como se o jogador apertasse."""
+    pygame.time.set_timer(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE, mod=0, unicode=" "), ms, 1)
+
+def measure(seconds=5.0):
+    """Mostra cada tela parada por 'seconds' nos dois modos e devolve {modo: SceneManager}."""
+    from carregador import AssetLoader, IMAGES
+    from tela_final import TelaFinal
+
+    pygame.init()  # inclui o timer do SDL, usado pelo ESPAÇO agendado
+    pygame.display.set_mode((WIDTH, HEIGHT))
+    display = pygame.display
+    font = pygame.font.Font(pygame.font.get_default_font(), 24)
+
+    results = {}
+    for mode, fps in (("eventos", None), ("60fps", 60)):
+        loader = AssetLoader()
+        for name in ("tela_inicial", "lobby", "background", "creditos"):
+            loader.image(name, *IMAGES[name])
+        manager = SceneManager(display, redraw_fps=fps)
+        scenes = [
+            ImageScene("inicial", loader.get("tela_inicial"), {pygame.K_SPACE: "lobby"}, loader),
+            ImageScene("lobby", loader.get("lobby"), {pygame.K_SPACE: "jogar"}),
+            ImageScene("creditos", loader.get("creditos"), {pygame.K_SPACE: "voltar"}),
+            TelaFinal(display.get_surface(), loader.get("background"), font, 3, 5),
+        ]
+        for scene in scenes:
+            pygame.event.clear()
+            _press_space_after(int(seconds * 1000))
+            manager.run(scene)
+        loader.shutdown()
+        results[mode] = manager
+    return results
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Uso de CPU das telas paradas (orientadas a eventos x 60 fps).")
+    parser.add_argument("--medir", action="store_true", help="mede cada tela nos dois modos")
+    parser.add_argument("--segundos", type=float, default=5.0, help="tempo em cada tela")
+    args = parser.parse_args(argv)
+    if not args.medir:
+        parser.print_help()
+        return 0
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    for mode, manager in measure(args.segundos).items():
+        print(f"{mode}:")
+        for line in manager.report():
+            print("  " + line)
+    pygame.quit()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
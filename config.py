@@ -0,0 +1,59 @@
+# ===== Configurações compartilhadas (tela, mapa e simulação) =====
+# Este módulo não abre janela nem inicializa o pygame: pode ser importado pelo jogo,
+# pelo modo headless e por ferramentas.
+
+# ===== Configurações da tela =====
+WIDTH, HEIGHT = 1280, 720 # resolução da tela
+
+# ===== Chão =====
+GROUND_HEIGHT = 100 # 100px para cima
+GROUND_Y = HEIGHT - GROUND_HEIGHT #calcula a coordenada Y do topo do chão com base na altura da janela e na altura do chão
+
+# ===== Simulação em passo fixo =====
+# A física é avançada em ticks de duração fixa; a renderização roda na taxa que o monitor
+# conseguir e interpola entre o tick anterior e o atual. Todas as constantes de movimento
+# (gravidade 0.7, velocidade 5, tiro 12...) são calibradas por tick de 1/60 s, por isso o
+# tick fica em 60 Hz: o jogo se comporta igual ao antigo clock.tick(60), mas sem depender
+# do frame rate.
+TICK_RATE = 60                       # ticks de simulação por segundo
+TICK_MS = 1000 / TICK_RATE           # duração de um tick em ms
+MAX_FRAME_MS = 250                   # um frame travado nunca conta mais que isso
+MAX_TICKS_PER_FRAME = 8              # limite de catch-up por frame (evita espiral de ticks)
+MAX_FPS = 0                          # 0 = renderização sem limite
+FULL_REDRAW = False                  # True = redesenha a tela inteira todo frame (sem dirty rects)
+ASSET_TIMINGS = False                # True = imprime o tempo de carregamento de cada asset
+STARTUP_BUDGET_MS = 400              # orçamento até o primeiro frame (python roda_jogo.py --relatorio-inicio)
+IDLE_WAKE_MS = 100                   # telas paradas: intervalo entre acordadas enquanto há assets carregando
+SCREEN_CPU_STATS = False             # True = imprime o uso de CPU de cada tela parada (cenas.py)
+
+def ticks_to_ms(ticks):
+    return ticks * 1000 // TICK_RATE
+
+# ===== Qualidade de renderização (python roda_jogo.py --qualidade baixa) =====
+# render_scale: o mundo é desenhado numa superfície interna menor (0.5 = 640x360) e ampliado
+# para a janela uma vez por frame; o HUD continua sendo desenhado na resolução nativa.
+# upscale: "nearest" (transform.scale) ou "smooth" (transform.smoothscale) nessa ampliação.
+# sprite_filter: filtro ao redimensionar sprites, camada estática e carimbos ("smooth" ou "fast").
+# Com render_scale 0.5 e "nearest" os dirty rects continuam valendo (só o que mudou é ampliado);
+# escalas não inteiras (0.75...) ou "smooth" ampliam a tela inteira todo frame, o que custa mais
+# (~3 ms com "nearest" e ~9 ms com "smooth" a 1280x720) do que desenhar menos pixels economiza.
+# Os presets só reduzem pixels desenhados e enviados à tela: ajudam onde isso é o gargalo.
+QUALITY_PRESETS = {
+    "alta": {"render_scale": 1.0, "upscale": "nearest", "sprite_filter": "smooth"},
+    "media": {"render_scale": 0.5, "upscale": "nearest", "sprite_filter": "smooth"},  # baixa com sprites filtrados
+    "baixa": {"render_scale": 0.5, "upscale": "nearest", "sprite_filter": "fast"},
+}
+QUALITY = "alta"
+
+# ===== Backend de desenho (python roda_jogo.py --backend textura) =====
+# "superficie": blits de Surface em software na janela do pygame.display (padrão)
+# "textura": sprites viram texturas do SDL (pygame._sdl2.video) e o frame é montado com
+#            cópias de textura, na GPU se houver; sem GPU, com o renderer de software do SDL
+# "textura_software": texturas sempre com o renderer de software do SDL
+BACKENDS = ("superficie", "textura", "textura_software")
+BACKEND = "superficie"
+
+# ===== Limites do mapa (duas telas em sequência) =====
+MAP_WIDTH = WIDTH * 2  # duas telas lado a lado
+MAP_HEIGHT = HEIGHT
+WALL_WIDTH = 40  # largura das paredes laterais
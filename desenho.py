@@ -0,0 +1,298 @@
+import pygame
+
+from assets import circle_stamp, normalize_surface, unkeyed
+from config import WIDTH, GROUND_Y, GROUND_HEIGHT, MAP_HEIGHT
+from mundo import ORB_RADIUS, load_level
+
+SKY_COLOR = (35, 60, 110)
+GROUND_COLOR = (10, 9, 9)
+WALL_COLOR = (60, 60, 60)
+ORB_COLOR = (255, 200, 0)
+
+# ===== Camada estática do mundo (um pedaço por chunk do nível) =====
+def build_static_chunk(level, index, background):
+    """Pré-renderiza tudo que nunca muda no chunk 'index' do nível:
+    céu, background (repetido a cada WIDTH), chão, plataformas e paredes."""
+    x0 = index * level.chunk_width
+    width = min(level.chunk_width, level.width - x0)
+    layer = pygame.Surface((width, MAP_HEIGHT)).convert()
+    layer.fill(SKY_COLOR)
+    for x in range(x0 - x0 % WIDTH, x0 + width, WIDTH):
+        layer.blit(background, (x - x0, 0))
+    pygame.draw.rect(layer, GROUND_COLOR, (0, GROUND_Y, width, GROUND_HEIGHT))
+    for plat in level.platforms_between(x0, x0 + width):
+        pygame.draw.rect(layer, GROUND_COLOR, pygame.Rect(plat).move(-x0, 0), border_radius=12)
+    for wall in level.walls_between(x0, x0 + width):
+        pygame.draw.rect(layer, WALL_COLOR, pygame.Rect(wall).move(-x0, 0))
+    return layer
+
+# ===== Sprites do mundo (comum aos backends de desenho) =====
+def queue_world_sprites(queue, game, view, alpha=1.0):
+    """Acrescenta a 'queue' os (superfície, posição na tela) de orbes, inimigos, tiros e
+    jogador, nessa ordem; só entra o que está perto da câmera."""
+    cx, cy = int(view.x), int(view.y)
+    draw_left = cx - 200
+    draw_right = cx + WIDTH + 200
+
+    # Orbes (coletáveis)
+    orb_stamp = circle_stamp(ORB_RADIUS, ORB_COLOR)
+    for orb in game.orbs_between(draw_left, draw_right):
+        queue.append((orb_stamp, (orb.centerx - ORB_RADIUS - cx, orb.centery - ORB_RADIUS - cy)))
+
+    # Inimigos
+    for enemy in game.enemies_between(draw_left, draw_right):
+        if hasattr(enemy, "dead_finished") and enemy.dead_finished:
+            continue
+        queue.append(enemy.sprite(view, alpha))
+
+    # Tiros
+    for bullet in game.bullets_between(draw_left, draw_right):
+        queue.append(bullet.sprite(view, alpha))
+
+    # Jogador (None enquanto pisca invisível)
+    player = game.player.sprite(view, game.sim_time_ms, alpha)
+    if player is not None:
+        queue.append(player)
+
+# ===== Renderizador com dirty rects =====
+class WorldRenderer:
+    """Desenha o mundo a partir da camada estática e atualiza só o que mudou na tela.
+
+    A camada estática é montada por chunk do nível, só para os chunks que aparecem
+    na tela (e os vizinhos); os que ficam para trás são descartados.
+
+    Enquanto a câmera está parada, cada frame apaga os retângulos sujos do frame
+    anterior (recopiando a camada estática por cima), desenha os sprites e o HUD
+    e chama display.update() só com os retângulos antigos + novos. Se a câmera se
+    mexeu, se algo pediu invalidate() ou com full_redraw=True, a tela inteira é
+    redesenhada.
+
+    Sprites e carimbos (assets.circle_stamp) não são desenhados um a um: queue()
+    os junta numa lista de desenho e flush() manda tudo num único Surface.blits.
+    blit_calls conta as chamadas de blit/blits na tela em cada frame.
+
+    Com render_scale < 1 (config.QUALITY_PRESETS) o mundo vai para uma superfície
+    interna menor ('target'): a camada estática e os sprites são reduzidos uma vez
+    (com o filtro 'sprite_filter') e guardados, e ao fim de draw_game() a superfície
+    interna é ampliada para a janela com 'upscale' ("nearest" ou "smooth"). O HUD
+    desenhado depois continua na resolução nativa. Se a janela for um múltiplo
+    inteiro da superfície interna (render_scale 0.5) e a ampliação for "nearest",
+    os dirty rects continuam valendo: só os retângulos que mudaram são restaurados
+    na superfície interna e ampliados de novo, com o mesmo resultado da ampliação
+    da tela toda. Nos outros casos, com render_scale < 1 todo frame é um redesenho
+    completo.
+    """
+
+    def __init__(self, window, background, full_redraw=False, level=None, render_scale=1.0,
+                 upscale="nearest", sprite_filter="smooth"):
+        self.window = window
+        self.background = background
+        self.level = level if level is not None else load_level()
+        self._chunks = {}  # índice do chunk -> camada estática dele
+        self.full_redraw = full_redraw
+        self.screen_rect = window.get_rect()
+        self.render_scale = render_scale
+        if render_scale == 1:
+            self.target = window
+        else:
+            size = (round(self.screen_rect.width * render_scale), round(self.screen_rect.height * render_scale))
+            self.target = pygame.Surface(size, 0, window)  # mesmo formato da janela: a ampliação não converte nada
+        self.target_rect = self.target.get_rect()
+        # fator inteiro de ampliação (0 = não inteiro ou filtrado: sem dirty rects na superfície interna)
+        zoom = 1 / render_scale
+        self._zoom = int(zoom) if zoom.is_integer() and upscale != "smooth" else 0
+        self._stale = []      # retângulos da superfície interna a ampliar de novo neste frame
+        self._refreshed = []  # ...e onde eles foram parar na janela
+        self._chunk_w = round(self.level.chunk_width * render_scale)
+        self._upscale = pygame.transform.smoothscale if upscale == "smooth" else pygame.transform.scale
+        self._resize = pygame.transform.scale if sprite_filter == "fast" else pygame.transform.smoothscale
+        self._scaled = {}  # id(sprite) -> (sprite, versão reduzida para a superfície interna)
+        self._map_x = 0
+        self._cam_pos = None
+        self._prev_dirty = []
+        self._dirty = []
+        self._full = True
+        self.last_update_area = 0  # pixels enviados ao display no último frame
+        self._queue = []           # (superfície, posição na tela) esperando o próximo flush()
+        self.blit_calls = 0        # chamadas de blit/blits na tela neste frame
+        self.sprites = 0           # superfícies enviadas em lote neste frame
+        self.last_blit_calls = 0
+        self.last_sprites = 0
+
+    def invalidate(self):
+        """Força um redesenho completo no próximo frame (mudança de tela, overlay...)."""
+        self._full = True
+
+    def begin(self, view):
+        """Prepara a tela para um novo frame com a câmera em 'view'."""
+        scale = self.render_scale
+        self._map_x = int(view.x)
+        cam_pos = (int(view.x * scale), int(view.y * scale))  # em pixels da superfície interna
+        self._full = self._full or self.full_redraw or not self._zoom or cam_pos != self._cam_pos
+        self._cam_pos = cam_pos
+        self._dirty = []
+        self._stale = []
+        self._refreshed = []
+        self.blit_calls = self.sprites = 0
+        if self._full:
+            self._blit_static((0, 0), pygame.Rect(cam_pos, self.target_rect.size))
+            self._drop_far_chunks(cam_pos[0])
+        else:
+            # apaga os sprites/HUD do frame anterior
+            for rect in self._prev_dirty:
+                if self.target is not self.window:
+                    rect = self._to_target(rect)
+                    self._stale.append(rect)
+                self._restore(rect)
+
+    def _restore(self, rect):
+        self._blit_static(rect.topleft, rect.move(self._cam_pos))
+
+    def _static_chunk(self, index):
+        layer = self._chunks.get(index)
+        if layer is None:
+            layer = build_static_chunk(self.level, index, self.background)
+            if self.render_scale != 1:
+                w, h = layer.get_size()
+                layer = self._resize(layer, (round(w * self.render_scale), round(h * self.render_scale)))
+            self._chunks[index] = layer
+        return layer
+
+    def _blit_static(self, dest, area):
+        """Copia para a tela, em 'dest', a área 'area' do mapa (pode cruzar mais de um chunk)."""
+        cw = self._chunk_w
+        first = max(0, area.left // cw)
+        last = min(self.level.chunk_count - 1, (area.right - 1) // cw)
+        for index in range(first, last + 1):
+            x0 = index * cw
+            part = area.clip(pygame.Rect(x0, area.top, cw, area.height))
+            if part.width:
+                self.target.blit(self._static_chunk(index), (dest[0] + part.left - area.left, dest[1]),
+                                 part.move(-x0, 0))
+                self.blit_calls += 1
+
+    def _drop_far_chunks(self, cam_x):
+        cw = self._chunk_w
+        first = cam_x // cw - 1
+        last = (cam_x + self.target_rect.width) // cw + 1
+        for index in [i for i in self._chunks if i < first or i > last]:
+            del self._chunks[index]
+
+    def add(self, rect):
+        """Registra um retângulo (em coordenadas de tela) desenhado neste frame."""
+        if rect is not None and rect.width and rect.height:
+            self._dirty.append(rect.clip(self.screen_rect))
+
+    def _add_world(self, rect):
+        """Como add(), para um retângulo da superfície interna."""
+        if self.target is self.window:
+            self.add(rect)
+        elif rect.width and rect.height:
+            rect = rect.clip(self.target_rect)
+            self._stale.append(rect)
+            if self._zoom:
+                self.add(self._to_window(rect))
+
+    def _to_target(self, rect):
+        """Menor retângulo da superfície interna que cobre 'rect' da janela."""
+        z = self._zoom
+        left, top = rect.left // z, rect.top // z
+        right, bottom = -(-rect.right // z), -(-rect.bottom // z)
+        return pygame.Rect(left, top, right - left, bottom - top).clip(self.target_rect)
+
+    def _to_window(self, rect):
+        z = self._zoom
+        return pygame.Rect(rect.x * z, rect.y * z, rect.width * z, rect.height * z)
+
+    def queue(self, surface, pos):
+        """Põe uma superfície na lista de desenho (sai no próximo flush(), na ordem)."""
+        self._queue.append((surface, pos))
+
+    def queue_many(self, items):
+        self._queue.extend(items)
+
+    def _scaled_sprite(self, surface):
+        entry = self._scaled.get(id(surface))
+        if entry is None or entry[0] is not surface:
+            w, h = surface.get_size()
+            size = (max(1, round(w * self.render_scale)), max(1, round(h * self.render_scale)))
+            entry = self._scaled[id(surface)] = (surface, normalize_surface(self._resize(unkeyed(surface), size)))
+        return entry[1]
+
+    def flush(self, surface=None):
+        """Desenha a lista acumulada com um único blits e marca os retângulos como sujos.
+
+        Sem 'surface' vai para a janela (HUD); draw_game() manda o mundo para 'target'."""
+        queue = self._queue
+        if not queue:
+            return
+        surface = self.window if surface is None else surface
+        add = self._add_world if surface is self.target else self.add
+        for rect in surface.blits(queue):
+            add(rect)
+        self.blit_calls += 1
+        self.sprites += len(queue)
+        queue.clear()
+
+    def draw_walls(self):
+        """Redesenha as paredes por cima dos sprites (como no desenho original)."""
+        cx, cy = self._cam_pos
+        s = self.render_scale
+        for x, y, w, h in self.level.walls_between(self._map_x, self._map_x + self.screen_rect.width):
+            if s != 1:
+                x, y, w, h = round(x * s), round(y * s), round(w * s), round(h * s)
+            rect = pygame.Rect(x, y, w, h).move(-cx, -cy).clip(self.target_rect)
+            if rect.width and rect.height:
+                self._restore(rect)
+                self._add_world(rect)
+
+    def draw_game(self, game, view, alpha=1.0):
+        """Desenha orbes, inimigos, tiros, jogador e paredes de uma partida (simulacao.Game).
+
+        Só entra o que está perto da câmera; tudo vai para a lista de desenho e sai
+        num único blits, e cada sprite desenhado vira um dirty rect.
+        """
+        queue = self._queue
+        queue_world_sprites(queue, game, view, alpha)
+        if self.render_scale != 1:
+            s = self.render_scale
+            queue[:] = [(self._scaled_sprite(surf), (int(x * s), int(y * s))) for surf, (x, y) in queue]
+        self.flush(self.target)
+
+        # Paredes laterais por cima de tudo
+        self.draw_walls()
+        self.end_world()
+
+    def end_world(self):
+        """Amplia a superfície interna para a janela (nada a fazer com render_scale = 1)."""
+        if self.target is self.window:
+            return
+        if self._full:
+            self._upscale(self.target, self.screen_rect.size, self.window)
+            self.blit_calls += 1
+            return
+        for rect in self._stale:
+            if rect.width and rect.height:
+                dest = self._to_window(rect)
+                self._upscale(self.target.subsurface(rect), dest.size, self.window.subsurface(dest))
+                self.blit_calls += 1
+                self._refreshed.append(dest)  # vai para o display, mas não precisa ser apagado depois
+
+    def stats_line(self):
+        """Contadores do último frame (para o overlay do F3)."""
+        w, h = self.target_rect.size
+        return (f"desenho {w}x{h}: {self.last_blit_calls} chamadas de blit  {self.last_sprites} sprites em lote  "
+                f"{self.last_update_area // 1000}k px enviados")
+
+    def present(self):
+        self.flush()
+        self.last_blit_calls, self.last_sprites = self.blit_calls, self.sprites
+        if self._full:
+            pygame.display.update()
+            self.last_update_area = self.screen_rect.width * self.screen_rect.height
+        else:
+            rects = self._prev_dirty + self._dirty + self._refreshed
+            pygame.display.update(rects)
+            self.last_update_area = sum(r.width * r.height for r in rects)
+        self._prev_dirty = self._dirty
+        self._full = False
@@ -0,0 +1,594 @@
+import pygame
+import random
+import os
+
+from assets import get_animation, circle_stamp
+from config import GROUND_Y, MAP_WIDTH, MAP_HEIGHT, WALL_WIDTH
+
+# sprites das entidades: (caminho, frames da strip ou None para GIF), para pré-carregar
+SPRITE_FILES = (
+    (os.path.join("assets", "run.gif"), None),
+    (os.path.join("assets", "idle.gif"), None),
+    (os.path.join("assets", "jump.png"), 1),
+    (os.path.join("assets", "slime", "slime_walk_anim_strip_15.png"), 15),
+    (os.path.join("assets", "mushroom_walk_anim.gif"), None),
+)
+
+# ===== Valores padrão do jogador (Game(tuning=...) troca por partida) =====
+PLAYER_LIVES = 4
+PLAYER_JUMP = -18        # velocidade vertical do pulo (px/tick, negativa = para cima)
+INVULN_MS = 2000         # invulnerabilidade depois de tomar dano
+
+def save_previous(entity):
+    """Guarda a posição do tick anterior (usada na interpolação do desenho)."""
+    entity.prev_x, entity.prev_y = entity.rect.x, entity.rect.y
+
+def lerp_pos(entity, alpha):
+    """Posição de desenho interpolada entre o tick anterior e o atual."""
+    x = entity.prev_x + (entity.rect.x - entity.prev_x) * alpha
+    y = entity.prev_y + (entity.rect.y - entity.prev_y) * alpha
+    return x, y
+
+class CameraView:
+    """Posição da câmera usada apenas para desenhar (já interpolada)."""
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+# ===== Câmera =====
+class Camera:
+    def __init__(self, w, h, lerp=0.12, lookahead_x=140, map_width=MAP_WIDTH):
+        self.w, self.h = w, h
+        self.map_width = map_width
+        self.lerp = lerp
+        self.lookahead_x = lookahead_x
+        self.x, self.y = 0.0, 0.0
+        self._current_look_x = 0.0
+        self._look_smooth = 0.12
+        self.prev_x, self.prev_y = 0.0, 0.0
+
+    def save_previous(self):
+        self.prev_x, self.prev_y = self.x, self.y
+
+    def view(self, alpha):
+        return CameraView(self.prev_x + (self.x - self.prev_x) * alpha,
+                          self.prev_y + (self.y - self.prev_y) * alpha)
+
+    def _lerp(self, a, b, t):
+        return a + (b - a) * t
+
+    def update(self, player_rect, player_vx):
+        target_x = player_rect.centerx - self.w / 2
+        target_y = player_rect.centery - self.h / 2
+        look_target = (1 if player_vx > 0 else -1 if player_vx < 0 else 0) * self.lookahead_x
+        self._current_look_x = self._lerp(self._current_look_x, look_target, self._look_smooth)
+        target_x += self._current_look_x
+        self.x = self._lerp(self.x, target_x, self.lerp)
+        self.y = self._lerp(self.y, target_y, self.lerp)
+
+        # Clamp da câmera para não sair dos limites do mapa
+        if self.x < 0:
+            self.x = 0
+        if self.x > self.map_width - self.w:
+            self.x = self.map_width - self.w
+        if self.y < 0:
+            self.y = 0
+        if self.y > MAP_HEIGHT - self.h:
+            self.y = MAP_HEIGHT - self.h
+
+# ===== Jogador (com invulnerabilidade) =====
+class Player:
+    def __init__(self, x, y, map_width=MAP_WIDTH, jump=PLAYER_JUMP, invuln_duration=INVULN_MS):
+        self.map_width = map_width
+
+        self.rect = pygame.Rect(x, y, 50, 50)
+        self.prev_x, self.prev_y = self.rect.x, self.rect.y
+        self.color = (255, 0, 0)
+        self.vx = 0
+        self.vy = 0
+        self.speed = 5
+        self.jump = jump
+        self.on_ground = False
+        self.facing = 1
+        self.lives = PLAYER_LIVES  # 4 vidas conforme pedido
+
+        # Invulnerabilidade após tomar dano
+        self.invulnerable = False
+        self.invuln_start = 0            # tempo de simulação (ms) quando a invuln começou
+        self.invuln_duration = invuln_duration  # duração em ms (2 segundos no jogo)
+        self.blink_interval = 150        # ms para piscar enquanto invulnerável
+
+        # ===== Frames de corrida e idle (cache compartilhado em assets.py) =====
+        size = (self.rect.width, self.rect.height)
+        run_path = os.path.join("assets", "run.gif")
+        try:
+            self.run_frames_right = get_animation(run_path, size=size)
+            # frames invertidos (para andar à esquerda)
+            self.run_frames_left = get_animation(run_path, size=size, flip=True)
+        except Exception as e:
+            print(f"Erro carregando run.gif: {e}")
+            self.run_frames_right = ()
+            self.run_frames_left = ()
+
+        idle_path = os.path.join("assets", "idle.gif")
+        self.idle_frames_right = ()
+        self.idle_frames_left = ()
+        try:
+            self.idle_frames_right = get_animation(idle_path, size=size)
+            self.idle_frames_left = get_animation(idle_path, size=size, flip=True)
+        except Exception as e:
+            print(f"Aviso: não foi possível carregar idle.gif: {e}")
+            # fallback — será preenchido mais abaixo se necessário
+
+        self.frame_index = 0
+        self.animation_speed = 0.2
+        self.animation_timer = 0
+
+        # Se idle não foi carregado, usa um fallback a partir de run
+        if len(self.idle_frames_right) == 0 and len(self.run_frames_right) > 0:
+            self.idle_frames_right = (self.run_frames_right[0],)
+            self.idle_frames_left = (self.run_frames_left[0],)
+
+        # ===== Sprite de pulo (jump.png), no mesmo tamanho do rect =====
+        jump_path = os.path.join("assets", "jump.png")
+        self.jump_frame = None
+        try:
+            self.jump_frame = get_animation(jump_path, 1, size)[0]
+        except Exception as e:
+            # se falhar, apenas mantemos jump_frame = None (fallback será o comportamento anterior)
+            print(f"Aviso: não foi possível carregar jump.png: {e}")
+            self.jump_frame = None
+
+    def update(self, keys, platforms, walls, now):
+        self.vx = 0
+        if keys[pygame.K_LEFT]:
+            self.vx = -self.speed
+            self.facing = -1
+        if keys[pygame.K_RIGHT]:
+            self.vx = self.speed
+            self.facing = 1
+        self.rect.x += self.vx
+        if self.vx != 0:
+            self.animation_timer += self.animation_speed
+            if self.animation_timer >= 1:
+                self.animation_timer = 0
+                if len(self.run_frames_right) > 0:
+                    self.frame_index = (self.frame_index + 1) % len(self.run_frames_right)
+        else:
+            self.frame_index = 0
+
+
+        # Checagem de colisão simples com paredes laterais (impede atravessar)
+        for wall in walls:
+            if self.rect.colliderect(wall):
+                if self.vx > 0:  # movendo para a direita, colidiu na parede direita
+                    self.rect.right = wall.left
+                elif self.vx < 0:  # movendo para a esquerda
+                    self.rect.left = wall.right
+
+        # Gravidade
+        self.vy += 0.7
+        if self.vy > 20:
+            self.vy = 20
+        self.rect.y += self.vy
+        self.on_ground = False
+
+        # Colisão com plataformas (simples, por eixo Y)
+        for plat in platforms:
+            if self.vy > 0 and self.rect.colliderect(plat):
+                overlap_x = min(self.rect.right, plat.right) - max(self.rect.left, plat.left)
+                if overlap_x > 25 and self.rect.bottom <= plat.top + 20:
+                    self.rect.bottom = plat.top
+                    self.vy = 0
+                    self.on_ground = True
+
+        if self.rect.bottom >= GROUND_Y:
+            self.rect.bottom = GROUND_Y
+            self.vy = 0
+            self.on_ground = True
+
+        # Limites do mapa (colisão final com paredes)
+        MAP_LEFT_LIMIT = WALL_WIDTH
+        MAP_RIGHT_LIMIT = self.map_width - WALL_WIDTH
+
+        if self.rect.left < MAP_LEFT_LIMIT:
+            self.rect.left = MAP_LEFT_LIMIT
+        if self.rect.right > MAP_RIGHT_LIMIT:
+            self.rect.right = MAP_RIGHT_LIMIT
+
+        # Atualiza estado de invulnerabilidade
+        if self.invulnerable:
+            elapsed = now - self.invuln_start
+            if elapsed >= self.invuln_duration:
+                self.invulnerable = False
+
+    def reach_rect(self):
+        """Área que o jogador pode ocupar no próximo update (consulta ao índice espacial)."""
+        return self.rect.inflate(2 * (self.speed + 1), 2 * (max(-self.jump, 20) + 2))
+
+    def jump_action(self):
+        if self.on_ground:
+            self.vy = self.jump
+            self.on_ground = False
+
+    def take_damage(self, now):
+        """Aplica dano: decrementa vida e inicia invulnerabilidade (se já invulnerável, ignora)."""
+        if self.invulnerable:
+            return False  # não sofreu dano pois já invulnerável
+        self.lives -= 1
+        self.invulnerable = True
+        self.invuln_start = now
+        return True
+
+    def sprite(self, cam, now, alpha=1.0):
+        """(frame, posição na tela) a desenhar neste frame, ou None se piscou para invisível."""
+        # Blink: quando invulnerável, alterna visibilidade; quando invisível, não desenha nada.
+        if self.invulnerable:
+            elapsed = now - self.invuln_start
+            visible = (elapsed // self.blink_interval) % 2 == 0
+        else:
+            visible = True
+
+        if not visible:
+            return  # não desenha nada
+
+        x, y = lerp_pos(self, alpha)
+        pos = (int(x) - int(cam.x), int(y) - int(cam.y))
+
+        # Se estiver no ar, desenha o sprite de pulo (se disponível)
+        if not self.on_ground and self.jump_frame is not None:
+            # desenha o sprite de pulo no mesmo tamanho e posição do rect
+            frame = self.jump_frame
+            return frame, pos
+
+        # Escolhe sprite conforme estado do jogador
+        if not self.on_ground and self.jump_frame is not None:
+            # no ar → sprite de pulo
+            frame = self.jump_frame
+        elif self.vx != 0 and len(self.run_frames_right) > 0:
+            # andando → animação de corrida
+            frames = self.run_frames_right if self.facing == 1 else self.run_frames_left
+            frame = frames[self.frame_index % len(frames)]
+        elif len(self.idle_frames_right) > 0:
+            # parado no chão → idle animado
+            idle_frames = self.idle_frames_right if self.facing == 1 else self.idle_frames_left
+            frame = idle_frames[(pygame.time.get_ticks() // 150) % len(idle_frames)]
+        else:
+            # fallback
+            frame = self.run_frames_right[0] if len(self.run_frames_right) > 0 else pygame.Surface((self.rect.width, self.rect.height))
+
+        return frame, pos
+
+
+# ===== Classe do tiro =====
+BULLET_SIZE = 10
+BULLET_RADIUS = 5
+BULLET_POOL_CAPACITY = 64  # tiros simultâneos no mapa (um tiro cruza o mapa em ~210 ticks)
+
+class Bullet:
+    def __init__(self, x, y, direction, vy=0, map_width=MAP_WIDTH):
+        self.rect = pygame.Rect(x, y, BULLET_SIZE, BULLET_SIZE)
+        self.map_width = map_width
+        self.color = (255, 255, 0)
+        self.reset(x, y, direction, vy)
+
+    def reset(self, x, y, direction, vy=0):
+        """Reaproveita o objeto para um novo disparo (usado pelo pool)."""
+        self.rect.x, self.rect.y = x, y
+        self.prev_x, self.prev_y = x, y
+        self.speed = 12 * direction
+        self.vy = vy  # tiros espalhados sobem/descem um pouco
+        self.alive = True
+
+    def update(self):
+        self.rect.x += self.speed
+        self.rect.y += self.vy
+        # destruir se sair fora do mapa
+        if self.rect.right < 0 or self.rect.left > self.map_width:
+            self.alive = False
+        elif self.rect.bottom < 0 or self.rect.top > MAP_HEIGHT:
+            self.alive = False
+
+    def sprite(self, cam, alpha=1.0):
+        x, y = lerp_pos(self, alpha)
+        cx = int(x) + self.rect.width // 2 - int(cam.x)
+        cy = int(y) + self.rect.height // 2 - int(cam.y)
+        return circle_stamp(BULLET_RADIUS, self.color), (cx - BULLET_RADIUS, cy - BULLET_RADIUS)
+
+def pool_stats(capacity, in_use, peak, spawned, overflow):
+    return {"capacity": capacity, "in_use": in_use, "occupancy": in_use / capacity if capacity else 0.0,
+            "peak": peak, "spawned": spawned, "overflow": overflow}
+
+class BulletPool:
+    """Tiros pré-alocados com capacidade fixa.
+
+    Os slots mortos voltam para a lista de livres e são reaproveitados; se o pool
+    estiver cheio o disparo é descartado e conta como overflow.
+    """
+
+    def __init__(self, capacity=BULLET_POOL_CAPACITY, map_width=MAP_WIDTH):
+        self.capacity = capacity
+        self._slots = [Bullet(0, 0, 1, map_width=map_width) for _ in range(capacity)]
+        self.clear()
+
+    def clear(self):
+        for bullet in self._slots:
+            bullet.alive = False
+        self._free = list(reversed(self._slots))
+        self.active = []  # em ordem de disparo
+        self.peak = 0
+        self.spawned = 0
+        self.overflow = 0
+
+    def __iter__(self):
+        return iter(self.active)
+
+    def __len__(self):
+        return len(self.active)
+
+    def spawn(self, x, y, direction, vy=0):
+        if not self._free:
+            self.overflow += 1
+            return None
+        bullet = self._free.pop()
+        bullet.reset(x, y, direction, vy)
+        self.active.append(bullet)
+        self.spawned += 1
+        if len(self.active) > self.peak:
+            self.peak = len(self.active)
+        return bullet
+
+    def collect(self):
+        """Devolve ao pool os tiros mortos, compactando a lista ativa no lugar."""
+        active = self.active
+        write = 0
+        for bullet in active:
+            if bullet.alive:
+                active[write] = bullet
+                write += 1
+            else:
+                self._free.append(bullet)
+        del active[write:]
+
+    def stats(self):
+        return pool_stats(self.capacity, len(self.active), self.peak, self.spawned, self.overflow)
+
+# ===== Patrulha em tempo constante (inimigos que estavam dormindo) =====
+def patrol_position(x, direction, min_x, max_x, speed, ticks):
+    """(x, direção) depois de 'ticks' passos de patrulha entre min_x e max_x, sem simular um a um.
+
+    Mesma regra do update(): anda 'speed' por tick e, ao passar de um limite, fica
+    nele e inverte a direção.
+    """
+    if ticks <= 0:
+        return x, direction
+    if speed == 0:
+        # parado: o update() só corrige a direção se já estiver encostado num limite
+        if x <= min_x:
+            return min_x, 1
+        if x >= max_x:
+            return max_x, -1
+        return x, direction
+    to_wall = max_x - x if direction > 0 else x - min_x
+    first = max(1, -(-to_wall // speed))  # passo em que encosta na primeira parede
+    if ticks < first:
+        return x + speed * direction * ticks, direction
+    # daí em diante vai e volta; cada trecho entre as paredes leva 'half' passos
+    half = max(1, -(-(max_x - min_x) // speed))
+    trips, steps = divmod(ticks - first, half)
+    if (direction > 0) == (trips % 2 == 0):
+        return max_x - speed * steps, -1
+    return min_x + speed * steps, 1
+
+def advance_animation(entity, ticks, frame_count):
+    """Avança o timer/frame de animação de 'ticks' updates (mesma conta em float do update())."""
+    timer = entity.animation_timer
+    speed = entity.animation_speed
+    until_next = 0
+    while timer < 1:  # passos até o próximo frame, a partir do timer atual
+        timer += speed
+        until_next += 1
+    if ticks < until_next:
+        for _ in range(ticks):
+            entity.animation_timer += speed
+        return
+    per_frame, acc = 0, 0
+    while acc < 1:  # passos por frame a partir do timer zerado
+        acc += speed
+        per_frame += 1
+    frames, rest = divmod(ticks - until_next, per_frame)
+    entity.frame_index = (entity.frame_index + 1 + frames) % frame_count
+    timer = 0
+    for _ in range(rest):
+        timer += speed
+    entity.animation_timer = timer
+
+# ===== Inimigos (slimes) =====
+class Enemy:
+    def __init__(self, platform, speed=2, sprite_size=(45,45), rng=random, start_x=None, direction=None,
+                 map_width=MAP_WIDTH):
+        self.platform = platform
+        self.width, self.height = sprite_size
+
+        self.left_limit = platform.left + 4
+        self.right_limit = platform.right - self.width - 4
+        # posição e direção sorteadas, a não ser que o nível já tenha decidido
+        if start_x is None:
+            start_x = rng.randint(max(self.left_limit, WALL_WIDTH + 4), min(self.right_limit, map_width - WALL_WIDTH - 4))
+        self.rect = pygame.Rect(start_x, platform.top - self.height, self.width, self.height)
+        self.prev_x, self.prev_y = self.rect.x, self.rect.y
+
+        self.speed = speed
+        self.direction = rng.choice([-1, 1]) if direction is None else direction
+        self.alive = True
+        self.dying = False
+        self.dead_finished = False
+
+        # strip de walk em assets/slime/slime_walk_anim_strip_15.png (decodificada uma vez só)
+        walk_path = os.path.join("assets", "slime", "slime_walk_anim_strip_15.png")
+        try:
+            self.walk_right = get_animation(walk_path, 15, sprite_size)
+            self.walk_left = get_animation(walk_path, 15, sprite_size, flip=True)
+        except Exception as e:
+            print(f"Erro carregando {walk_path}: {e}")
+            # fallback: superfície simples
+            fallback = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            fallback.fill((0,180,0))
+            self.walk_right = [fallback]
+            self.walk_left = [pygame.transform.flip(fallback, True, False)]
+
+        # usa walk frames também como idle (simples)
+        self.idle_right = [self.walk_right[0]]
+        self.idle_left = [self.walk_left[0]]
+
+        # estado/frames
+        self.state = "walk"
+        self.frame_index = 0
+        self.animation_speed = 0.18
+        self.animation_timer = 0
+
+    def update(self):
+        if self.dead_finished:
+            return
+        # Movimento
+        if not self.dying:
+            self.rect.x += self.speed * self.direction
+            if self.rect.x <= self.left_limit:
+                self.rect.x = self.left_limit
+                self.direction = 1
+            elif self.rect.x >= self.right_limit:
+                self.rect.x = self.right_limit
+                self.direction = -1
+            self.rect.bottom = self.platform.top
+
+            # definir estado
+            self.state = "walk"
+        else:
+            self.rect.bottom = self.platform.top
+
+        # animação
+        self.animation_timer += self.animation_speed
+        if self.animation_timer >= 1:
+            self.animation_timer = 0
+            self.frame_index += 1
+            if self.state == "walk":
+                frames = self.walk_right if self.direction == 1 else self.walk_left
+                if self.frame_index >= len(frames):
+                    self.frame_index = 0
+            else:
+                self.frame_index = 0
+
+    def patrol_range(self):
+        """Limites da patrulha em rect.x."""
+        return self.left_limit, self.right_limit
+
+    def fast_forward(self, ticks):
+        """Aplica 'ticks' updates de uma vez, em tempo constante (inimigo que estava dormindo)."""
+        if ticks <= 0 or self.dead_finished:
+            return
+        min_x, max_x = self.patrol_range()
+        self.rect.x, self.direction = patrol_position(self.rect.x, self.direction, min_x, max_x, self.speed, ticks)
+        advance_animation(self, ticks, len(self.walk_right))
+        save_previous(self)
+
+    def start_death(self):
+        # aqui apenas marca como não-alive; não temos animação de death por enquanto
+        self.alive = False
+        self.dead_finished = True
+
+    def sprite(self, cam, alpha=1.0):
+        if self.dead_finished:
+            return None
+        if self.state == "walk":
+            frames = self.walk_right if self.direction == 1 else self.walk_left
+        else:
+            frames = self.idle_right if self.direction == 1 else self.idle_left
+        idx = self.frame_index % len(frames)
+        frame = frames[idx]
+        x, y = lerp_pos(self, alpha)
+        return frame, (int(x) - int(cam.x), int(y) - int(cam.y))
+
+# ===== Novos inimigos: GroundEnemy (mushroom GIF) =====
+class GroundEnemy:
+    def __init__(self, x_center, ground_y, speed=2, sprite_size=(45,45), rng=random, direction=None,
+                 map_width=MAP_WIDTH, patrol=None):
+        self.width, self.height = sprite_size
+        # posiciona no chão com center x fornecido
+        self.rect = pygame.Rect(0, 0, self.width, self.height)
+        self.rect.centerx = x_center
+        self.rect.bottom = ground_y
+        self.prev_x, self.prev_y = self.rect.x, self.rect.y
+
+        # limites de patrulha no chão (mantém dentro das paredes, ou no trecho que o nível pedir)
+        if patrol is None:
+            patrol = (WALL_WIDTH + 10, map_width - WALL_WIDTH - 10)
+        self.left_limit, self.right_limit = patrol
+
+        self.speed = speed
+        self.direction = rng.choice([-1, 1]) if direction is None else direction
+        self.alive = True
+        self.dead_finished = False
+
+        # Frames do GIF mushroom_walk_anim.gif (decodificado uma vez só)
+        try:
+            mpath = os.path.join("assets", "mushroom_walk_anim.gif")
+            self.walk_right = get_animation(mpath, size=sprite_size)
+            self.walk_left = get_animation(mpath, size=sprite_size, flip=True)
+            if len(self.walk_right) == 0:
+                empty = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+                self.walk_right = [empty]
+                self.walk_left = [empty]
+        except Exception as e:
+            print(f"Erro carregando mushroom GIF: {e}")
+            fallback = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+            fallback.fill((120,80,0))
+            self.walk_right = [fallback]
+            self.walk_left = [pygame.transform.flip(fallback, True, False)]
+
+        self.frame_index = 0
+        self.animation_speed = 0.18
+        self.animation_timer = 0
+
+    def update(self):
+        if self.dead_finished:
+            return
+        # Move horizontalmente apenas no chão entre left_limit e right_limit
+        self.rect.x += self.speed * self.direction
+        if self.rect.left <= self.left_limit:
+            self.rect.left = self.left_limit
+            self.direction = 1
+        elif self.rect.right >= self.right_limit:
+            self.rect.right = self.right_limit
+            self.direction = -1
+
+        self.rect.bottom = GROUND_Y  # garante que fica no chão
+
+        # animação
+        self.animation_timer += self.animation_speed
+        if self.animation_timer >= 1:
+            self.animation_timer = 0
+            self.frame_index = (self.frame_index + 1) % len(self.walk_right)
+
+    def patrol_range(self):
+        """Limites da patrulha em rect.x (right_limit vale para a borda direita do rect)."""
+        return self.left_limit, self.right_limit - self.width
+
+    def fast_forward(self, ticks):
+        """Aplica 'ticks' updates de uma vez, em tempo constante (inimigo que estava dormindo)."""
+        if ticks <= 0 or self.dead_finished:
+            return
+        min_x, max_x = self.patrol_range()
+        self.rect.x, self.direction = patrol_position(self.rect.x, self.direction, min_x, max_x, self.speed, ticks)
+        advance_animation(self, ticks, len(self.walk_right))
+        save_previous(self)
+
+    def start_death(self):
+        self.alive = False
+        self.dead_finished = True
+
+    def sprite(self, cam, alpha=1.0):
+        if self.dead_finished:
+            return None
+        frames = self.walk_right if self.direction == 1 else self.walk_left
+        frame = frames[self.frame_index % len(frames)]
+        x, y = lerp_pos(self, alpha)
+        return frame, (int(x) - int(cam.x), int(y) - int(cam.y))
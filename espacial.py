@@ -0,0 +1,108 @@
+import pygame
+
+from config import MAP_WIDTH, MAP_HEIGHT
+
+# ===== Índice espacial (broad-phase de colisão) =====
+# Grade uniforme sobre o mapa: cada objeto é registrado em todas as células que o seu
+# rect toca. Uma consulta só olha as células da área pedida, então o custo depende de
+# quantos objetos há por perto, e não do total de objetos do mapa.
+CELL_SIZE = 256
+
+class SpatialHash:
+    def __init__(self, width=MAP_WIDTH, height=MAP_HEIGHT, cell_size=CELL_SIZE):
+        self.cell_size = cell_size
+        self.cols = max(1, -(-width // cell_size))
+        self.rows = max(1, -(-height // cell_size))
+        # células em lista plana (col * rows + row), cada uma {id(obj): entrada}
+        self.cells = [{} for _ in range(self.cols * self.rows)]
+        self.entries = {}   # id(obj) -> [obj, rect, faixa de células, ordem de inserção]
+        self._seq = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, obj):
+        return id(obj) in self.entries
+
+    def _cell_range(self, rect):
+        # objetos fora do mapa ficam nas células da borda
+        cs = self.cell_size
+        last_col = self.cols - 1
+        last_row = self.rows - 1
+        c0 = rect.left // cs
+        c1 = (rect.right - 1) // cs
+        r0 = rect.top // cs
+        r1 = (rect.bottom - 1) // cs
+        c0 = 0 if c0 < 0 else last_col if c0 > last_col else c0
+        c1 = 0 if c1 < 0 else last_col if c1 > last_col else c1
+        r0 = 0 if r0 < 0 else last_row if r0 > last_row else r0
+        r1 = 0 if r1 < 0 else last_row if r1 > last_row else r1
+        return (c0, r0, c1, r1)
+
+    def _cells_in(self, cell_range):
+        c0, r0, c1, r1 = cell_range
+        rows = self.rows
+        cells = self.cells
+        for col in range(c0, c1 + 1):
+            base = col * rows
+            for row in range(r0, r1 + 1):
+                yield cells[base + row]
+
+    def insert(self, obj, rect=None):
+        """Registra 'obj'. Se 'rect' não for dado, usa obj.rect (entidades); Rects puros passam a si mesmos."""
+        if rect is None:
+            rect = obj.rect
+        key = id(obj)
+        if key in self.entries:
+            self.remove(obj)
+        cell_range = self._cell_range(rect)
+        self._seq += 1
+        entry = [obj, rect, cell_range, self._seq]
+        self.entries[key] = entry
+        for cell in self._cells_in(cell_range):
+            cell[key] = entry
+
+    def remove(self, obj):
+        key = id(obj)
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            for cell in self._cells_in(entry[2]):
+                cell.pop(key, None)
+
+    def move(self, obj):
+        """Atualiza as células de 'obj' depois que o rect dele mudou (só mexe na grade se trocou de célula)."""
+        key = id(obj)
+        entry = self.entries.get(key)
+        if entry is None:
+            return
+        cell_range = self._cell_range(entry[1])
+        if cell_range != entry[2]:
+            for cell in self._cells_in(entry[2]):
+                cell.pop(key, None)
+            entry[2] = cell_range
+            for cell in self._cells_in(cell_range):
+                cell[key] = entry
+
+    def query(self, rect):
+        """Objetos cujo rect colide com 'rect', na ordem em que foram inseridos (determinístico)."""
+        c0, r0, c1, r1 = self._cell_range(rect)
+        cells = self.cells
+        rows = self.rows
+        collides = rect.colliderect
+        found = {}
+        for col in range(c0, c1 + 1):
+            base = col * rows
+            for index in range(base + r0, base + r1 + 1):
+                cell = cells[index]
+                if not cell:
+                    continue
+                for key, entry in cell.items():
+                    if key not in found and collides(entry[1]):
+                        found[key] = entry
+        if len(found) > 1:
+            return [entry[0] for entry in sorted(found.values(), key=lambda e: e[3])]
+        return [entry[0] for entry in found.values()]
+
+def span_rect(left, right, height=MAP_HEIGHT):
+    """Faixa do mapa entre as colunas left e right (inclusive), na altura toda."""
+    return pygame.Rect(left - 1, 0, right - left + 2, height)
@@ -0,0 +1,165 @@
+"""Modo headless: roda partidas sem janela e sem som, na velocidade máxima da CPU.
+
+Usa a mesma simulação do jogo (simulacao.Game) alimentada por um roteiro de entrada,
+para balanceamento e testes de regressão em máquinas sem monitor.
+
+Exemplos:
+    python headless.py --runs 500 --seed 1
+    python headless.py --script roteiro.txt --max-ticks 20000 --json resultados.json
+
+Formato do roteiro (uma linha por passo, '#' comenta):
+    <ticks> <teclas>      ex.: "40 RIGHT+JUMP", "15 LEFT+SHOOT", "30 -"
+Esquerda/direita ficam seguradas durante o passo; JUMP e SHOOT são toques
+aplicados só no primeiro tick do passo. O roteiro se repete até a partida acabar.
+"""
+import os
+
+# precisa ser definido antes do pygame criar qualquer janela
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import json
+import time
+
+import pygame
+
+from config import TICK_RATE
+from mundo import DEFAULT_LEVEL, load_level
+from simulacao import Game, INPUT_NAMES, INPUT_JUMP, INPUT_SHOOT, WEAPONS
+
+# ===== Roteiro padrão: passeia pelo mapa pulando e atirando =====
+DEFAULT_SCRIPT = """
+40 RIGHT+SHOOT
+20 RIGHT+JUMP
+30 RIGHT+SHOOT
+25 RIGHT+JUMP
+40 RIGHT
+20 LEFT+JUMP
+30 RIGHT+JUMP+SHOOT
+60 RIGHT
+25 RIGHT+JUMP
+15 -
+"""
+
+def parse_script(text):
+    """Converte o texto do roteiro em uma lista de (ticks, bitmask)."""
+    steps = []
+    for line_no, line in enumerate(text.splitlines(), 1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        parts = line.split()
+        try:
+            ticks = int(parts[0])
+        except ValueError:
+            raise ValueError(f"linha {line_no}: número de ticks inválido: {parts[0]!r}")
+        mask = 0
+        keys = parts[1] if len(parts) > 1 else "-"
+        if keys != "-":
+            for name in keys.upper().split("+"):
+                if name not in INPUT_NAMES:
+                    raise ValueError(f"linha {line_no}: tecla desconhecida: {name!r}")
+                mask |= INPUT_NAMES[name]
+        if ticks > 0:
+            steps.append((ticks, mask))
+    if not steps:
+        raise ValueError("roteiro vazio")
+    return steps
+
+def load_script(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return parse_script(f.read())
+
+class ScriptedInput:
+    """Gera a bitmask de cada tick a partir de um roteiro de (ticks, bitmask), repetindo em loop."""
+
+    TAPS = INPUT_JUMP | INPUT_SHOOT
+
+    def __init__(self, steps):
+        self.steps = steps
+        self.step = 0
+        self.tick_in_step = 0
+
+    def next(self):
+        ticks, mask = self.steps[self.step]
+        if self.tick_in_step > 0:
+            mask &= ~self.TAPS  # toque vale só no primeiro tick do passo
+        self.tick_in_step += 1
+        if self.tick_in_step >= ticks:
+            self.tick_in_step = 0
+            self.step = (self.step + 1) % len(self.steps)
+        return mask
+
+def init_headless():
+    """Inicializa só o vídeo (driver dummy): convert_alpha() precisa de um modo de vídeo."""
+    pygame.display.init()
+    if pygame.display.get_surface() is None:
+        pygame.display.set_mode((1, 1))
+
+def run_game(seed, inputs, max_ticks, vectorized=False, weapon="simples", level=None, tuning=None):
+    """Joga uma partida inteira e devolve um resumo dela."""
+    game = Game(seed, vectorized=vectorized, weapon=weapon, level=level, tuning=tuning)
+    while not game.finished and game.ticks < max_ticks:
+        game.tick(inputs.next())
+    return {
+        "seed": seed,
+        "resultado": game.outcome,
+        "ticks": game.ticks,
+        "time_ms": game.time_elapsed_ms,
+        "orbes": game.collected_orbs,
+        "inimigos_derrotados": game.enemies_defeated,
+        "vidas": game.player.lives,
+        "tiros": game.bullet_stats(),
+    }
+
+def summarize(results, elapsed_s):
+    total = len(results)
+    count = lambda outcome: sum(1 for r in results if r["resultado"] == outcome)
+    ticks = sum(r["ticks"] for r in results)
+    return {
+        "partidas": total,
+        "vitorias": count("vitoria"),
+        "derrotas": count("derrota"),
+        "tempo_esgotado": count("tempo_esgotado"),
+        "media_orbes": sum(r["orbes"] for r in results) / total if total else 0,
+        "media_ticks": ticks / total if total else 0,
+        "pico_tiros": max((r["tiros"]["peak"] for r in results), default=0),
+        "overflow_tiros": sum(r["tiros"]["overflow"] for r in results),
+        "segundos": round(elapsed_s, 3),
+        "partidas_por_minuto": round(total / elapsed_s * 60, 1) if elapsed_s > 0 else None,
+        "ticks_por_segundo": round(ticks / elapsed_s) if elapsed_s > 0 else None,
+    }
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Roda partidas de Forest Jump sem janela.")
+    parser.add_argument("--runs", type=int, default=100, help="quantidade de partidas")
+    parser.add_argument("--seed", type=int, default=0, help="semente da primeira partida (as outras usam seed+1, seed+2...)")
+    parser.add_argument("--script", help="arquivo de roteiro de entrada (padrão: roteiro embutido)")
+    parser.add_argument("--max-ticks", type=int, default=TICK_RATE * 300, help="limite de ticks por partida")
+    parser.add_argument("--json", help="salva os resultados de cada partida neste arquivo")
+    parser.add_argument("--vetorizado", action="store_true", help="usa inimigos/tiros em arrays NumPy")
+    parser.add_argument("--arma", choices=sorted(WEAPONS), default="simples", help="tipo de disparo")
+    parser.add_argument("--nivel", default=DEFAULT_LEVEL, help="arquivo do nível (padrão: %(default)s)")
+    args = parser.parse_args(argv)
+
+    steps = load_script(args.script) if args.script else parse_script(DEFAULT_SCRIPT)
+    init_headless()
+    level = load_level(args.nivel)
+
+    results = []
+    start = time.perf_counter()
+    for i in range(args.runs):
+        results.append(run_game(args.seed + i, ScriptedInput(steps), args.max_ticks, args.vetorizado, args.arma,
+                                level))
+    summary = summarize(results, time.perf_counter() - start)
+
+    for key, value in summary.items():
+        print(f"{key}: {value}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"resumo": summary, "partidas": results}, f, ensure_ascii=False, indent=2)
+    return summary
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""Lotes de partidas sem janela em vários processos, para balanceamento.
+
+Cada combinação de ajustes (simulacao.DEFAULT_TUNING: velocidade dos inimigos, pulo e
+invulnerabilidade) é jogada com as mesmas sementes e o mesmo roteiro do headless.py.
+As partidas são divididas em tarefas e distribuídas por um ProcessPoolExecutor: cada
+processo tem o próprio pygame e cada partida é um simulacao.Game independente, então
+o resultado não depende de quantos processos rodam nem da ordem em que as tarefas
+terminam. O resumo de cada combinação (tempos de conclusão, mortes, orbes) vai para
+um arquivo JSON.
+
+Exemplos:
+    python lote.py --partidas 200 --velocidade-inimigo 1,2,3 --pulo=-16,-18,-20
+    python lote.py --partidas 500 --invulnerabilidade 1000,2000,3000 --processos 4 --saida lote.json
+"""
+import argparse
+import itertools
+import json
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from config import TICK_RATE
+from entidades import PLAYER_LIVES
+from headless import DEFAULT_SCRIPT, ScriptedInput, init_headless, parse_script, run_game
+from mundo import DEFAULT_LEVEL, load_level
+from simulacao import DEFAULT_TUNING, WEAPONS
+
+SUMMARY_FILE = "lote_resumo.json"
+GAMES_PER_TASK = 20  # partidas por tarefa: menos ida e volta entre processos
+
+# opção da linha de comando -> ajuste do Game
+SWEEP_OPTIONS = {
+    "velocidade_inimigo": "enemy_speed",
+    "pulo": "jump",
+    "invulnerabilidade": "invuln_ms",
+}
+
+# ===== Trabalho de cada processo =====
+def run_task(task):
+    """Joga as partidas de uma tarefa; roda dentro de um processo do pool."""
+    index, tuning, seeds, settings = task
+    steps = parse_script(settings["script"])
+    level = load_level(settings["nivel"])
+    results = [run_game(seed, ScriptedInput(steps), settings["max_ticks"], settings["vetorizado"],
+                        settings["arma"], level, tuning) for seed in seeds]
+    return index, results
+
+def make_tasks(tunings, seeds, settings, per_task=GAMES_PER_TASK):
+    tasks = []
+    for index, tuning in enumerate(tunings):
+        for start in range(0, len(seeds), per_task):
+            tasks.append((index, tuning, seeds[start:start + per_task], settings))
+    return tasks
+
+def run_batch(tunings, seeds, settings, processes=None, per_task=GAMES_PER_TASK):
+    """Joga cada ajuste em 'tunings' com todas as 'seeds'; devolve uma lista de resultados por ajuste."""
+    results = [[] for _ in tunings]
+    tasks = make_tasks(tunings, seeds, settings, per_task)
+    with ProcessPoolExecutor(max_workers=processes, initializer=init_headless) as pool:
+        futures = [pool.submit(run_task, task) for task in tasks]
+        for done, future in enumerate(as_completed(futures), 1):
+            index, partial = future.result()
+            results[index].extend(partial)
+            print(f"\r{done}/{len(tasks)} tarefas", end="", flush=True)
+    print()
+    for partial in results:
+        partial.sort(key=lambda r: r["seed"])  # a ordem de chegada das tarefas não importa
+    return results
+
+# ===== Resumo =====
+def summarize_tuning(results):
+    """Tempos de conclusão, mortes e orbes de um ajuste."""
+    total = len(results)
+    wins = [r["time_ms"] for r in results if r["resultado"] == "vitoria"]
+    count = lambda outcome: sum(1 for r in results if r["resultado"] == outcome)
+    mean = lambda values: round(statistics.fmean(values), 2) if values else None
+    return {
+        "partidas": total,
+        "vitorias": len(wins),
+        "derrotas": count("derrota"),
+        "tempo_esgotado": count("tempo_esgotado"),
+        "taxa_vitoria": round(len(wins) / total, 3) if total else None,
+        "tempo_medio_vitoria_ms": mean(wins),
+        "tempo_mediano_vitoria_ms": statistics.median(wins) if wins else None,
+        "melhor_tempo_ms": min(wins, default=None),
+        "media_vidas_perdidas": mean([PLAYER_LIVES - r["vidas"] for r in results]),
+        "media_orbes": mean([r["orbes"] for r in results]),
+        "media_inimigos_derrotados": mean([r["inimigos_derrotados"] for r in results]),
+        "media_ticks": mean([r["ticks"] for r in results]),
+    }
+
+def sweep(args):
+    """Todas as combinações pedidas na linha de comando (o que não foi pedido fica no padrão)."""
+    axes = []
+    for option, key in SWEEP_OPTIONS.items():
+        values = getattr(args, option) or [DEFAULT_TUNING[key]]
+        axes.append([(key, value) for value in values])
+    return [dict(combo) for combo in itertools.product(*axes)]
+
+def int_list(text):
+    try:
+        return [int(value) for value in text.split(",") if value.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"lista de inteiros inválida: {text!r}")
+
+def speed_list(text):
+    speeds = int_list(text)
+    if any(speed < 0 for speed in speeds):
+        raise argparse.ArgumentTypeError(f"velocidade negativa em {text!r} (use 0 para inimigos parados)")
+    return speeds
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Roda lotes de partidas de Forest Jump em paralelo.")
+    parser.add_argument("--partidas", type=int, default=100, help="partidas por combinação de ajustes")
+    parser.add_argument("--seed", type=int, default=0, help="semente da primeira partida (as outras usam seed+1...)")
+    parser.add_argument("--velocidade-inimigo", type=speed_list, help="velocidades da patrulha (0 = parados), ex.: 0,1,2,3")
+    parser.add_argument("--pulo", type=int_list, help="velocidades do pulo, ex.: --pulo=-16,-18,-20")
+    parser.add_argument("--invulnerabilidade", type=int_list, help="invulnerabilidade em ms, ex.: 1000,2000")
+    parser.add_argument("--processos", type=int, help="processos no pool (padrão: um por núcleo)")
+    parser.add_argument("--script", help="arquivo de roteiro de entrada (padrão: roteiro do headless.py)")
+    parser.add_argument("--max-ticks", type=int, default=TICK_RATE * 300, help="limite de ticks por partida")
+    parser.add_argument("--vetorizado", action="store_true", help="usa inimigos/tiros em arrays NumPy")
+    parser.add_argument("--arma", choices=sorted(WEAPONS), default="simples", help="tipo de disparo")
+    parser.add_argument("--nivel", default=DEFAULT_LEVEL, help="arquivo do nível (padrão: %(default)s)")
+    parser.add_argument("--saida", default=SUMMARY_FILE, help="arquivo JSON do resumo (padrão: %(default)s)")
+    args = parser.parse_args(argv)
+
+    if args.script:
+        with open(args.script, "r", encoding="utf-8") as f:
+            script = f.read()
+    else:
+        script = DEFAULT_SCRIPT
+    parse_script(script)  # erro no roteiro aparece aqui, não dentro dos processos
+    settings = {"script": script, "max_ticks": args.max_ticks, "vetorizado": args.vetorizado,
+                "arma": args.arma, "nivel": args.nivel}
+    tunings = sweep(args)
+    seeds = list(range(args.seed, args.seed + args.partidas))
+    processes = args.processos or os.cpu_count()
+
+    print(f"{len(tunings)} combinação(ões) x {len(seeds)} partidas em {processes} processo(s)")
+    start = time.perf_counter()
+    results = run_batch(tunings, seeds, settings, processes)
+    elapsed = time.perf_counter() - start
+
+    combos = [{"ajustes": tuning, "resumo": summarize_tuning(partial)} for tuning, partial in zip(tunings, results)]
+    for combo in combos:
+        t, s = combo["ajustes"], combo["resumo"]
+        best = s["melhor_tempo_ms"]
+        print(f"  inimigo {t['enemy_speed']:>2}  pulo {t['jump']:>4}  invuln {t['invuln_ms']:>5} ms  |  "
+              f"vitórias {s['vitorias']:>4}/{s['partidas']:<4} melhor {best if best is not None else '-':>6}  "
+              f"vidas perdidas {s['media_vidas_perdidas']:>5}  orbes {s['media_orbes']:>5}")
+    games = len(tunings) * len(seeds)
+    print(f"{games} partidas em {elapsed:.1f} s ({games / elapsed * 60:.0f} partidas/min)" if elapsed > 0 else "")
+
+    summary = {
+        "parametros": {"partidas": args.partidas, "seed": args.seed, "max_ticks": args.max_ticks,
+                       "nivel": args.nivel, "arma": args.arma, "vetorizado": args.vetorizado,
+                       "roteiro": args.script or "embutido", "processos": processes},
+        "segundos": round(elapsed, 3),
+        "combinacoes": combos,
+    }
+    with open(args.saida, "w", encoding="utf-8") as f:
+        json.dump(summary, f, ensure_ascii=False, indent=2)
+    print(f"Resumo salvo em {args.saida}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,378 @@
+"""Níveis: formato em arquivo e carregamento em chunks ao redor da câmera.
+
+Um nível é um JSON em niveis/ (o jogo usa niveis/fase1.json):
+    formato               versão do formato (LEVEL_FORMAT)
+    largura               largura do mapa em px
+    chunk                 largura de cada chunk em px
+    jogador               [x, y] inicial do jogador
+    paredes               [[x, y, w, h], ...]
+    plataformas           [[x, y, w, h], ...]
+    orbes                 [[x, y], ...] (centro de cada orbe)
+    inimigos              [["slime", índice da plataforma], ["cogumelo", x], ["cogumelo", x, esq, dir], ...]
+    cogumelos_aleatorios  {"quantidade": n, "distancia_minima": px, "de": x, "ate": x,
+                          "patrulha": [esq, dir]} ou uma lista dessas áreas (posições sorteadas
+                          com a seed da partida; de/ate/patrulha opcionais, o padrão é o mapa todo)
+
+O mapa é dividido em chunks de largura fixa e cada objeto pertence ao chunk da sua
+borda esquerda. Durante a partida só os chunks perto da câmera ficam carregados
+(LevelStream): as plataformas, paredes e orbes deles estão nos índices espaciais.
+Os inimigos longe da câmera dormem num índice por trecho de patrulha e, ao acordar,
+pulam direto para onde a patrulha os teria levado. Assim um mapa de dezenas de telas
+custa por tick o mesmo que um de duas.
+"""
+import json
+import os
+import zlib
+
+import pygame
+
+from config import WIDTH, GROUND_Y, WALL_WIDTH, MAP_HEIGHT
+from entidades import Enemy, GroundEnemy, patrol_position
+from espacial import SpatialHash, span_rect
+
+LEVELS_DIR = "niveis"
+DEFAULT_LEVEL = os.path.join(LEVELS_DIR, "fase1.json")
+LEVEL_FORMAT = 1
+
+ORB_RADIUS = 10
+ENEMY_SIZE = (45, 45)
+ENEMY_SPEED = 2
+
+# px carregados além de cada lado da tela; precisa cobrir a folga de SLEEP_MARGIN
+STREAM_MARGIN = 640
+# região ativa: a tela mais ACTIVE_MARGIN px de cada lado. Quem dorme acorda ao entrar nela;
+# quem está acordado só dorme depois de SLEEP_MARGIN px (folga para não ficar indo e
+# voltando na borda). Acordar/dormir é conferido a cada REGION_CHECK_TICKS ticks: nesse
+# intervalo um inimigo anda poucos px, bem longe da borda da tela.
+ACTIVE_MARGIN = 200
+SLEEP_MARGIN = 264
+REGION_CHECK_TICKS = 4
+
+# ===== Nível (dados do arquivo, agrupados por chunk) =====
+class Level:
+    """Um nível já lido. Guarda só tuplas; os Rects e inimigos são criados pelo LevelStream."""
+
+    def __init__(self, data, path=None):
+        if data.get("formato") != LEVEL_FORMAT:
+            raise ValueError(f"formato de nível desconhecido: {data.get('formato')!r}")
+        self.path = path
+        self.name = data.get("nome", "")
+        # identifica o conteúdo do nível (replays só rodam no mesmo mapa em que foram gravados)
+        self.fingerprint = zlib.crc32(json.dumps(data, sort_keys=True).encode("utf-8"))
+        self.width = int(data["largura"])
+        self.chunk_width = int(data.get("chunk", WIDTH // 2))
+        self.chunk_count = max(1, -(-self.width // self.chunk_width))
+        self.player_start = tuple(data["jogador"])
+
+        platforms = [tuple(p) for p in data["plataformas"]]
+        walls = [tuple(w) for w in data["paredes"]]
+        orbs = [(x - ORB_RADIUS, y - ORB_RADIUS, ORB_RADIUS * 2, ORB_RADIUS * 2) for x, y in data["orbes"]]
+        self.total_orbs = len(orbs)
+        self._platforms = self._bucket(platforms)
+        self._walls = self._bucket(walls)
+        self._orbs = self._bucket(orbs)  # (chave = posição no arquivo, rect)
+        # quantos chunks à direita do dono um objeto pode invadir
+        cw = self.chunk_width
+        self.reach = max(((x + w - 1) // cw - x // cw for x, _, w, _ in platforms + walls + orbs), default=0)
+
+        self.spawns = []
+        for spawn in data.get("inimigos", ()):
+            kind = spawn[0]
+            if kind == "slime":
+                self.spawns.append(("slime", platforms[spawn[1]]))
+            elif kind == "cogumelo":
+                self.spawns.append(("cogumelo", int(spawn[1]), tuple(spawn[2:4]) or None))
+            else:
+                raise ValueError(f"inimigo desconhecido no nível: {kind!r}")
+        areas = data.get("cogumelos_aleatorios") or []
+        self.random_ground = [areas] if isinstance(areas, dict) else list(areas)
+
+    def _bucket(self, rects):
+        chunks = [[] for _ in range(self.chunk_count)]
+        for key, rect in enumerate(rects):
+            chunks[self.chunk_of(rect[0])].append((key, rect))
+        return chunks
+
+    def chunk_of(self, x):
+        return min(max(int(x) // self.chunk_width, 0), self.chunk_count - 1)
+
+    def chunks_between(self, left, right):
+        """Chunks cujos objetos podem tocar as colunas left..right do mapa."""
+        first = max(0, left // self.chunk_width - self.reach)
+        last = min(self.chunk_count - 1, right // self.chunk_width)
+        return range(first, last + 1)
+
+    def platforms(self, chunk):
+        return self._platforms[chunk]
+
+    def walls(self, chunk):
+        return self._walls[chunk]
+
+    def orbs(self, chunk):
+        return self._orbs[chunk]
+
+    def _rects_between(self, buckets, left, right):
+        for chunk in self.chunks_between(left, right):
+            for _, (x, y, w, h) in buckets[chunk]:
+                if x < right and x + w > left:
+                    yield (x, y, w, h)
+
+    def platforms_between(self, left, right):
+        return self._rects_between(self._platforms, left, right)
+
+    def walls_between(self, left, right):
+        return self._rects_between(self._walls, left, right)
+
+    def roll_spawns(self, rng):
+        """Sorteia o que é aleatório nos inimigos; devolve um registro por inimigo, na ordem do nível.
+
+        Os sorteios seguem a ordem da criação antiga dos inimigos (slimes, depois
+        cogumelos), então uma seed continua gerando a mesma partida.
+        """
+        ew = ENEMY_SIZE[0]
+        rolled = []
+        for kind, arg, *_ in self.spawns:
+            if kind != "slime":
+                continue
+            x, _, w, _ = arg
+            # o Enemy sorteava posição e direção e os dois eram sobrescritos (o slime
+            # começa no centro da plataforma); os sorteios ficam para manter as seeds
+            rng.randint(max(x + 4, WALL_WIDTH + 4), min(x + w - ew - 4, self.width - WALL_WIDTH - 4))
+            rng.choice([-1, 1])
+            centerx = x + w // 2
+            rolled.append(("slime", arg, centerx - ew // 2, 1 if centerx % 2 == 0 else -1))
+
+        ground = [(spawn[1], spawn[2]) for spawn in self.spawns if spawn[0] == "cogumelo"]
+        for area in self.random_ground:
+            patrol = tuple(area["patrulha"]) if "patrulha" in area else None
+            ground += [(x, patrol) for x in self._roll_ground_positions(rng, area)]
+        for x, patrol in ground:
+            rolled.append(("cogumelo", x, rng.choice([-1, 1]), patrol))
+        return rolled
+
+    def _roll_ground_positions(self, rng, area):
+        count = area["quantidade"]
+        min_dist = area.get("distancia_minima", 300)
+        min_x = area.get("de", WALL_WIDTH + 50)
+        max_x = area.get("ate", self.width - WALL_WIDTH - 50)
+        positions = []
+        attempts = 0
+        while len(positions) < count and attempts < 2000:
+            attempts += 1
+            x = rng.randint(min_x, max_x)
+            if all(abs(x - px) >= min_dist for px in positions):
+                positions.append(x)
+        return positions
+
+def spawn_enemy(record, map_width, speed=ENEMY_SPEED):
+    """Instancia um inimigo a partir de um registro de Level.roll_spawns()."""
+    if record[0] == "slime":
+        _, platform, x, direction = record
+        return Enemy(pygame.Rect(platform), speed, ENEMY_SIZE, start_x=x, direction=direction,
+                     map_width=map_width)
+    _, x, direction, patrol = record
+    return GroundEnemy(x, GROUND_Y, speed, ENEMY_SIZE, direction=direction, map_width=map_width,
+                       patrol=patrol)
+
+def spawn_all(level, rng, speed=ENEMY_SPEED):
+    """Todos os inimigos do nível de uma vez (cenários de carga do benchmark)."""
+    return [spawn_enemy(record, level.width, speed) for record in level.roll_spawns(rng)]
+
+# ===== Leitura =====
+_levels = {}
+
+def read_level_data(path=DEFAULT_LEVEL):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def load_level(path=DEFAULT_LEVEL):
+    """Lê (uma vez por processo) o nível em 'path'."""
+    level = _levels.get(path)
+    if level is None:
+        level = _levels[path] = Level(read_level_data(path), path)
+    return level
+
+def widen_level(data, copies):
+    """Repete o nível 'copies' vezes lado a lado, com uma parede em cada ponta do mapa novo.
+
+    Gera mapas longos para o benchmark e para testar o carregamento em chunks.
+    """
+    width = data["largura"]
+    areas = data.get("cogumelos_aleatorios") or []
+    areas = [areas] if isinstance(areas, dict) else areas
+    platforms, orbs, enemies, ground_areas = [], [], [], []
+    for i in range(copies):
+        dx = i * width
+        base = len(platforms)
+        platforms += [[x + dx, y, w, h] for x, y, w, h in data["plataformas"]]
+        orbs += [[x + dx, y] for x, y in data["orbes"]]
+        for kind, *args in data.get("inimigos", ()):
+            if kind == "slime":
+                enemies.append([kind, args[0] + base])
+            else:
+                enemies.append([kind] + [v + dx for v in args])
+        # cada cópia sorteia os seus cogumelos no próprio trecho, com a mesma densidade,
+        # e eles patrulham só esse trecho
+        for area in areas:
+            patrol = area.get("patrulha", [WALL_WIDTH + 10, width - WALL_WIDTH - 10])
+            ground_areas.append(dict(area, de=area.get("de", WALL_WIDTH + 50) + dx,
+                                     ate=area.get("ate", width - WALL_WIDTH - 50) + dx,
+                                     patrulha=[patrol[0] + dx, patrol[1] + dx]))
+    wide = dict(data, largura=width * copies, plataformas=platforms, orbes=orbs, inimigos=enemies,
+                cogumelos_aleatorios=ground_areas)
+    wide["paredes"] = [[0, 0, WALL_WIDTH, MAP_HEIGHT], [width * copies - WALL_WIDTH, 0, WALL_WIDTH, MAP_HEIGHT]]
+    return wide
+
+# ===== Inimigos dormindo =====
+class Sleeper:
+    """Inimigo fora da região ativa: o estado da patrulha no tick em que ele dormiu.
+
+    'enemy' é None enquanto o inimigo ainda não foi criado; aí só existe o registro
+    do nível, dormindo desde o começo da partida.
+    """
+    __slots__ = ("enemy", "record", "x", "direction", "min_x", "max_x", "speed", "width", "since")
+
+    def __init__(self, enemy, record, x, direction, min_x, max_x, speed, width, since):
+        self.enemy, self.record = enemy, record
+        self.x, self.direction = x, direction
+        self.min_x, self.max_x = min_x, max_x
+        self.speed, self.width = speed, width
+        self.since = since  # último tick que o estado acima já inclui
+
+    @classmethod
+    def of_enemy(cls, enemy, since):
+        min_x, max_x = enemy.patrol_range()
+        return cls(enemy, None, enemy.rect.x, enemy.direction, min_x, max_x, enemy.speed, enemy.rect.width, since)
+
+    @classmethod
+    def of_record(cls, record, map_width, speed=ENEMY_SPEED):
+        # mesmos limites (em rect.x) que o Enemy/GroundEnemy calculam ao serem criados
+        ew = ENEMY_SIZE[0]
+        if record[0] == "slime":
+            _, (px, _, pw, _), x, direction = record
+            min_x, max_x = px + 4, px + pw - ew - 4
+        else:
+            _, center, direction, patrol = record
+            left, right = patrol or (WALL_WIDTH + 10, map_width - WALL_WIDTH - 10)
+            x, min_x, max_x = center - ew // 2, left, right - ew
+        return cls(None, record, x, direction, min_x, max_x, speed, ew, 0)
+
+    def patrol_rect(self):
+        """Trecho do mapa que a patrulha cobre (chave no índice de quem dorme)."""
+        return pygame.Rect(self.min_x, 0, max(1, self.max_x + self.width - self.min_x), 1)
+
+# ===== Carregamento em chunks durante a partida =====
+class LevelStream:
+    """Parte do nível carregada ao redor da câmera, mais os inimigos que estão dormindo.
+
+    Um chunk que sai da janela tira seus Rects dos índices espaciais, e as orbes
+    coletadas ficam marcadas pela chave para não reaparecerem.
+
+    Inimigos fora da região ativa ficam em 'sleepers', indexados pelo trecho que a
+    patrulha deles cobre. A cada REGION_CHECK_TICKS só os que patrulham pela região ativa são
+    consultados: a posição de cada um sai de patrol_position() e quem já está dentro
+    acorda com fast_forward(). Inimigos do nível que nunca chegaram perto ainda nem
+    foram criados.
+    """
+
+    def __init__(self, level, rng, margin=STREAM_MARGIN, enemy_speed=ENEMY_SPEED):
+        self.level = level
+        self.margin = margin
+        self.enemy_speed = enemy_speed
+        self.platform_grid = SpatialHash(level.width)
+        self.wall_grid = SpatialHash(level.width)
+        self.orb_grid = SpatialHash(level.width)
+        self.collected = set()               # chaves das orbes já coletadas
+        self._orb_keys = {}                  # id(rect da orbe carregada) -> chave
+        self._loaded = {}                    # chunk -> [(índice, rect)] colocados nos índices
+        self._window = None
+        # só importa o eixo x: uma linha de células basta
+        self.sleepers = SpatialHash(level.width, 1)
+        for record in level.roll_spawns(rng):
+            self._add_sleeper(Sleeper.of_record(record, level.width, enemy_speed))
+        self.loads = 0
+        self.unloads = 0
+        self.slept = 0
+        self.woken = 0
+
+    # ----- chunks -----
+    def window(self, cam_x):
+        left = int(cam_x) - self.margin
+        return self.level.chunks_between(left, left + WIDTH + 2 * self.margin)
+
+    def update(self, cam_x):
+        """Carrega e descarrega chunks para a câmera em cam_x (quase sempre não muda nada)."""
+        window = self.window(cam_x)
+        if window == self._window:
+            return
+        self._window = window
+        for chunk in [c for c in self._loaded if c not in window]:
+            self._unload(chunk)
+        for chunk in window:
+            if chunk not in self._loaded:
+                self._load(chunk)
+
+    def _load(self, chunk):
+        level = self.level
+        placed = []
+        for grid, items in ((self.platform_grid, level.platforms(chunk)), (self.wall_grid, level.walls(chunk))):
+            for _, rect in items:
+                rect = pygame.Rect(rect)
+                grid.insert(rect, rect)
+                placed.append((grid, rect))
+        for key, rect in level.orbs(chunk):
+            if key in self.collected:
+                continue
+            rect = pygame.Rect(rect)
+            self.orb_grid.insert(rect, rect)
+            self._orb_keys[id(rect)] = key
+            placed.append((self.orb_grid, rect))
+        self._loaded[chunk] = placed
+        self.loads += 1
+
+    def _unload(self, chunk):
+        for grid, rect in self._loaded.pop(chunk):
+            grid.remove(rect)
+            self._orb_keys.pop(id(rect), None)
+        self.unloads += 1
+
+    def collect(self, orb):
+        """Tira a orbe do mapa de vez (não volta quando o chunk for recarregado)."""
+        self.orb_grid.remove(orb)
+        key = self._orb_keys.pop(id(orb), None)
+        if key is not None:
+            self.collected.add(key)
+
+    # ----- inimigos dormindo -----
+    def _add_sleeper(self, sleeper):
+        self.sleepers.insert(sleeper, sleeper.patrol_rect())
+
+    def sleep(self, enemies, tick):
+        """Põe para dormir inimigos que saíram da região ativa no tick 'tick' (antes do update deles)."""
+        for enemy in enemies:
+            self._add_sleeper(Sleeper.of_enemy(enemy, tick - 1))
+        self.slept += len(enemies)
+
+    def wake(self, left, right, tick):
+        """Acorda (criando, se preciso) quem a patrulha trouxe para as colunas left..right.
+
+        Devolve os inimigos acordados, já na posição do tick anterior a 'tick'.
+        """
+        woken = []
+        for sleeper in self.sleepers.query(span_rect(left, right, 1)):
+            steps = max(0, tick - 1 - sleeper.since)
+            x, _ = patrol_position(sleeper.x, sleeper.direction, sleeper.min_x, sleeper.max_x,
+                                   sleeper.speed, steps)
+            if x + sleeper.width < left or x > right:
+                continue
+            self.sleepers.remove(sleeper)
+            enemy = sleeper.enemy or spawn_enemy(sleeper.record, self.level.width, self.enemy_speed)
+            enemy.fast_forward(steps)
+            woken.append(enemy)
+        self.woken += len(woken)
+        return woken
+
+    def stats(self):
+        return {"chunks_carregados": len(self._loaded), "carregamentos": self.loads,
+                "descarregamentos": self.unloads, "dormindo": len(self.sleepers),
+                "adormecidos": self.slept, "acordados": self.woken}
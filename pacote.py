@@ -0,0 +1,234 @@
+"""Pacote de assets pré-compilado (assets/pacote.bin).
+
+Um passo de build decodifica uma vez só todos os sprites (já redimensionados e
+espelhados, exatamente como o jogo pede ao get_animation) e as telas/ícones (já no
+tamanho final) e grava os pixels crus (RGBA/RGB) num arquivo só, com um índice JSON
+no começo. Em tempo de execução o arquivo é mapeado em memória (mmap) e cada frame
+vira uma Surface com pygame.image.frombuffer: sem Pillow, sem smoothscale, sem flip.
+
+Se um arquivo de origem mudar depois do build, as entradas dele são ignoradas e o
+jogo volta a decodificar esse arquivo do jeito normal.
+
+Exemplos:
+    python pacote.py                # gera assets/pacote.bin
+    python pacote.py --benchmark    # compara o tempo de carregamento com e sem o pacote
+"""
+import json
+import mmap
+import os
+import struct
+import subprocess
+import sys
+import time
+
+import pygame
+
+from assets import normalize_surface
+
+MAGIC = b"FJPK"
+VERSION = 1
+BUNDLE_FILE = os.path.join("assets", "pacote.bin")
+_HEADER = struct.Struct("<4sII")  # magic, versão, tamanho do índice em bytes
+_BYTES_PER_PIXEL = {"RGB": 3, "RGBA": 4}
+
+_tobytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+
+def animation_key(path, frames_count, size, flip):
+    return json.dumps(["anim", path, frames_count, list(size) if size else None, bool(flip)])
+
+def image_key(path, size, alpha):
+    return json.dumps(["imagem", path, list(size) if size else None, bool(alpha)])
+
+def _source_stamp(path):
+    st = os.stat(path)
+    return [st.st_size, int(st.st_mtime)]
+
+# ===== Leitura =====
+class Bundle:
+    """Pacote aberto via mmap; animation()/image() devolvem None para o que não tem."""
+
+    def __init__(self, path=BUNDLE_FILE):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, index_len = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"formato desconhecido ({magic!r}, versão {version})")
+        index = json.loads(bytes(self._map[_HEADER.size:_HEADER.size + index_len]))
+        self._data_start = _HEADER.size + index_len
+        self._view = memoryview(self._map)
+        self.entries = index["entradas"]
+        # arquivos de origem alterados (ou apagados) depois do build
+        self.stale = set()
+        for source, stamp in index["fontes"].items():
+            try:
+                if _source_stamp(source) != stamp:
+                    self.stale.add(source)
+            except OSError:
+                self.stale.add(source)
+
+    def has(self, key):
+        entry = self.entries.get(key)
+        return entry is not None and entry["fonte"] not in self.stale
+
+    def surfaces(self, key, convert=True):
+        """Frames da entrada 'key'; com convert=True (e janela aberta) já no formato da tela
+        (assets.normalize_surface)."""
+        entry = self.entries[key]
+        fmt = entry["formato"]
+        size = tuple(entry["tamanho"])
+        length = size[0] * size[1] * _BYTES_PER_PIXEL[fmt]
+        convert = convert and pygame.display.get_surface() is not None
+        frames = []
+        for offset in entry["frames"]:
+            start = self._data_start + offset
+            surf = pygame.image.frombuffer(self._view[start:start + length], size, fmt)
+            if convert:
+                surf = normalize_surface(surf) if fmt == "RGBA" else surf.convert()
+            frames.append(surf)
+        return tuple(frames)
+
+    def has_animation(self, path, frames_count=None, size=None, flip=False):
+        return self.has(animation_key(path, frames_count, size, flip))
+
+    def has_image(self, path, size=None, alpha=False):
+        return self.has(image_key(path, size, alpha))
+
+    def animation(self, path, frames_count=None, size=None, flip=False):
+        key = animation_key(path, frames_count, size, flip)
+        return self.surfaces(key) if self.has(key) else None
+
+    def image(self, path, size=None, alpha=False, convert=True):
+        key = image_key(path, size, alpha)
+        return self.surfaces(key, convert)[0] if self.has(key) else None
+
+def open_bundle(path=BUNDLE_FILE):
+    """Abre o pacote se ele existir; sem pacote (ou com um inválido) devolve None."""
+    if not os.path.exists(path):
+        return None
+    try:
+        return Bundle(path)
+    except Exception as e:
+        print(f"Aviso: não foi possível abrir {path}: {e}")
+        return None
+
+# ===== Build =====
+def _load_screen_image(path, size, alpha):
+    surf = pygame.image.load(path)
+    if size is not None and surf.get_size() != tuple(size):
+        surf = (pygame.transform.smoothscale if alpha else pygame.transform.scale)(surf, size)
+    return surf.convert_alpha() if alpha else surf.convert()
+
+def build_bundle(path=BUNDLE_FILE):
+    """Gera o pacote com tudo que uma partida pede ao get_animation + as imagens de IMAGES."""
+    import assets
+    from carregador import IMAGES
+    from headless import init_headless
+    from simulacao import Game
+
+    init_headless()
+    assets.use_bundle(None)
+    assets.clear_animation_cache()
+    Game(0)  # cria jogador e inimigos: o cache passa a ter todas as animações usadas
+
+    entries = {}
+    blobs = []
+    offset = 0
+
+    def add(key, surfaces, fmt, source):
+        nonlocal offset
+        frames = []
+        for surf in surfaces:
+            data = _tobytes(assets.unkeyed(surf), fmt)  # colorkey vira alfa de novo
+            frames.append(offset)
+            blobs.append(data)
+            offset += len(data)
+        entries[key] = {"formato": fmt, "tamanho": list(surfaces[0].get_size()), "frames": frames, "fonte": source}
+
+    for (source, frames_count, size, flip), frames in assets.animation_cache_items():
+        if frames:
+            add(animation_key(source, frames_count, size, flip), frames, "RGBA", source)
+    for source, size, alpha in IMAGES.values():
+        try:
+            surf = _load_screen_image(source, size, alpha)
+        except Exception as e:
+            print(f"Aviso: {source} ficou fora do pacote: {e}")
+            continue
+        add(image_key(source, size, alpha), [surf], "RGBA" if alpha else "RGB", source)
+
+    sources = {entry["fonte"]: _source_stamp(entry["fonte"]) for entry in entries.values()}
+    index = json.dumps({"entradas": entries, "fontes": sources}, ensure_ascii=False).encode("utf-8")
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(index)))
+        f.write(index)
+        for data in blobs:
+            f.write(data)
+    os.replace(tmp, path)
+    return {"entradas": len(entries), "bytes": _HEADER.size + len(index) + offset}
+
+# ===== Benchmark de inicialização =====
+def _measure_load(path, use_bundle):
+    """Carrega tudo que o pacote contém, pelo pacote ou pelo caminho normal; devolve ms."""
+    from headless import init_headless
+    init_headless()
+    with open(path, "rb") as f:
+        f.seek(_HEADER.size - 4)
+        index_len = struct.unpack("<I", f.read(4))[0]
+        entries = json.loads(f.read(index_len))["entradas"]
+
+    start = time.perf_counter()
+    import assets
+    bundle = Bundle(path) if use_bundle else None
+    assets.use_bundle(bundle)
+    for key in entries:
+        parts = json.loads(key)
+        if parts[0] == "anim":
+            _, source, frames_count, size, flip = parts
+            assets.get_animation(source, frames_count, tuple(size) if size else None, flip)
+        else:
+            _, source, size, alpha = parts
+            size = tuple(size) if size else None
+            if bundle is not None:
+                bundle.image(source, size, alpha)
+            else:
+                _load_screen_image(source, size, alpha)
+    return (time.perf_counter() - start) * 1000
+
+def benchmark(path=BUNDLE_FILE, runs=5):
+    """Mede cada modo em processos novos (início a frio, inclusive o import do Pillow)."""
+    results = {}
+    for mode in ("sem_pacote", "com_pacote"):
+        times = []
+        for _ in range(runs):
+            out = subprocess.run([sys.executable, __file__, "--medir", mode, "--saida", path],
+                                 capture_output=True, text=True, check=True)
+            times.append(float(out.stdout.strip().splitlines()[-1]))
+        times.sort()
+        results[mode] = times[len(times) // 2]
+        print(f"{mode:<11} mediana {results[mode]:8.1f} ms   ({', '.join(f'{t:.1f}' for t in times)})")
+    if results["com_pacote"] > 0:
+        print(f"ganho: {results['sem_pacote'] / results['com_pacote']:.1f}x")
+    return results
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Gera ou mede o pacote de assets pré-compilado.")
+    parser.add_argument("--saida", default=BUNDLE_FILE, help="arquivo do pacote")
+    parser.add_argument("--benchmark", action="store_true", help="compara o carregamento com e sem o pacote")
+    parser.add_argument("--medir", choices=("sem_pacote", "com_pacote"), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.medir:
+        print(f"{_measure_load(args.saida, args.medir == 'com_pacote'):.3f}")
+        return
+    if args.benchmark:
+        if not os.path.exists(args.saida):
+            build_bundle(args.saida)
+        benchmark(args.saida)
+        return
+    info = build_bundle(args.saida)
+    print(f"{args.saida}: {info['entradas']} entradas, {info['bytes'] / 1024 / 1024:.1f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,353 @@
+import time
+
+import pygame
+
+from assets import circle_stamp, rounded_rect_stamp
+from config import WIDTH, HEIGHT, TICK_MS, MAX_FRAME_MS, MAX_TICKS_PER_FRAME, MAX_FPS, FULL_REDRAW, QUALITY, QUALITY_PRESETS
+from simulacao import Game, input_from_keys, new_seed
+from replay import Recorder, ReplayInput, ReplayWriter, LAST_REPLAY, replay_name, new_game
+from desenho import WorldRenderer
+from texto import text_cache, GlyphAtlas
+from transicao import Fade
+from perfil import FrameProfiler
+
+# ===== HUD: slots de orbes (centro inferior) =====
+MAX_ORB_SLOTS = 20  # níveis com mais orbes que isso enchem cada slot com várias orbes
+slot_radius = 14
+slot_spacing = slot_radius * 2 + 12
+slots_center_x = WIDTH // 2
+slots_y = HEIGHT - 40  # centro inferior
+
+def orb_slot_xs(total_orbs):
+    """Centros x dos slots de orbes para um nível com 'total_orbs' orbes."""
+    count = min(total_orbs, MAX_ORB_SLOTS) if total_orbs > 0 else 4
+    start_x = slots_center_x - (slot_spacing * count) // 2 + slot_spacing // 2
+    return [start_x + i * slot_spacing for i in range(count)]
+
+heart_radius = 10
+heart_padding = 10
+
+class Partida:
+    """O jogo em si: loop principal com simulação em ticks fixos, desenho, HUD e ranking.
+
+    Recebe o display e os assets já carregados (carregador.AssetLoader); run() volta
+    quando o jogador fecha a janela.
+
+    A entrada de cada partida é gravada (replay.Recorder): ao terminar ela vai para
+    replays/ultima_partida.fjr, e um tempo salvo no ranking leva o próprio replay.
+    Com 'replay' (replay.Replay) a partida gravada é mostrada em vez de jogada.
+
+    'quality' escolhe um preset de config.QUALITY_PRESETS (resolução interna do mundo).
+    'display' é o que fase1.open_window() devolveu: com pygame.display o desenho é feito
+    com blits de Surface (desenho.WorldRenderer); com um textura.TextureDisplay, com
+    texturas do SDL (textura.TextureRenderer).
+    """
+
+    def __init__(self, display, clock, loader, highscores, audio, replay=None, quality=QUALITY):
+        self.clock = clock
+        self.highscores = highscores
+
+        # fontes só agora: as telas de antes não têm texto
+        self.font = pygame.font.Font(pygame.font.get_default_font(), 24)
+        self.name_prompt_font = pygame.font.Font(pygame.font.get_default_font(), 28)
+        self.timer_glyphs = GlyphAtlas(self.font, (255, 255, 255))  # dígitos do timer já rasterizados
+
+        background = loader.get("background")
+        if background is None:
+            background = pygame.Surface((WIDTH, HEIGHT)).convert()
+            background.fill((35, 60, 110))
+        self.timer_icon = loader.get("timer") or pygame.Surface((28, 28), pygame.SRCALPHA)
+        self.audio = audio  # AudioEngine: vozes limitadas, então rajadas não travam o frame
+
+        # inicia o timer somente quando o jogo começa
+        self.replay = replay
+        self.replay_input = None
+        self.recorder = None
+        self.replay_writer = None
+        if replay is not None:
+            self.game = new_game(replay)
+            self.replay_input = ReplayInput(replay)
+        else:
+            self.game = Game()
+            self.recorder = Recorder(self.game)
+            self.replay_writer = ReplayWriter()  # grava em outra thread, fora do loop do jogo
+        self.slot_xs = orb_slot_xs(self.game.total_orbs)
+
+        # mundo fixo pré-renderizado + dirty rects (FULL_REDRAW = True volta ao redesenho completo)
+        # com render_scale < 1 o mundo é desenhado menor e ampliado; o HUD fica na resolução nativa
+        if display is pygame.display:
+            self.renderer = WorldRenderer(display.get_surface(), background, full_redraw=FULL_REDRAW,
+                                          level=self.game.level, **QUALITY_PRESETS[quality])
+        else:
+            from textura import TextureRenderer
+            self.renderer = TextureRenderer(display, background, level=self.game.level)
+        # telas de fim de partida e overlay do F3 (nas texturas, uma camada transparente por cima)
+        self.window = self.renderer.window
+
+        # ===== Profiler (F3 mostra/esconde os tempos, F4 começa/termina um trace CSV/JSON) =====
+        self.profiler = FrameProfiler()
+        self.game.profiler = self.profiler
+
+        # ===== Variáveis para input de nome quando vencer =====
+        self.entering_name = False
+        self.name_input = ""
+
+        # escurecimento por trás das telas de vitória/game over (surface reaproveitada, fade por tempo)
+        self.end_fade = Fade(start_alpha=0, end_alpha=160, duration_ms=250)
+
+        self.pending_jump = False   # entradas de toque: aplicadas no próximo tick de simulação
+        self.pending_shot = False
+
+    # ===== Função para resetar o jogo =====
+    def reset_game(self):
+        if self.replay is not None:
+            # recomeça o mesmo replay
+            self.game.reset(self.replay.seed)
+            self.replay_input = ReplayInput(self.replay)
+        else:
+            self.game.reset(new_seed())
+            self.recorder = Recorder(self.game)
+        self.entering_name = False
+        self.name_input = ""
+
+    # ===== Replays =====
+    def save_replay(self, path):
+        """Agenda a gravação do replay da partida atual; devolve o arquivo."""
+        return self.replay_writer.save(self.recorder.replay(self.game), path)
+
+    # ===== Eventos =====
+    def handle_event(self, event):
+        """Trata um evento; devolve False quando o jogador fecha a janela."""
+        game = self.game
+        if event.type == pygame.QUIT:
+            return False
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+            self.profiler.show_overlay = not self.profiler.show_overlay
+            return True
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_F4:
+            self.profiler.toggle_trace()
+            return True
+
+        # Quando venceu: tratar input de nome e permitir restart com espaço
+        if game.game_won:
+            if self.entering_name and event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_BACKSPACE:
+                    self.name_input = self.name_input[:-1]
+                elif event.key == pygame.K_RETURN or event.key == pygame.K_KP_ENTER:
+                    # salva o score
+                    # entra no índice na hora; a gravação em disco é feita em outra thread
+                    name = self.name_input if self.name_input.strip() != "" else "Anon"
+                    replay = self.save_replay(replay_name(name, game.time_elapsed_ms))
+                    self.highscores.add(name, game.time_elapsed_ms, replay)
+                    self.entering_name = False
+                else:
+                    # limitar tamanho e aceitar caracteres normais
+                    if len(self.name_input) < 20 and event.unicode.isprintable():
+                        self.name_input += event.unicode
+            elif not self.entering_name and event.type == pygame.KEYDOWN:
+                # após salvar ou se não quiser digitar, espaço reinicia
+                if event.key == pygame.K_SPACE:
+                    self.reset_game()
+            # ignorar controles normais enquanto venceu
+            return True
+
+        # Quando em game_over: permitir restart com espaço
+        if game.game_over:
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+                self.reset_game()
+            return True
+
+        # controles normais do jogo (quando não venceu e não game_over); no replay a entrada vem do arquivo
+        if event.type == pygame.KEYDOWN and self.replay is None:
+            if event.key == pygame.K_SPACE:
+                self.pending_jump = True
+            if event.key == pygame.K_e:
+                self.pending_shot = True
+        return True
+
+    # ===== Simulação =====
+    def step_simulation(self, accumulator, keys):
+        """Roda quantos ticks fixos couberem no tempo acumulado; devolve o que sobrou."""
+        game = self.game
+        ticks_this_frame = 0
+        while accumulator >= TICK_MS and ticks_this_frame < MAX_TICKS_PER_FRAME:
+            accumulator -= TICK_MS
+            ticks_this_frame += 1
+            if game.finished:
+                continue
+            if self.replay_input is not None:
+                if self.replay_input.done:
+                    continue
+                inputs = self.replay_input.next()
+            else:
+                inputs = input_from_keys(keys, self.pending_jump, self.pending_shot)
+                self.recorder.record(inputs)
+            self.pending_jump = self.pending_shot = False
+            self.audio.play_all(game.tick(inputs))
+            if game.finished and self.recorder is not None:
+                self.save_replay(LAST_REPLAY)
+            if game.game_won and self.replay is None:
+                self.entering_name = True
+            self.profiler.lap("outros")
+
+        if ticks_this_frame == MAX_TICKS_PER_FRAME and accumulator >= TICK_MS:
+            # ficou para trás demais: descarta o atraso em vez de acelerar o jogo
+            accumulator = 0.0
+        if game.finished:
+            self.pending_jump = self.pending_shot = False
+        return accumulator
+
+    # ===== HUD =====
+    def draw_hud(self):
+        """Põe o HUD na lista de desenho do renderer (carimbos prontos, um blits só)."""
+        renderer, game = self.renderer, self.game
+
+        # vidas no canto superior esquerdo
+        for i in range(4):  # total de 4 vidas ao todo
+            hx = heart_padding + i * (heart_radius * 2 + 8)
+            hy = heart_padding + heart_radius
+            color = (255, 0, 0) if i < game.player.lives else (80, 80, 80)
+            renderer.queue(circle_stamp(heart_radius, color), (hx - heart_radius, hy - heart_radius))
+
+        # Timer (contando para cima)
+        seconds = game.time_elapsed_ms // 1000
+        ms = (game.time_elapsed_ms % 1000) // 10
+        renderer.queue(self.timer_icon, (WIDTH - 210, 10))
+        renderer.queue_many(self.timer_glyphs.sprites((WIDTH - 175, 12), f"{seconds:02d}:{ms:02d}", prefix="Tempo: "))
+
+        # Slots de orbes (círculos brancos vazios no centro inferior) - desenha contorno
+        outline = circle_stamp(slot_radius, (200, 200, 200), width=3)
+        for sx in self.slot_xs:
+            renderer.queue(outline, (sx - slot_radius, slots_y - slot_radius))
+
+        # Preenche os slots coletados (círculos brancos cheios)
+        filled = game.collected_orbs
+        if game.total_orbs > len(self.slot_xs):
+            filled = game.collected_orbs * len(self.slot_xs) // game.total_orbs
+        inner = slot_radius - 4
+        for sx in self.slot_xs[:filled]:
+            renderer.queue(circle_stamp(inner, (255, 255, 255)), (sx - inner, slots_y - inner))
+
+        # aviso de replay no centro superior
+        if self.replay is not None:
+            label = text_cache.render(self.font, "REPLAY", (255, 200, 0))
+            renderer.queue(label, (WIDTH//2 - label.get_width()//2, 12))
+
+        # as telas de fim de partida desenham direto na janela, por cima do HUD
+        renderer.flush()
+
+    ### A parte dedicada ao ranking foi auxiliada com ChatGPT ###
+
+    def draw_victory(self):
+        """Tela de vitória: mostra tempo final e input para nome."""
+        window, font, game = self.window, self.font, self.game
+        # semi-transparência de fundo
+        self.end_fade.draw(window, pygame.time.get_ticks())
+
+        # mostra tempo final centralizado
+        final_seconds = game.time_elapsed_ms // 1000
+        final_ms = (game.time_elapsed_ms % 1000) // 10
+        txt_time = text_cache.render(font, f"Tempo final: {final_seconds:02d}:{final_ms:02d}", (255, 255, 0))
+        window.blit(txt_time, (WIDTH//2 - txt_time.get_width()//2, HEIGHT//2 - 80))
+
+        # mostra prompt para nome e caixa (no replay não há nome para digitar)
+        if self.replay is None:
+            prompt = text_cache.render(self.name_prompt_font, "Digite seu nome e pressione Enter:", (255,255,255))
+            window.blit(prompt, (WIDTH//2 - prompt.get_width()//2, HEIGHT//2 - 30))
+
+            # desenha caixa de texto
+            box_w, box_h = 480, 40
+            box_x = WIDTH//2 - box_w//2
+            box_y = HEIGHT//2 + 10
+            window.blits([(rounded_rect_stamp((box_w+4, box_h+4), (255,255,255), 6), (box_x-2, box_y-2)),  # borda
+                          (rounded_rect_stamp((box_w, box_h), (30,30,30), 6), (box_x, box_y))])
+            cursor = "|" if (pygame.time.get_ticks() // 500) % 2 == 0 else ""
+            name_surf = text_cache.render(self.name_prompt_font, self.name_input + cursor, (255,255,255))
+            window.blit(name_surf, (box_x + 10, box_y + (box_h - name_surf.get_height())//2))
+
+        # mostra top 5 do ranking atual (persistente)
+        hs_title = text_cache.render(font, "Ranking (melhores tempos)", (200,200,255))
+        window.blit(hs_title, (50, 100))
+        for i, entry in enumerate(self.highscores.top(5)):
+            sec = entry["time_ms"] // 1000
+            ms_e = (entry["time_ms"] % 1000) // 10
+            line = text_cache.render(font, f"{i+1}. {entry['name']} - {sec:02d}:{ms_e:02d}", (220,220,220))
+            window.blit(line, (50, 140 + i*28))
+
+        # instrução para reiniciar (após salvar ou pular digitar)
+        if not self.entering_name:
+            inst = text_cache.render(font, "Aperte a tecla ESPAÇO para reiniciar", (255,255,0))
+            window.blit(inst, (WIDTH//2 - inst.get_width()//2, HEIGHT//2 + 70))
+
+    def draw_game_over(self):
+        window, font = self.window, self.font
+        # semi-transparência de fundo
+        self.end_fade.draw(window, pygame.time.get_ticks())
+
+        # mensagem GAME OVER
+        go_surf = text_cache.render(font, "GAME OVER", (255, 0, 0))
+        window.blit(go_surf, (WIDTH//2 - go_surf.get_width()//2, HEIGHT//2 - 40))
+
+        # instrução para reiniciar
+        inst2 = text_cache.render(font, "Aperte a tecla ESPAÇO para reiniciar", (255, 255, 0))
+        window.blit(inst2, (WIDTH//2 - inst2.get_width()//2, HEIGHT//2 + 10))
+
+    # ===== Loop principal =====
+    def run(self):
+        game, renderer, profiler = self.game, self.renderer, self.profiler
+        running = True
+        accumulator = 0.0
+        last_frame = time.perf_counter()
+        while running:
+            profiler.begin_frame()
+            now_frame = time.perf_counter()
+            frame_ms = min((now_frame - last_frame) * 1000, MAX_FRAME_MS)
+            last_frame = now_frame
+            accumulator += frame_ms
+
+            for event in pygame.event.get():
+                if not self.handle_event(event):
+                    running = False
+            keys = pygame.key.get_pressed()
+            profiler.lap("eventos")
+
+            # Simulação: quantos ticks fixos couberem no tempo acumulado
+            accumulator = self.step_simulation(accumulator, keys)
+
+            # fração do próximo tick já decorrida (0..1), usada para interpolar o desenho
+            alpha = accumulator / TICK_MS
+            view = game.cam.view(alpha)
+
+            # ===== Desenho =====
+            # o mundo fixo vem da camada estática; com overlays na tela, redesenha tudo
+            if game.finished:
+                renderer.invalidate()
+                if not self.end_fade.started:
+                    self.end_fade.start(pygame.time.get_ticks())
+            elif self.end_fade.started:
+                self.end_fade.stop()
+            renderer.begin(view)
+            # orbes, inimigos, tiros, jogador e paredes (só o que está perto da câmera)
+            renderer.draw_game(game, view, alpha)
+            profiler.lap("mundo")
+
+            self.draw_hud()
+            if game.game_won:
+                self.draw_victory()
+            if game.game_over:
+                self.draw_game_over()
+            if profiler.show_overlay:
+                renderer.add(profiler.draw_overlay(self.window, extra=(self.audio.stats_line, renderer.stats_line)))
+            profiler.lap("hud")
+
+            renderer.present()
+            self.clock.tick(MAX_FPS)
+            profiler.lap("display")
+            profiler.end_frame()
+
+        # trace ainda aberto ao fechar a janela: salva o que foi gravado
+        if profiler.trace is not None:
+            profiler.toggle_trace()
+        profiler.flush()  # espera os traces ainda sendo gravados
+        if self.replay_writer is not None:
+            self.replay_writer.close()  # espera os replays ainda na fila
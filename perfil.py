@@ -0,0 +1,164 @@
+import csv
+import json
+import threading
+import time
+from collections import deque
+
+import pygame
+
+from texto import text_cache
+
+# ===== Profiler de frame =====
+# Mede quanto de cada frame vai para cada fase do loop principal. As fases são
+# marcadas com lap(nome): o tempo desde a marca anterior é somado à fase 'nome'
+# (se a simulação roda vários ticks no mesmo frame, os tempos se somam).
+# contato = jogador x orbes/inimigos; tiros = tiros andando e acertando inimigos;
+# outros = o que o loop faz depois de cada tick (sons, replay, estado da partida).
+PHASES = ("eventos", "player", "contato", "inimigos", "tiros", "outros", "mundo", "hud", "display")
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    k = min(len(sorted_values) - 1, max(0, int(round(p / 100 * (len(sorted_values) - 1)))))
+    return sorted_values[k]
+
+def write_trace(path_prefix, fields, trace, summary):
+    """Grava o trace em <prefixo>.csv (uma linha por frame) e <prefixo>.json (com o resumo)."""
+    try:
+        with open(path_prefix + ".csv", "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(trace)
+        with open(path_prefix + ".json", "w", encoding="utf-8") as f:
+            json.dump({"fases": fields[2:], "frames": trace, "resumo": summary}, f, ensure_ascii=False)
+    except OSError as e:
+        print(f"Aviso: não foi possível salvar o trace de perfil {path_prefix}: {e}")
+        return
+    print(f"Trace de perfil salvo em {path_prefix}.csv e {path_prefix}.json")
+
+class FrameProfiler:
+    def __init__(self, window=300, phases=PHASES):
+        self.phases = phases
+        self.history = {name: deque(maxlen=window) for name in phases + ("frame",)}
+        self.show_overlay = False
+        self.trace = None           # lista de frames enquanto um trace está sendo gravado
+        self.frame_index = 0
+        self._current = dict.fromkeys(phases, 0.0)
+        self._frame_start = None
+        self._last = None
+        self._overlay_surf = None
+        self._overlay_built_at = 0.0
+        self._font = None
+        self._writers = []          # threads gravando traces já encerrados
+
+    # ----- marcação -----
+    def begin_frame(self):
+        now = time.perf_counter()
+        self._frame_start = self._last = now
+        for name in self.phases:
+            self._current[name] = 0.0
+
+    def lap(self, phase):
+        now = time.perf_counter()
+        if self._last is not None:
+            self._current[phase] += (now - self._last) * 1000
+        self._last = now
+
+    def end_frame(self):
+        if self._frame_start is None:
+            return
+        total = (time.perf_counter() - self._frame_start) * 1000
+        for name in self.phases:
+            self.history[name].append(self._current[name])
+        self.history["frame"].append(total)
+        if self.trace is not None:
+            row = {"frame": self.frame_index, "total_ms": round(total, 4)}
+            for name in self.phases:
+                row[name] = round(self._current[name], 4)
+            self.trace.append(row)
+        self.frame_index += 1
+
+    # ----- estatísticas -----
+    def summary(self):
+        """Média e percentis (p50/p95/p99, em ms) da janela recente de cada fase."""
+        result = {}
+        for name, values in self.history.items():
+            ordered = sorted(values)
+            result[name] = {
+                "media": sum(ordered) / len(ordered) if ordered else 0.0,
+                "p50": percentile(ordered, 50),
+                "p95": percentile(ordered, 95),
+                "p99": percentile(ordered, 99),
+            }
+        return result
+
+    # ----- traces -----
+    def start_trace(self):
+        self.trace = []
+
+    def stop_trace(self, path_prefix=None):
+        """Encerra o trace e devolve os caminhos de <prefixo>.csv e <prefixo>.json.
+
+        A gravação roda numa thread, para não travar o frame (nem entrar nos tempos
+        do frame seguinte); flush() espera ela terminar."""
+        trace, self.trace = self.trace, None
+        if not trace:
+            return []
+        if path_prefix is None:
+            path_prefix = time.strftime("perfil_%Y%m%d_%H%M%S")
+        fields = ["frame", "total_ms"] + list(self.phases)
+        writer = threading.Thread(target=write_trace, args=(path_prefix, fields, trace, self.summary()),
+                                  name="perfil-trace")
+        writer.start()
+        self._writers = [w for w in self._writers if w.is_alive()] + [writer]
+        return [path_prefix + ".csv", path_prefix + ".json"]
+
+    def toggle_trace(self):
+        if self.trace is None:
+            self.start_trace()
+            return []
+        return self.stop_trace()
+
+    def flush(self):
+        """Bloqueia até os traces encerrados estarem no disco."""
+        for writer in self._writers:
+            writer.join()
+        self._writers = []
+
+    # ----- overlay -----
+    def draw_overlay(self, surface, font=None, pos=(10, 40), refresh_s=0.25, extra=None):
+        """Desenha a tabela de tempos; a superfície só é refeita algumas vezes por segundo.
+
+        'extra' é uma função (ou tupla de funções) que devolve uma linha a mais (ex.:
+        contadores de áudio e de desenho), chamada só quando a superfície é refeita.
+        """
+        if font is None:
+            # fonte monoespaçada (para alinhar as colunas), criada só quando o overlay aparece
+            if self._font is None:
+                self._font = pygame.font.SysFont("dejavusansmono,couriernew,monospace", 16)
+            font = self._font
+        now = time.perf_counter()
+        if self._overlay_surf is None or now - self._overlay_built_at >= refresh_s:
+            self._overlay_surf = self._build_overlay(font, extra)
+            self._overlay_built_at = now
+        return surface.blit(self._overlay_surf, pos)
+
+    def _build_overlay(self, font, extra=None):
+        stats = self.summary()
+        lines = [f"{'fase':<9}{'média':>7}{'p50':>7}{'p95':>7}{'p99':>7}  ms"]
+        for name in self.phases + ("frame",):
+            s = stats[name]
+            lines.append(f"{name:<9}{s['media']:7.2f}{s['p50']:7.2f}{s['p95']:7.2f}{s['p99']:7.2f}")
+        if self.trace is not None:
+            lines.append(f"gravando trace: {len(self.trace)} frames")
+        if callable(extra):
+            extra = (extra,)
+        for line in extra or ():
+            lines.append(line())
+        line_h = font.get_linesize()
+        width = max(font.size(line)[0] for line in lines) + 16
+        surf = pygame.Surface((width, line_h * len(lines) + 12), pygame.SRCALPHA)
+        surf.fill((0, 0, 0, 170))
+        for i, line in enumerate(lines):
+            surf.blit(text_cache.render(font, line, (230, 230, 230)), (8, 6 + i * line_h))
+        return surf
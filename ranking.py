@@ -0,0 +1,149 @@
+import bisect
+import json
+import os
+import queue
+import threading
+import time
+
+# ===== Ranking persistente =====
+# Cada tempo novo vira uma linha JSON no fim de um log (nada é reescrito nem cortado,
+# o histórico é ilimitado). Em memória fica um índice ordenado por tempo (bisect) e o
+# melhor tempo de cada jogador. A escrita em disco roda numa thread separada, então
+# salvar um tempo não trava o loop do jogo. Um tempo pode apontar para o replay da
+# partida (replay.py), que permite conferi-lo refazendo a partida.
+LOG_FILE = "highscores.jsonl"
+LEGACY_FILE = "highscores.json"  # formato antigo: lista inteira reescrita a cada save
+
+def atomic_write(path, text):
+    """Grava 'text' em um arquivo temporário e troca pelo definitivo (nunca fica pela metade)."""
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def _line(entry):
+    return json.dumps(entry, ensure_ascii=False) + "\n"
+
+class HighscoreStore:
+    """Ranking com log só de acréscimo + índice ordenado em memória.
+
+    add() atualiza o índice na hora e agenda a escrita; top(n), best_time(nome) e
+    rank(time_ms) só consultam a memória. close() espera a fila de escrita esvaziar.
+    """
+
+    def __init__(self, path=LOG_FILE, legacy_path=LEGACY_FILE):
+        self.path = path
+        self._sorted = []      # (time_ms, seq, name), seq desempata pela ordem de chegada
+        self._best = {}        # nome -> melhor time_ms
+        self._replays = {}     # seq -> arquivo do replay do tempo
+        self._seq = 0
+        if not os.path.exists(path) and legacy_path and os.path.exists(legacy_path):
+            self._migrate(legacy_path)
+        self._load()
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="ranking-writer", daemon=True)
+        self._writer.start()
+
+    # ----- leitura -----
+    def _migrate(self, legacy_path):
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                old = json.load(f)
+            atomic_write(self.path, "".join(_line({"name": e["name"], "time_ms": int(e["time_ms"])}) for e in old))
+        except Exception as e:
+            print(f"Aviso: não foi possível migrar {legacy_path}: {e}")
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            print(f"Aviso: não foi possível ler o ranking: {e}")
+            return
+        valid = []
+        for line_no, line in enumerate(lines, 1):
+            try:
+                entry = json.loads(line)
+                self._index(entry["name"], int(entry["time_ms"]), entry.get("replay"))
+                valid.append(line if line.endswith("\n") else line + "\n")
+            except Exception:
+                # tipicamente a última linha, cortada por um fechamento no meio da escrita
+                print(f"Aviso: linha {line_no} do ranking ignorada (corrompida)")
+        if len(valid) != len(lines) or (lines and not lines[-1].endswith("\n")):
+            # conserta o log antes de voltar a acrescentar linhas nele
+            atomic_write(self.path, "".join(valid))
+
+    def _index(self, name, time_ms, replay=None):
+        bisect.insort(self._sorted, (time_ms, self._seq, name))
+        if replay:
+            self._replays[self._seq] = replay
+        self._seq += 1
+        best = self._best.get(name)
+        if best is None or time_ms < best:
+            self._best[name] = time_ms
+
+    # ----- escrita -----
+    def add(self, name, time_ms, replay=None):
+        """Registra um tempo (e o arquivo do replay dele) e devolve a posição no ranking (1 = melhor)."""
+        time_ms = int(time_ms)
+        self._index(name, time_ms, replay)
+        entry = {"name": name, "time_ms": time_ms, "ts": int(time.time())}
+        if replay:
+            entry["replay"] = replay
+        self._queue.put(entry)
+        return self.rank(time_ms)
+
+    def _write_loop(self):
+        while True:
+            entry = self._queue.get()
+            if entry is None:
+                self._queue.task_done()
+                return
+            try:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write(_line(entry))
+                    f.flush()
+                    os.fsync(f.fileno())
+            except Exception as e:
+                print("Erro salvando highscores:", e)
+            self._queue.task_done()
+
+    def flush(self):
+        """Bloqueia até tudo que foi adicionado estar no disco."""
+        self._queue.join()
+
+    def close(self):
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+
+    # ----- consultas -----
+    def __len__(self):
+        return len(self._sorted)
+
+    def top(self, n=5):
+        """Os n melhores tempos (n=None: todos); os que têm replay trazem o arquivo em "replay"."""
+        entries = []
+        for t, seq, name in self._sorted[:n]:
+            entry = {"name": name, "time_ms": t}
+            if seq in self._replays:
+                entry["replay"] = self._replays[seq]
+            entries.append(entry)
+        return entries
+
+    def best_time(self, name):
+        """Melhor tempo (ms) do jogador, ou None se ele nunca terminou o jogo."""
+        return self._best.get(name)
+
+    def best_per_player(self, n=None):
+        """Melhor tempo de cada jogador, do mais rápido para o mais lento."""
+        ranked = sorted(self._best.items(), key=lambda item: item[1])
+        return [{"name": name, "time_ms": t} for name, t in ranked[:n]]
+
+    def rank(self, time_ms):
+        """Posição que 'time_ms' ocupa no ranking (empates ficam na frente)."""
+        return bisect.bisect_left(self._sorted, (time_ms,)) + 1
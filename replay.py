@@ -0,0 +1,294 @@
+"""Replays: a entrada de uma partida gravada tick a tick num arquivo binário pequeno.
+
+A simulação (simulacao.Game) só depende da semente e da bitmask de entrada de cada
+tick, então guardar as duas basta para refazer a partida inteira, igual, em qualquer
+velocidade: sem janela na velocidade máxima da CPU (conferir tempos do ranking, usar
+partidas reais como carga no benchmark.py) ou na tela em tempo real.
+
+Formato (little-endian):
+    cabeçalho   magic "FJRP", versão, seed, impressão do nível (crc32), ticks, time_ms,
+                resultado, tamanho do nome da arma e do caminho do nível, nº de trechos
+    textos      arma e caminho do nível (utf-8)
+    trechos     (repetições, bitmask) por trecho: a entrada é guardada em RLE, e como
+                as teclas ficam seguradas por vários ticks um minuto de jogo ocupa
+                poucas centenas de bytes
+
+Exemplos:
+    python replay.py replays/ultima_partida.fjr               # refaz sem janela e confere o resultado
+    python replay.py replays/ultima_partida.fjr --vetorizado  # idem, com inimigos/tiros em arrays
+    python replay.py replays/ultima_partida.fjr --assistir    # mostra na tela em tempo real
+    python replay.py --verificar-ranking                      # refaz os replays do ranking
+"""
+import os
+import queue
+import re
+import struct
+import sys
+import threading
+import time
+
+from config import QUALITY, QUALITY_PRESETS, BACKEND, BACKENDS
+
+MAGIC = b"FJRP"
+VERSION = 1
+REPLAY_DIR = "replays"
+LAST_REPLAY = os.path.join(REPLAY_DIR, "ultima_partida.fjr")
+_HEADER = struct.Struct("<4sHqIIIBBHI")
+_RUN = struct.Struct("<HB")  # repetições (até 65535; trechos maiores viram vários), bitmask
+_MAX_RUN = 0xFFFF
+OUTCOMES = ("tempo_esgotado", "vitoria", "derrota")
+
+class Replay:
+    """Semente, nível, arma, resultado esperado e a entrada em trechos [bitmask, repetições]."""
+
+    def __init__(self, seed, level_path, level_fingerprint, weapon="simples", runs=None,
+                 ticks=0, time_ms=0, outcome="tempo_esgotado"):
+        self.seed = seed
+        self.level_path = level_path
+        self.level_fingerprint = level_fingerprint
+        self.weapon = weapon
+        self.runs = runs if runs is not None else []
+        self.ticks = ticks
+        self.time_ms = time_ms
+        self.outcome = outcome
+
+    def masks(self):
+        """Bitmask de cada tick, em ordem."""
+        for mask, count in self.runs:
+            for _ in range(count):
+                yield mask
+
+    # ----- arquivo -----
+    def to_bytes(self):
+        weapon = self.weapon.encode("utf-8")
+        level = self.level_path.replace(os.sep, "/").encode("utf-8")
+        runs = []
+        for mask, count in self.runs:
+            while count > 0:
+                part = min(count, _MAX_RUN)
+                runs.append(_RUN.pack(part, mask))
+                count -= part
+        header = _HEADER.pack(MAGIC, VERSION, self.seed, self.level_fingerprint, self.ticks, self.time_ms,
+                              OUTCOMES.index(self.outcome), len(weapon), len(level), len(runs))
+        return b"".join([header, weapon, level] + runs)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) < _HEADER.size:
+            raise ValueError("replay truncado ou corrompido")
+        (magic, version, seed, fingerprint, ticks, time_ms, outcome,
+         weapon_len, level_len, run_count) = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"formato de replay desconhecido ({magic!r}, versão {version})")
+        offset = _HEADER.size
+        weapon = data[offset:offset + weapon_len].decode("utf-8")
+        offset += weapon_len
+        level_path = data[offset:offset + level_len].decode("utf-8").replace("/", os.sep)
+        offset += level_len
+        if len(data) != offset + run_count * _RUN.size or outcome >= len(OUTCOMES):
+            raise ValueError("replay truncado ou corrompido")
+        runs = []
+        for count, mask in _RUN.iter_unpack(data[offset:]):
+            if runs and runs[-1][0] == mask:
+                runs[-1][1] += count
+            else:
+                runs.append([mask, count])
+        return cls(seed, level_path, fingerprint, weapon, runs, ticks, time_ms, OUTCOMES[outcome])
+
+    def save(self, path):
+        """Grava num temporário e troca pelo definitivo (nunca fica pela metade)."""
+        return write_file(path, self.to_bytes())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+def write_file(path, data):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+    return path
+
+# ===== Gravação =====
+class ReplayWriter:
+    """Grava replays numa thread separada (como o ranking.HighscoreStore): save() só
+    serializa, o que custa poucos bytes, e agenda a escrita; o loop do jogo não espera
+    pelo disco. close() espera a fila esvaziar."""
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._writer = threading.Thread(target=self._write_loop, name="replay-writer", daemon=True)
+        self._writer.start()
+
+    def save(self, replay, path):
+        """Agenda a gravação de 'replay' em 'path' e devolve 'path' na hora."""
+        self._queue.put((path, replay.to_bytes()))
+        return path
+
+    def _write_loop(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            path, data = item
+            try:
+                write_file(path, data)
+            except OSError as e:
+                print(f"Aviso: não foi possível salvar o replay {path}: {e}")
+            self._queue.task_done()
+
+    def flush(self):
+        """Bloqueia até tudo que foi agendado estar no disco."""
+        self._queue.join()
+
+    def close(self):
+        if self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+
+class Recorder:
+    """Acumula a bitmask de cada tick de uma partida (já em RLE)."""
+
+    def __init__(self, game):
+        self.seed = game.seed
+        self.level = game.level
+        self.weapon = game.weapon
+        self.runs = []
+
+    def record(self, mask):
+        runs = self.runs
+        if runs and runs[-1][0] == mask:
+            runs[-1][1] += 1
+        else:
+            runs.append([mask, 1])
+
+    def replay(self, game):
+        """Replay do que foi gravado, com o resultado em que 'game' terminou."""
+        return Replay(self.seed, self.level.path or "", self.level.fingerprint, self.weapon,
+                      [list(run) for run in self.runs], game.ticks, game.time_elapsed_ms, game.outcome)
+
+def replay_name(player, time_ms):
+    """Nome de arquivo para o replay de um tempo do ranking."""
+    safe = re.sub(r"[^0-9A-Za-z_-]+", "_", player).strip("_") or "anon"
+    return os.path.join(REPLAY_DIR, f"{time.strftime('%Y%m%d_%H%M%S')}_{safe}_{time_ms}.fjr")
+
+# ===== Reprodução =====
+class ReplayInput:
+    """Entrega as bitmasks do replay tick a tick (mesma interface do headless.ScriptedInput)."""
+
+    def __init__(self, replay):
+        self._masks = replay.masks()
+        self.remaining = sum(count for _, count in replay.runs)
+
+    @property
+    def done(self):
+        return self.remaining == 0
+
+    def next(self):
+        """Bitmask do próximo tick (0 depois do fim da gravação)."""
+        if self.remaining == 0:
+            return 0
+        self.remaining -= 1
+        return next(self._masks)
+
+def new_game(replay, vectorized=False):
+    """Game com a semente, o nível e a arma do replay (ValueError se o nível mudou)."""
+    from mundo import load_level
+    from simulacao import Game
+
+    level = load_level(replay.level_path)
+    if level.fingerprint != replay.level_fingerprint:
+        raise ValueError(f"o nível {replay.level_path} mudou desde a gravação do replay")
+    return Game(replay.seed, vectorized=vectorized, weapon=replay.weapon, level=level)
+
+def play(replay, vectorized=False):
+    """Refaz a partida sem janela, na velocidade máxima; devolve o Game no fim."""
+    game = new_game(replay, vectorized)
+    for mask in replay.masks():
+        if game.finished:
+            break
+        game.tick(mask)
+    return game
+
+def check(replay, game):
+    """Diferenças entre o que o replay diz e o que a partida refeita deu ([] = confere)."""
+    found = {"ticks": game.ticks, "time_ms": game.time_elapsed_ms, "resultado": game.outcome}
+    expected = {"ticks": replay.ticks, "time_ms": replay.time_ms, "resultado": replay.outcome}
+    return [f"{key}: esperado {expected[key]}, deu {found[key]}" for key in expected if expected[key] != found[key]]
+
+def verify_highscores(store):
+    """Refaz os replays do ranking e confere os tempos. Devolve (conferidos, falhas, sem replay)."""
+    ok, failed, missing = 0, 0, 0
+    for entry in store.top(None):
+        path = entry.get("replay")
+        label = f"{entry['name']} {entry['time_ms']} ms"
+        if not path:
+            missing += 1
+            continue
+        try:
+            replay = Replay.load(path)
+            game = play(replay)
+        except (OSError, ValueError) as e:
+            print(f"FALHOU  {label}: {e}")
+            failed += 1
+            continue
+        problems = check(replay, game)
+        if game.time_elapsed_ms != entry["time_ms"]:
+            problems.append(f"ranking diz {entry['time_ms']} ms, replay deu {game.time_elapsed_ms} ms")
+        if problems:
+            print(f"FALHOU  {label}: {'; '.join(problems)}")
+            failed += 1
+        else:
+            print(f"ok      {label}")
+            ok += 1
+    return ok, failed, missing
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description="Refaz partidas gravadas de Forest Jump.")
+    parser.add_argument("arquivo", nargs="?", default=LAST_REPLAY, help="replay (padrão: %(default)s)")
+    parser.add_argument("--assistir", action="store_true", help="mostra o replay na tela em tempo real")
+    parser.add_argument("--vetorizado", action="store_true", help="usa inimigos/tiros em arrays NumPy")
+    parser.add_argument("--qualidade", choices=list(QUALITY_PRESETS), default=QUALITY,
+                        help="preset de renderização ao assistir")
+    parser.add_argument("--backend", choices=BACKENDS, default=BACKEND, help="backend de desenho ao assistir")
+    parser.add_argument("--repeticoes", type=int, default=1, help="refaz a partida N vezes (mede ticks/s)")
+    parser.add_argument("--verificar-ranking", action="store_true", help="refaz os replays do ranking")
+    args = parser.parse_args(argv)
+
+    if args.assistir:
+        import fase1
+        fase1.watch_replay(Replay.load(args.arquivo), args.qualidade, args.backend)
+        return 0
+
+    from headless import init_headless  # driver de vídeo dummy: nada de janela
+    init_headless()
+
+    if args.verificar_ranking:
+        from ranking import HighscoreStore
+        store = HighscoreStore()
+        ok, failed, missing = verify_highscores(store)
+        store.close()
+        print(f"{ok} conferido(s), {failed} com falha, {missing} sem replay")
+        return 1 if failed else 0
+
+    replay = Replay.load(args.arquivo)
+    start = time.perf_counter()
+    for _ in range(max(1, args.repeticoes)):
+        game = play(replay, args.vetorizado)
+    elapsed = time.perf_counter() - start
+    ticks = game.ticks * max(1, args.repeticoes)
+    print(f"{args.arquivo}: seed {replay.seed}, {len(replay.runs)} trechos, {game.ticks} ticks, "
+          f"{game.time_elapsed_ms} ms, {game.outcome}")
+    print(f"{ticks / elapsed:.0f} ticks/s" if elapsed > 0 else "")
+    problems = check(replay, game)
+    for problem in problems:
+        print(f"DIFERENTE  {problem}")
+    return 1 if problems else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+"""Ponto de entrada do jogo: python roda_jogo.py
+
+Com --relatorio-inicio mostra quanto cada módulo leva para importar
+(python -X importtime) e o tempo até o primeiro frame, comparando com o orçamento
+STARTUP_BUDGET_MS do config.py (sai com erro se estourar).
+
+Com --qualidade alta|media|baixa escolhe um preset de config.QUALITY_PRESETS: nas
+máquinas mais fracas o mundo é desenhado numa resolução interna menor e ampliado.
+Com --backend superficie|textura|textura_software escolhe como o frame é desenhado
+(config.BACKENDS): blits de Surface ou texturas do SDL.
+"""
+import time
+
+_started = time.perf_counter()  # antes de qualquer import do jogo
+
+import json
+import subprocess
+import sys
+
+def import_times(module="fase1", top=12):
+    """Módulos mais caros de importar: lista de (cumulativo_ms, próprio_ms, nome)."""
+    out = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                         capture_output=True, text=True, check=True)
+    rows = []
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative) / 1000, int(own) / 1000, name[1:].rstrip()))
+    total = next((r[0] for r in rows if r[2] == module), 0.0)
+    return sorted(rows, reverse=True)[:top], total
+
+def first_frame_marks():
+    """Roda o jogo num processo novo até o primeiro frame e devolve os marcos (ms)."""
+    out = subprocess.run([sys.executable, __file__, "--ate-primeiro-frame"],
+                         capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+def startup_report():
+    from config import STARTUP_BUDGET_MS
+
+    rows, total = import_times()
+    print(f"Import do fase1: {total:.1f} ms")
+    print(f"  {'cumulativo':>10} {'próprio':>9}  módulo")
+    for cumulative, own, name in rows:
+        print(f"  {cumulative:8.1f}ms {own:7.1f}ms  {name}")
+
+    marks = first_frame_marks()
+    print("Inicialização (ms desde o início do processo):")
+    for name, ms in marks.items():
+        print(f"  {name:<16}{ms:8.1f}")
+    first = marks.get("primeiro_frame")
+    if first is None or first > STARTUP_BUDGET_MS:
+        print(f"ESTOUROU o orçamento de {STARTUP_BUDGET_MS} ms até o primeiro frame")
+        return 1
+    print(f"Dentro do orçamento de {STARTUP_BUDGET_MS} ms até o primeiro frame")
+    return 0
+
+def option_value(argv, name):
+    """Valor que vem depois de 'name' na linha de comando (None se a opção não veio)."""
+    if name not in argv:
+        return None
+    i = argv.index(name)
+    return argv[i + 1] if i + 1 < len(argv) else ""
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if "--relatorio-inicio" in argv:
+        return startup_report()
+    from config import QUALITY, QUALITY_PRESETS, BACKEND, BACKENDS
+    quality = option_value(argv, "--qualidade") or QUALITY
+    if quality not in QUALITY_PRESETS:
+        print(f"Qualidade desconhecida: {quality!r} (use {', '.join(QUALITY_PRESETS)})")
+        return 2
+    backend = option_value(argv, "--backend") or BACKEND
+    if backend not in BACKENDS:
+        print(f"Backend desconhecido: {backend!r} (use {', '.join(BACKENDS)})")
+        return 2
+    import fase1
+    if "--ate-primeiro-frame" in argv:
+        print(json.dumps(fase1.main(_started, exit_after_first_frame=True, quality=quality, backend=backend)))
+        return 0
+    fase1.main(_started, quality=quality, backend=backend)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
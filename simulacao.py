@@ -0,0 +1,344 @@
+import pygame
+import random
+
+from config import WIDTH, HEIGHT, ticks_to_ms
+from entidades import Camera, Player, BulletPool, BULLET_POOL_CAPACITY, PLAYER_JUMP, INVULN_MS, save_previous
+from espacial import SpatialHash, span_rect
+from mundo import LevelStream, load_level, ACTIVE_MARGIN, SLEEP_MARGIN, REGION_CHECK_TICKS, ENEMY_SPEED
+
+# ===== Entrada por tick (bitmask) =====
+# Esquerda/direita valem enquanto a tecla está segurada; pulo e tiro são "toques"
+# e só valem no tick em que foram pressionados.
+INPUT_LEFT = 1
+INPUT_RIGHT = 2
+INPUT_JUMP = 4
+INPUT_SHOOT = 8
+
+INPUT_NAMES = {"LEFT": INPUT_LEFT, "RIGHT": INPUT_RIGHT, "JUMP": INPUT_JUMP, "SHOOT": INPUT_SHOOT}
+
+# ===== Ajustes de balanceamento =====
+# Valores do jogo; Game(tuning={...}) troca qualquer um deles só naquela partida
+# (lote.py varre combinações deles em paralelo).
+DEFAULT_TUNING = {
+    "enemy_speed": ENEMY_SPEED,  # px por tick da patrulha dos inimigos
+    "jump": PLAYER_JUMP,         # velocidade inicial do pulo (negativa = para cima)
+    "invuln_ms": INVULN_MS,      # invulnerabilidade depois de tomar dano
+}
+
+def new_seed():
+    """Semente nova para uma partida (guardada no replay, que a refaz igual)."""
+    return random.getrandbits(32)
+
+# ===== Armas =====
+# velocidade vertical de cada tiro de um disparo
+WEAPONS = {
+    "simples": (0,),
+    "espalhado": (-2, 0, 2),
+}
+
+def input_from_keys(keys, jump_pressed=False, shot_pressed=False):
+    """Monta a bitmask do tick a partir de pygame.key.get_pressed() e dos toques pendentes."""
+    mask = 0
+    if keys[pygame.K_LEFT]:
+        mask |= INPUT_LEFT
+    if keys[pygame.K_RIGHT]:
+        mask |= INPUT_RIGHT
+    if jump_pressed:
+        mask |= INPUT_JUMP
+    if shot_pressed:
+        mask |= INPUT_SHOOT
+    return mask
+
+# ===== Estado de uma partida =====
+class Game:
+    """Estado completo de uma partida e o passo de simulação (sem janela, sem som).
+
+    tick() devolve os sons que o tick gerou ("pulo", "tiro", "golpe"); quem desenha
+    e toca áudio é o fase1.py (ou ninguém, no modo headless).
+
+    Com vectorized=True (precisa de numpy) inimigos e tiros vivem em arrays
+    (vetorizado.py) e são atualizados em lote; o resultado é o mesmo do modo comum.
+
+    A partida depende só da semente ('seed'; sem ela uma nova é sorteada e fica em
+    self.seed) e da bitmask de cada tick: replay.py grava as duas e refaz a partida.
+
+    Se 'profiler' (perfil.FrameProfiler) for definido, cada tick marca o tempo das
+    fases player, contato, inimigos e tiros nele.
+
+    O mapa vem de 'level' (mundo.Level; padrão niveis/fase1.json) e é carregado em
+    chunks ao redor da câmera: orbes e plataformas de chunks longe da tela não estão
+    nos índices espaciais. Só os inimigos da região ativa (a tela mais ACTIVE_MARGIN
+    de cada lado) ficam em self.enemies e são atualizados, testados e desenhados; os
+    outros dormem no LevelStream e, ao acordar, pulam para onde a patrulha os levaria.
+    """
+
+    def __init__(self, seed=None, vectorized=False, weapon="simples", bullet_capacity=None, level=None,
+                 tuning=None):
+        if vectorized:
+            # numpy só é importado quando o modo vetorizado é pedido
+            from vetorizado import NUMPY_AVAILABLE
+            if not NUMPY_AVAILABLE:
+                print("Aviso: numpy não está instalado; usando entidades comuns")
+                vectorized = False
+        self.vectorized = vectorized
+        self.level = level if level is not None else load_level()
+        self.weapon = weapon
+        unknown = set(tuning or ()) - set(DEFAULT_TUNING)
+        if unknown:
+            raise ValueError(f"ajuste desconhecido: {', '.join(sorted(unknown))}")
+        self.tuning = {**DEFAULT_TUNING, **(tuning or {})}
+        self.seed = new_seed() if seed is None else seed
+        self.profiler = None
+        # pool de tiros pré-alocado uma vez por Game e reaproveitado entre partidas
+        capacity = bullet_capacity or BULLET_POOL_CAPACITY
+        if vectorized:
+            from vetorizado import BulletArrays
+            self.bullets = BulletArrays(capacity, self.level.width)
+        else:
+            self.bullets = BulletPool(capacity, self.level.width)
+        self.rng = random.Random(self.seed)
+        self.total_orbs = self.level.total_orbs
+        self.reset()
+
+    def reset(self, seed=None):
+        """Começa uma partida nova; com 'seed', o sorteio do mapa recomeça dessa semente."""
+        if seed is not None:
+            self.seed = seed
+            self.rng.seed(seed)
+        level = self.level
+        # recriar player e câmera
+        tuning = self.tuning
+        self.player = Player(*level.player_start, map_width=level.width, jump=tuning["jump"],
+                             invuln_duration=tuning["invuln_ms"])
+        self.cam = Camera(WIDTH, HEIGHT, map_width=level.width)
+        self.collected_orbs = 0
+        # chunks do nível perto da câmera: plataformas, paredes e orbes entram e saem dos
+        # índices espaciais; inimigos começam dormindo e acordam na região ativa
+        self.stream = LevelStream(level, self.rng, enemy_speed=tuning["enemy_speed"])
+        self.platform_grid = self.stream.platform_grid
+        self.wall_grid = self.stream.wall_grid
+        self.orb_grid = self.stream.orb_grid
+        self.enemies = []
+        if self.vectorized:
+            from vetorizado import EnemyArrays
+            self.enemy_store = EnemyArrays(self.enemies)
+        else:
+            self.enemy_grid = SpatialHash(level.width)
+        # limpar tiros
+        self.bullets.clear()
+        self.enemies_defeated = 0
+        # reset flags e timer
+        self.game_over = False
+        self.game_won = False
+        self.ticks = 0
+        self.sim_time_ms = 0
+        self.time_elapsed_ms = 0
+        # acorda os inimigos que já começam perto da câmera
+        self._update_active_region()
+
+    def add_enemies(self, enemies):
+        """Acrescenta inimigos à partida atual (usado para cenários de carga no benchmark)."""
+        if self.vectorized:
+            # as views precisam estar em dia antes de remontar os arrays
+            self._sync_enemy_views()
+            self.enemies.extend(enemies)
+            self._rebuild_enemy_store()
+        else:
+            self.enemies.extend(enemies)
+            for enemy in enemies:
+                self.enemy_grid.insert(enemy)
+
+    def _sync_enemy_views(self):
+        for i in range(len(self.enemy_store.views)):
+            self.enemy_store.sync(i)
+
+    def _rebuild_enemy_store(self):
+        from vetorizado import EnemyArrays
+        self.enemy_store = EnemyArrays(self.enemies)
+
+    def active_span(self, margin=ACTIVE_MARGIN):
+        """Colunas do mapa da região ativa: a tela mais 'margin' px de cada lado."""
+        cam_x = int(self.cam.x)
+        return cam_x - margin, cam_x + WIDTH + margin
+
+    def _update_active_region(self):
+        """Acompanha a câmera: carrega os chunks perto dela e, a cada REGION_CHECK_TICKS,
+        acorda quem a patrulha trouxe para a região ativa e põe para dormir quem saiu.
+        Custa o que há perto da câmera, não o mapa todo."""
+        stream = self.stream
+        stream.update(self.cam.x)
+        if self.ticks % REGION_CHECK_TICKS:
+            return
+        left, right = self.active_span()
+        woken = stream.wake(left, right, self.ticks)
+        left, right = self.active_span(SLEEP_MARGIN)
+        if self.vectorized:
+            drowsy = self.enemy_store.outside(left, right)
+        else:
+            drowsy = [e for e in self.enemies if e.rect.right < left or e.rect.left > right]
+        if not (woken or drowsy):
+            return
+        stream.sleep(drowsy, self.ticks)
+        if self.vectorized:
+            self._sync_enemy_views()  # os arrays vão ser remontados a partir das views
+        if drowsy:
+            gone = {id(enemy) for enemy in drowsy}
+            self.enemies = [enemy for enemy in self.enemies if id(enemy) not in gone]
+        self.enemies.extend(woken)
+        if self.vectorized:
+            self._rebuild_enemy_store()
+        else:
+            for enemy in drowsy:
+                self.enemy_grid.remove(enemy)
+            for enemy in woken:
+                self.enemy_grid.insert(enemy)
+
+    @property
+    def finished(self):
+        return self.game_over or self.game_won
+
+    @property
+    def outcome(self):
+        """"vitoria", "derrota" ou "tempo_esgotado" (partida ainda sem fim)."""
+        if self.game_won:
+            return "vitoria"
+        if self.game_over:
+            return "derrota"
+        return "tempo_esgotado"
+
+    def enemies_between(self, left, right):
+        """Inimigos vivos entre as colunas left e right do mapa (para desenhar só o que está perto)."""
+        if self.vectorized:
+            return self.enemy_store.between(left, right)
+        return self.enemy_grid.query(span_rect(left, right))
+
+    def orbs_between(self, left, right):
+        return self.orb_grid.query(span_rect(left, right))
+
+    def bullets_between(self, left, right):
+        if self.vectorized:
+            return self.bullets.between(left, right)
+        return [b for b in self.bullets if not (b.rect.right < left or b.rect.left > right)]
+
+    def bullet_stats(self):
+        """Ocupação do pool de tiros: capacidade, em uso, pico, disparos e overflow."""
+        return self.bullets.stats()
+
+    def tick(self, inputs):
+        """Avança a simulação em um tick com a bitmask de entrada 'inputs'."""
+        sounds = []
+        if self.finished:
+            return sounds
+        player = self.player
+
+        save_previous(player)
+        self.cam.save_previous()
+        if self.vectorized:
+            self.enemy_store.save_previous()
+            self.bullets.save_previous()
+        else:
+            for enemy in self.enemies:
+                save_previous(enemy)
+            for bullet in self.bullets:
+                save_previous(bullet)
+
+        self.ticks += 1
+        self.sim_time_ms = ticks_to_ms(self.ticks)
+        # atualiza timer crescente
+        self.time_elapsed_ms = self.sim_time_ms
+
+        if inputs & INPUT_JUMP:
+            player.jump_action()
+            sounds.append("pulo")
+        if inputs & INPUT_SHOOT:
+            bx = player.rect.centerx + (player.facing * 30)
+            by = player.rect.centery
+            for vy in WEAPONS[self.weapon]:
+                self.bullets.spawn(bx, by, player.facing, vy)
+            sounds.append("tiro")
+
+        keys = {pygame.K_LEFT: bool(inputs & INPUT_LEFT), pygame.K_RIGHT: bool(inputs & INPUT_RIGHT)}
+        # só as plataformas/paredes ao alcance do jogador neste tick
+        reach = player.reach_rect()
+        player.update(keys, self.platform_grid.query(reach), self.wall_grid.query(reach), self.sim_time_ms)
+        self.cam.update(player.rect, player.vx)
+        self._update_active_region()
+        prof = self.profiler
+        if prof is not None:
+            prof.lap("player")
+
+        # Checa colisão jogador <-> orbes (removendo ao coletar)
+        for orb in self.orb_grid.query(player.rect):
+            self.stream.collect(orb)
+            self.collected_orbs += 1
+
+        # inimigo <-> jogador: aplica dano apenas se não estiver invulnerável
+        if self._enemy_touching(player.rect):
+            damaged = player.take_damage(self.sim_time_ms)
+            if damaged:
+                sounds.append("golpe")
+                if player.lives <= 0:
+                    self.game_over = True
+                else:
+                    player.vy = 0
+        if prof is not None:
+            prof.lap("contato")
+
+        # atualiza inimigos (só os acordados, que são os da região ativa)
+        if self.vectorized:
+            self._tick_arrays()
+        else:
+            self._tick_objects()
+
+        # Checa vitória ao coletar todas as orbes
+        if self.collected_orbs >= self.total_orbs and not self.game_won:
+            self.game_won = True
+
+        return sounds
+
+    def _enemy_touching(self, rect):
+        if self.vectorized:
+            return self.enemy_store.first_overlap(rect) is not None
+        return any(enemy.alive for enemy in self.enemy_grid.query(rect))
+
+    def _tick_arrays(self):
+        prof = self.profiler
+        self.enemy_store.update()
+        if prof is not None:
+            prof.lap("inimigos")
+        killed = self.bullets.step(self.enemy_store)
+        if killed:
+            self.enemy_store.kill(killed)
+            self.enemies_defeated += len(killed)
+            self.enemies = [e for e in self.enemies if not e.dead_finished]
+        if prof is not None:
+            prof.lap("tiros")
+
+    def _tick_objects(self):
+        prof = self.profiler
+        for enemy in self.enemies:
+            if hasattr(enemy, "dead_finished") and enemy.dead_finished:
+                continue
+            enemy.update()
+            self.enemy_grid.move(enemy)
+        if prof is not None:
+            prof.lap("inimigos")
+
+        # tiros vs inimigos: mata imediatamente (sem animação death por enquanto)
+        for bullet in self.bullets:
+            bullet.update()
+            for enemy in self.enemy_grid.query(bullet.rect):
+                if getattr(enemy, "alive", True):
+                    # marca como morto para ambos tipos de inimigo
+                    if hasattr(enemy, "start_death"):
+                        enemy.start_death()
+                    else:
+                        enemy.alive = False
+                    self.enemy_grid.remove(enemy)
+                    bullet.alive = False
+                    self.enemies_defeated += 1
+
+        self.bullets.collect()
+        self.enemies = [e for e in self.enemies if not (hasattr(e, "dead_finished") and e.dead_finished)]
+        if prof is not None:
+            prof.lap("tiros")
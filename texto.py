@@ -0,0 +1,75 @@
+from collections import OrderedDict
+
+import pygame
+
+from assets import normalize_surface
+
+# ===== Cache de textos renderizados =====
+# font.render() rasteriza a string inteira toda vez. Como quase todo texto do jogo se
+# repete de um frame para o outro, guardamos as superfícies prontas (LRU) pela chave
+# (fonte, texto, cor, antialias).
+class TextCache:
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surf = self._surfaces.get(key)
+        if surf is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surf
+        self.misses += 1
+        surf = normalize_surface(font.render(text, antialias, color))  # já no formato da tela
+        self._surfaces[key] = surf
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)  # descarta o usado há mais tempo
+        return surf
+
+    def clear(self):
+        self._surfaces.clear()
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "entries": len(self._surfaces)}
+
+text_cache = TextCache()
+
+# ===== Atlas de glifos (timer) =====
+class GlyphAtlas:
+    """Glifos pré-renderizados (dígitos e ':') para compor textos que mudam todo frame.
+
+    O prefixo fixo (ex.: "Tempo: ") vem do text_cache; cada caractere do resto é
+    uma superfície pronta, então desenhar o timer não rasteriza nada.
+    """
+
+    def __init__(self, font, color, chars="0123456789:"):
+        self.font = font
+        self.color = color
+        self.glyphs = {ch: normalize_surface(font.render(ch, True, color)) for ch in chars}
+        self.height = font.get_height()
+
+    def sprites(self, pos, text, prefix=""):
+        """Lista de (superfície, posição) que compõe prefix + text a partir de 'pos'."""
+        x, y = pos
+        result = []
+        if prefix:
+            surf = text_cache.render(self.font, prefix, self.color)
+            result.append((surf, (x, y)))
+            x += surf.get_width()
+        for ch in text:
+            glyph = self.glyphs.get(ch)
+            if glyph is None:
+                glyph = text_cache.render(self.font, ch, self.color)
+            result.append((glyph, (x, y)))
+            x += glyph.get_width()
+        return result
+
+    def draw(self, surface, pos, text, prefix=""):
+        """Desenha prefix + text em 'pos' (um blits só) e devolve o retângulo ocupado."""
+        area = pygame.Rect(pos, (0, self.height))
+        for rect in surface.blits(self.sprites(pos, text, prefix)):
+            area.union_ip(rect)
+        return area
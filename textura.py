@@ -0,0 +1,261 @@
+"""Backend de desenho com texturas do SDL (pygame._sdl2.video: Renderer/Texture).
+
+O backend padrão ("superficie", desenho.WorldRenderer) copia pixels com blits de
+Surface na CPU. Aqui cada superfície desenhada (frames dos sprites, carimbos, glifos,
+pedaços da camada estática) é enviada ao SDL como textura uma vez só, e o frame é
+montado com cópias de textura: com GPU quem copia é ela; sem GPU o SDL usa o
+renderer de software dele, com a mesma interface.
+
+O SDL não deixa uma janela ter ao mesmo tempo a superfície do pygame.display e um
+Renderer, e convert()/convert_alpha() precisam de um modo de vídeo. Por isso
+TextureDisplay abre um modo de vídeo de 1x1 escondido (como headless.init_headless),
+só para o formato dos pixels, e uma janela própria para o Renderer. As telas fora da
+partida (inicial, lobby, créditos) continuam desenhadas em software, numa superfície
+que update() envia para a janela.
+"""
+import pygame
+from pygame._sdl2 import video
+from pygame._sdl2.sdl2 import error as SDLError  # não herda de pygame.error
+
+from desenho import WALL_COLOR, build_static_chunk, queue_world_sprites
+from mundo import load_level
+
+MAX_TEXTURES = 2048  # acima disso o cache de texturas é esvaziado (textos que não voltam mais)
+
+def open_renderer(window, software=False):
+    """Renderer acelerado se houver; senão (ou com software=True) o de software do SDL.
+
+    Devolve (renderer, acelerado)."""
+    if not software:
+        try:
+            return video.Renderer(window, accelerated=1), True
+        except SDLError:
+            pass
+    return video.Renderer(window, accelerated=0), False
+
+# ===== Janela =====
+class TextureDisplay:
+    """Janela com um Renderer do SDL e a parte da interface de pygame.display que o
+    jogo usa (get_surface/update), para as telas que desenham numa Surface."""
+
+    def __init__(self, size, title="Forest Jump", software=False, hidden=False):
+        pygame.display.init()
+        if pygame.display.get_surface() is None:
+            pygame.display.set_mode((1, 1), pygame.HIDDEN)  # só para convert()/convert_alpha()
+        self.size = tuple(size)
+        self.window = video.Window(title, self.size, hidden=hidden)
+        self.renderer, self.accelerated = open_renderer(self.window, software)
+        self.surface = pygame.Surface(self.size).convert()
+        self._screen = video.Texture(self.renderer, self.size, streaming=True)
+
+    def get_surface(self):
+        return self.surface
+
+    def update(self, rects=None):
+        """Envia a superfície (inteira ou só os retângulos 'rects') e mostra o frame."""
+        if rects is None:
+            self._screen.update(self.surface)
+        else:
+            bounds = self.surface.get_rect()
+            for rect in rects:
+                rect = pygame.Rect(rect).clip(bounds)
+                if rect.width and rect.height:
+                    self._screen.update(self.surface.subsurface(rect), rect)
+        self._screen.draw()
+        self.present()
+
+    flip = update
+
+    def present(self):
+        # com a janela de formato aberta, fechar esta não gera QUIT sozinho no SDL
+        if pygame.event.get(pygame.WINDOWCLOSE):
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+        self.renderer.present()
+
+# ===== Texturas =====
+class TextureCache:
+    """Uma textura por superfície, enviada na primeira vez que ela é desenhada.
+
+    A chave é id(superfície) e a própria superfície fica guardada junto, então o id
+    não é reaproveitado por outra enquanto a entrada existir."""
+
+    def __init__(self, renderer, max_entries=MAX_TEXTURES):
+        self.renderer = renderer
+        self.max_entries = max_entries
+        self._textures = {}
+        self.uploads = 0
+
+    def get(self, surface):
+        entry = self._textures.get(id(surface))
+        if entry is None:
+            if len(self._textures) >= self.max_entries:
+                self._textures.clear()
+            entry = self._textures[id(surface)] = (surface, video.Texture.from_surface(self.renderer, surface))
+            self.uploads += 1
+        return entry[1]
+
+    def preload(self, surfaces):
+        for surface in surfaces:
+            self.get(surface)
+
+    def __len__(self):
+        return len(self._textures)
+
+def cached_frames():
+    """Todos os frames do cache de animações (assets.py): jogador, slime, cogumelo..."""
+    from assets import animation_cache_items
+    for _, frames in animation_cache_items():
+        yield from frames
+
+# ===== Renderizador =====
+class TextureRenderer:
+    """Mesma interface de desenho.WorldRenderer, desenhando com cópias de textura.
+
+    Os frames que já estão no cache de animações são enviados como texturas na
+    criação; o resto (carimbos, glifos do HUD) na primeira vez que aparece. Cada
+    chunk da camada estática vira uma textura e, como copiar texturas é barato,
+    todo frame é redesenhado inteiro (sem dirty rects).
+
+    O que o jogo ainda desenha numa Surface (telas de fim de partida, overlay do F3)
+    vai para 'window', uma superfície transparente do tamanho da tela: os retângulos
+    passados a add() (ou a tela toda, depois de invalidate()) são enviados para uma
+    textura que fica por cima de tudo.
+
+    render_scale/upscale de config.QUALITY_PRESETS não se aplicam aqui: a ampliação
+    serve para economizar blits em software, e as cópias de textura já escalam.
+    """
+
+    def __init__(self, display, background, level=None, preload=True):
+        self.display = display
+        self.renderer = display.renderer
+        self.background = background
+        self.level = level if level is not None else load_level()
+        self.screen_rect = pygame.Rect((0, 0), display.size)
+        self.textures = TextureCache(self.renderer)
+        if preload:
+            self.textures.preload(cached_frames())
+        self._chunks = {}  # índice do chunk -> textura da camada estática dele
+        self._queue = []
+        self._cam_pos = (0, 0)
+        self._map_x = 0
+
+        self.window = pygame.Surface(display.size, pygame.SRCALPHA)
+        self._overlay = video.Texture(self.renderer, display.size, streaming=True)
+        self._overlay.blend_mode = 1  # SDL_BLENDMODE_BLEND
+        self._overlay_full = False
+        self._overlay_rects = []
+        self._overlay_stale = []  # retângulos da textura com conteúdo de frames anteriores (None = tudo)
+
+        self.blit_calls = 0   # cópias de textura neste frame
+        self.sprites = 0
+        self.last_blit_calls = 0
+        self.last_sprites = 0
+        self.last_update_area = self.screen_rect.width * self.screen_rect.height
+
+    def invalidate(self):
+        """Algo foi desenhado na tela toda de 'window' neste frame (fim de partida...)."""
+        self._overlay_full = True
+
+    def add(self, rect):
+        """Registra um retângulo desenhado em 'window' neste frame (overlay do F3...)."""
+        if rect is not None and rect.width and rect.height:
+            self._overlay_rects.append(rect.clip(self.screen_rect))
+
+    def begin(self, view):
+        self._map_x = int(view.x)
+        self._cam_pos = (int(view.x), int(view.y))
+        self.blit_calls = self.sprites = 0
+        self.renderer.draw_color = (0, 0, 0, 255)
+        self.renderer.clear()
+        self._draw_static(pygame.Rect(self._cam_pos, self.screen_rect.size))
+        self._drop_far_chunks(self._cam_pos[0])
+
+    def _static_chunk(self, index):
+        texture = self._chunks.get(index)
+        if texture is None:
+            layer = build_static_chunk(self.level, index, self.background)
+            texture = self._chunks[index] = video.Texture.from_surface(self.renderer, layer)
+        return texture
+
+    def _draw_static(self, area):
+        cw = self.level.chunk_width
+        first = max(0, area.left // cw)
+        last = min(self.level.chunk_count - 1, (area.right - 1) // cw)
+        for index in range(first, last + 1):
+            x0 = index * cw
+            part = area.clip(pygame.Rect(x0, area.top, cw, area.height))
+            if part.width:
+                self._static_chunk(index).draw(part.move(-x0, 0), part.move(-area.left, -area.top))
+                self.blit_calls += 1
+
+    def _drop_far_chunks(self, cam_x):
+        cw = self.level.chunk_width
+        first = cam_x // cw - 1
+        last = (cam_x + self.screen_rect.width) // cw + 1
+        for index in [i for i in self._chunks if i < first or i > last]:
+            del self._chunks[index]
+
+    def queue(self, surface, pos):
+        self._queue.append((surface, pos))
+
+    def queue_many(self, items):
+        self._queue.extend(items)
+
+    def flush(self):
+        """Copia as texturas da lista acumulada, na ordem."""
+        queue = self._queue
+        texture = self.textures.get
+        for surface, pos in queue:
+            texture(surface).draw(None, pos)
+        self.blit_calls += len(queue)
+        self.sprites += len(queue)
+        queue.clear()
+
+    def draw_walls(self):
+        """Paredes por cima dos sprites (na camada estática elas são retângulos lisos)."""
+        cx, cy = self._cam_pos
+        self.renderer.draw_color = (*WALL_COLOR, 255)
+        for wall in self.level.walls_between(self._map_x, self._map_x + self.screen_rect.width):
+            rect = pygame.Rect(wall).move(-cx, -cy).clip(self.screen_rect)
+            if rect.width and rect.height:
+                self.renderer.fill_rect(rect)
+
+    def draw_game(self, game, view, alpha=1.0):
+        """Orbes, inimigos, tiros, jogador e paredes de uma partida (simulacao.Game)."""
+        queue_world_sprites(self._queue, game, view, alpha)
+        self.flush()
+        self.draw_walls()
+
+    def _draw_overlay(self):
+        """Envia para a textura de cima o que foi desenhado em 'window' e limpa a superfície."""
+        if not self._overlay_full and not self._overlay_rects:
+            return
+        stale = self._overlay_stale
+        if self._overlay_full or stale is None:
+            self._overlay.update(self.window)
+        else:
+            # o que sobrou de frames anteriores também vai: já está transparente em 'window'
+            for rect in stale + self._overlay_rects:
+                self._overlay.update(self.window.subsurface(rect), rect)
+        self._overlay.draw()
+        self.blit_calls += 1
+        if self._overlay_full:
+            self.window.fill((0, 0, 0, 0))
+            self._overlay_stale = None
+        else:
+            for rect in self._overlay_rects:
+                self.window.fill((0, 0, 0, 0), rect)
+            self._overlay_stale = self._overlay_rects
+        self._overlay_full = False
+        self._overlay_rects = []
+
+    def stats_line(self):
+        kind = "GPU" if self.display.accelerated else "software"
+        return (f"texturas ({kind}): {self.last_blit_calls} cópias  {self.last_sprites} sprites  "
+                f"{len(self.textures)} texturas  {self.textures.uploads} envios")
+
+    def present(self):
+        self.flush()
+        self._draw_overlay()
+        self.last_blit_calls, self.last_sprites = self.blit_calls, self.sprites
+        self.display.present()
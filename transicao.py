@@ -0,0 +1,75 @@
+import pygame
+
+# ===== Overlays reutilizáveis =====
+# Uma superfície sólida por (tamanho, cor), criada uma vez só. A transparência é
+# aplicada com set_alpha() (alpha por superfície), então escurecer a tela não aloca
+# nada e o blit é mais barato que o de uma superfície SRCALPHA.
+_overlays = {}
+
+def get_overlay(size, color=(0, 0, 0)):
+    key = (tuple(size), tuple(color))
+    surf = _overlays.get(key)
+    if surf is None:
+        surf = pygame.Surface(size).convert()
+        surf.fill(color)
+        _overlays[key] = surf
+    return surf
+
+def get_alpha_overlay(size, color, alpha):
+    """Versão com alfa por pixel (refeita só quando o alpha muda)."""
+    key = (tuple(size), tuple(color), "alfa")
+    entry = _overlays.get(key)
+    if entry is None or entry[0] != alpha:
+        surf = entry[1] if entry is not None else pygame.Surface(size, pygame.SRCALPHA)
+        surf.fill((*color, alpha))
+        entry = _overlays[key] = (alpha, surf)
+    return entry[1]
+
+def draw_overlay(surface, alpha, color=(0, 0, 0)):
+    """Escurece 'surface' inteira com a cor e a transparência pedidas."""
+    if surface.get_flags() & pygame.SRCALPHA:
+        # destino com alfa por pixel (ex.: a camada de cima do textura.TextureRenderer): com
+        # set_alpha() o destino ficaria opaco, então a mistura usa alfa por pixel
+        return surface.blit(get_alpha_overlay(surface.get_size(), color, alpha), (0, 0))
+    overlay = get_overlay(surface.get_size(), color)
+    overlay.set_alpha(alpha)
+    return surface.blit(overlay, (0, 0))
+
+# ===== Fade por tempo (não bloqueante) =====
+class Fade:
+    """Transição de alpha que avança com o relógio, sem travar o loop.
+
+    Quem chama decide o relógio (ms): start(now) começa, draw(surface, now)
+    desenha o passo atual e done(now) diz se já chegou no alpha final.
+    """
+
+    def __init__(self, start_alpha=0, end_alpha=180, duration_ms=720, color=(0, 0, 0)):
+        self.start_alpha = start_alpha
+        self.end_alpha = end_alpha
+        self.duration_ms = duration_ms
+        self.color = color
+        self.started_at = None
+
+    @property
+    def started(self):
+        return self.started_at is not None
+
+    def start(self, now):
+        self.started_at = now
+
+    def stop(self):
+        self.started_at = None
+
+    def alpha(self, now):
+        if self.started_at is None:
+            return self.start_alpha
+        if self.duration_ms <= 0:
+            return self.end_alpha
+        t = min(max((now - self.started_at) / self.duration_ms, 0.0), 1.0)
+        return int(self.start_alpha + (self.end_alpha - self.start_alpha) * t)
+
+    def done(self, now):
+        return self.started_at is not None and now - self.started_at >= self.duration_ms
+
+    def draw(self, surface, now):
+        return draw_overlay(surface, self.alpha(now), self.color)
@@ -0,0 +1,154 @@
+"""Verificações de consistência dos atalhos que a simulação usa no lugar do caminho lento.
+
+Um inimigo que dorme longe da câmera (mundo.LevelStream) acorda com fast_forward(),
+que calcula de uma vez (entidades.patrol_position e advance_animation) onde a
+patrulha e a animação estariam. Aqui isso é comparado com chamar update() tick a
+tick, para várias velocidades (inclusive 0), trechos de patrulha (inclusive os que
+não são múltiplos da velocidade), posições e direções iniciais.
+
+Os replays (replay.Replay) são conferidos indo e voltando pelo formato binário
+(to_bytes/from_bytes), inclusive trechos maiores que um registro do arquivo, e
+partidas gravadas são refeitas a partir dos bytes com o mesmo resultado.
+
+Exemplos:
+    python verifica.py          # roda tudo; sai com erro se algo divergir
+"""
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import argparse
+import sys
+
+import pygame
+
+SPEEDS = (0, 1, 2, 3, 5, 7)
+CHECK_TICKS = tuple(range(0, 120)) + (199, 200, 201, 333, 1000, 4321)
+
+# ===== Patrulha e animação (fast_forward x update) =====
+def _enemy_cases():
+    """(descrição, função que cria o inimigo) para cada combinação testada."""
+    from entidades import Enemy, GroundEnemy
+    cases = []
+    # plataformas de larguras variadas: a patrulha tem (largura - 45 - 8) px
+    for width in (53, 54, 60, 97, 200, 331):
+        platform = pygame.Rect(300, 400, width, 20)
+        left, right = platform.left + 4, platform.right - 45 - 4
+        for speed in SPEEDS:
+            for start_x in sorted({left, right, (left + right) // 2, min(right, left + 1)}):
+                for direction in (-1, 1):
+                    cases.append((f"Enemy largura={width} speed={speed} x={start_x} dir={direction}",
+                                  lambda p=platform, s=speed, x=start_x, d=direction:
+                                  Enemy(p, speed=s, start_x=x, direction=d)))
+    for patrol in ((100, 146), (100, 150), (100, 411)):
+        for speed in SPEEDS:
+            for x_center in sorted({patrol[0] + 22, patrol[1] - 23, sum(patrol) // 2}):
+                for direction in (-1, 1):
+                    cases.append((f"GroundEnemy trecho={patrol} speed={speed} cx={x_center} dir={direction}",
+                                  lambda p=patrol, s=speed, c=x_center, d=direction:
+                                  GroundEnemy(c, 600, speed=s, direction=d, patrol=p)))
+    return cases
+
+def _state(enemy):
+    return enemy.rect.x, enemy.direction, enemy.frame_index, enemy.animation_timer
+
+def check_fast_forward(ticks=CHECK_TICKS):
+    """Lista de divergências entre fast_forward(n) e n chamadas de update()."""
+    failures = []
+    last = max(ticks)
+    wanted = set(ticks)
+    for label, make in _enemy_cases():
+        stepped = make()
+        for n in range(last + 1):
+            if n in wanted:
+                jumped = make()
+                jumped.fast_forward(n)
+                if _state(jumped) != _state(stepped):
+                    failures.append(f"{label} ticks={n}: fast_forward {_state(jumped)} != update {_state(stepped)}")
+                    break
+            stepped.update()
+    return failures
+
+# ===== Replays (to_bytes x from_bytes) =====
+def _replay_fields(replay):
+    return (replay.seed, replay.level_path, replay.level_fingerprint, replay.weapon,
+            replay.ticks, replay.time_ms, replay.outcome, list(replay.masks()))
+
+def _recorded_replays(seeds, max_ticks):
+    """Partidas jogadas com o roteiro do headless.py e gravadas pelo replay.Recorder."""
+    from headless import DEFAULT_SCRIPT, ScriptedInput, parse_script
+    from replay import Recorder
+    from simulacao import Game, INPUT_SHOOT
+
+    for seed in seeds:
+        game = Game(seed, weapon="espalhado" if seed % 2 else "simples")
+        recorder = Recorder(game)
+        inputs = ScriptedInput(parse_script(DEFAULT_SCRIPT))
+        while not game.finished and game.ticks < max_ticks:
+            mask = inputs.next() | (INPUT_SHOOT if game.ticks % 7 == 0 else 0)
+            recorder.record(mask)
+            game.tick(mask)
+        yield f"partida seed={seed}", recorder.replay(game)
+
+def check_replay_roundtrip(seeds=range(4), max_ticks=3000):
+    """Lista de divergências entre um replay e ele mesmo depois de to_bytes/from_bytes."""
+    from replay import Replay, OUTCOMES, check, play
+
+    level = os.path.join("niveis", "fase1.json")
+    cases = [
+        ("vazio", Replay(0, level, 0)),
+        ("trechos maiores que 65535", Replay(2 ** 40, level, 0xFFFFFFFF, "espalhado",
+                                             [[0, 70000], [9, 1], [0, 131071], [3, 65535], [3, 1]], 266608, 4443466)),
+        ("todas as bitmasks", Replay(-7, level, 12345, "simples",
+                                     [[mask, 1 + mask * 37] for mask in range(16)], 4456, 74266, "derrota")),
+        ("textos utf-8", Replay(1, os.path.join("niveis", "fase ç.json"), 1, "arma-ç", [[1, 2]], 2, 33, "vitoria")),
+    ]
+    cases += [(f"resultado {outcome}", Replay(5, level, 5, runs=[[2, 10]], ticks=10, time_ms=166, outcome=outcome))
+              for outcome in OUTCOMES]
+    recorded = list(_recorded_replays(seeds, max_ticks))
+
+    failures = []
+    for label, replay in cases + recorded:
+        data = replay.to_bytes()
+        loaded = Replay.from_bytes(data)
+        if _replay_fields(loaded) != _replay_fields(replay):
+            failures.append(f"{label}: from_bytes(to_bytes()) não devolve o mesmo replay")
+        for broken, what in ((data[:-1], "truncado"), (data[:10], "sem cabeçalho inteiro"),
+                             (b"XXXX" + data[4:], "com outro magic"),
+                             (data[:26] + b"\xff" + data[27:], "com resultado inválido")):  # byte 26: resultado
+            try:
+                Replay.from_bytes(broken)
+            except ValueError:
+                pass
+            else:
+                failures.append(f"{label}: replay {what} foi aceito")
+    for label, replay in recorded:
+        problems = check(replay, play(Replay.from_bytes(replay.to_bytes())))
+        if problems:
+            failures.append(f"{label}: refeita a partir dos bytes, {'; '.join(problems)}")
+    return failures
+
+CHECKS = {
+    "patrulha": check_fast_forward,
+    "replay": check_replay_roundtrip,
+}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Confere os atalhos da simulação contra o caminho tick a tick.")
+    parser.add_argument("--so", choices=sorted(CHECKS), action="append", help="roda só esta verificação")
+    args = parser.parse_args(argv)
+
+    from headless import init_headless
+    init_headless()
+    failed = 0
+    for name in args.so or CHECKS:
+        failures = CHECKS[name]()
+        print(f"{name}: {'ok' if not failures else f'{len(failures)} divergência(s)'}")
+        for line in failures[:20]:
+            print("  " + line)
+        failed += len(failures)
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
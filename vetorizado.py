@@ -0,0 +1,205 @@
+from config import MAP_WIDTH, MAP_HEIGHT
+from entidades import Bullet, BULLET_SIZE, BULLET_POOL_CAPACITY, pool_stats
+
+# ===== Entidades em arrays (NumPy, opcional) =====
+# Posições, direções, velocidades, limites de patrulha e flags de vida ficam em arrays
+# paralelos (structure-of-arrays) e são atualizados em lote. Os objetos Enemy,
+# GroundEnemy e Bullet continuam existindo como "views": guardam os frames e são
+# sincronizados a partir dos arrays só quando alguém vai desenhá-los.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUMPY_AVAILABLE = np is not None
+
+def _overlaps(ax, ay, aw, ah, bx, by, bw, bh):
+    """Teste AABB em lote (mesma regra do Rect.colliderect: encostar não conta)."""
+    return (ax < bx + bw) & (ax + aw > bx) & (ay < by + bh) & (ay + ah > by)
+
+class EnemyArrays:
+    def __init__(self, enemies):
+        self.views = list(enemies)
+        rects = [e.rect for e in self.views]
+        self.x = np.array([r.x for r in rects], dtype=np.int64)
+        self.y = np.array([r.y for r in rects], dtype=np.int64)
+        self.w = np.array([r.width for r in rects], dtype=np.int64)
+        self.h = np.array([r.height for r in rects], dtype=np.int64)
+        self.prev_x = self.x.copy()
+        self.direction = np.array([e.direction for e in self.views], dtype=np.int64)
+        self.speed = np.array([e.speed for e in self.views], dtype=np.int64)
+        # limites de patrulha em rect.x
+        limits = [e.patrol_range() for e in self.views]
+        self.min_x = np.array([lo for lo, _ in limits], dtype=np.int64)
+        self.max_x = np.array([hi for _, hi in limits], dtype=np.int64)
+        self.alive = np.array([e.alive for e in self.views], dtype=bool)
+        self.anim_timer = np.array([e.animation_timer for e in self.views], dtype=np.float64)
+        self.anim_speed = np.array([e.animation_speed for e in self.views], dtype=np.float64)
+        self.frame_index = np.array([e.frame_index for e in self.views], dtype=np.int64)
+        self.frame_count = np.array([len(e.walk_right) for e in self.views], dtype=np.int64)
+        # quem mudou desde a última sincronização com as views
+        self.dirty = np.zeros(len(self.views), dtype=bool)
+
+    def save_previous(self):
+        self.prev_x[:] = self.x
+
+    def update(self):
+        """Patrulha + animação em lote para todos os inimigos vivos (os arrays só guardam os acordados)."""
+        idx = np.flatnonzero(self.alive)
+        if idx.size == 0:
+            return
+        nx = self.x[idx] + self.speed[idx] * self.direction[idx]
+        at_min = nx <= self.min_x[idx]
+        at_max = ~at_min & (nx >= self.max_x[idx])
+        self.x[idx] = np.where(at_min, self.min_x[idx], np.where(at_max, self.max_x[idx], nx))
+        self.direction[idx] = np.where(at_min, 1, np.where(at_max, -1, self.direction[idx]))
+
+        timer = self.anim_timer[idx] + self.anim_speed[idx]
+        step = timer >= 1
+        self.anim_timer[idx] = np.where(step, 0.0, timer)
+        self.frame_index[idx] = np.where(step, (self.frame_index[idx] + 1) % self.frame_count[idx], self.frame_index[idx])
+        self.dirty[idx] = True
+
+    def first_overlap(self, rect):
+        """Índice do primeiro inimigo vivo que colide com 'rect' (ou None)."""
+        hit = self.alive & _overlaps(self.x, self.y, self.w, self.h, rect.x, rect.y, rect.width, rect.height)
+        idx = np.flatnonzero(hit)
+        return int(idx[0]) if idx.size else None
+
+    def kill(self, indices):
+        self.alive[indices] = False
+        for i in indices:
+            view = self.views[i]
+            view.start_death()
+
+    def between(self, left, right):
+        """Views sincronizadas dos inimigos vivos entre as colunas left e right."""
+        idx = np.flatnonzero(self.alive & (self.x + self.w >= left) & (self.x <= right))
+        return [self.sync(i) for i in idx.tolist()]
+
+    def outside(self, left, right):
+        """Views sincronizadas dos inimigos vivos que estão fora das colunas left..right."""
+        idx = np.flatnonzero(self.alive & ((self.x + self.w < left) | (self.x > right)))
+        return [self.sync(i) for i in idx.tolist()]
+
+    def sync(self, i):
+        view = self.views[i]
+        if self.dirty[i]:
+            view.rect.x = int(self.x[i])
+            view.direction = int(self.direction[i])
+            view.frame_index = int(self.frame_index[i])
+            view.animation_timer = float(self.anim_timer[i])
+            self.dirty[i] = False
+        view.prev_x = int(self.prev_x[i])
+        view.prev_y = view.rect.y
+        return view
+
+class BulletArrays:
+    """Tiros em arrays de capacidade fixa (mesmo contrato do entidades.BulletPool)."""
+
+    def __init__(self, capacity=BULLET_POOL_CAPACITY, map_width=MAP_WIDTH):
+        self.capacity = capacity
+        self.map_width = map_width
+        self.x = np.zeros(capacity, dtype=np.int64)
+        self.y = np.zeros(capacity, dtype=np.int64)
+        self.vx = np.zeros(capacity, dtype=np.int64)
+        self.vy = np.zeros(capacity, dtype=np.int64)
+        self.prev_x = np.zeros(capacity, dtype=np.int64)
+        self.prev_y = np.zeros(capacity, dtype=np.int64)
+        # views pré-alocadas, na mesma ordem dos arrays
+        self.views = [Bullet(0, 0, 1, map_width=map_width) for _ in range(capacity)]
+        self.clear()
+
+    def clear(self):
+        self.count = 0
+        self.peak = 0
+        self.spawned = 0
+        self.overflow = 0
+
+    def __len__(self):
+        return self.count
+
+    def spawn(self, x, y, direction, vy=0):
+        if self.count == self.capacity:
+            self.overflow += 1
+            return None
+        i = self.count
+        view = self.views[i]
+        view.reset(x, y, direction, vy)
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.vx[i] = view.speed
+        self.vy[i] = vy
+        self.count += 1
+        self.spawned += 1
+        if self.count > self.peak:
+            self.peak = self.count
+        return view
+
+    def stats(self):
+        return pool_stats(self.capacity, self.count, self.peak, self.spawned, self.overflow)
+
+    def save_previous(self):
+        n = self.count
+        self.prev_x[:n] = self.x[:n]
+        self.prev_y[:n] = self.y[:n]
+
+    def step(self, enemies):
+        """Move todos os tiros, descarta os que saíram do mapa e resolve acertos em lote.
+
+        Devolve os índices dos inimigos mortos. Mesma regra do laço original: um tiro
+        mata todos os inimigos vivos que toca, e um inimigo morre pelo primeiro tiro
+        (na ordem de disparo) que o acertar.
+        """
+        n = self.count
+        if n == 0:
+            return []
+        x = self.x[:n]
+        y = self.y[:n]
+        x += self.vx[:n]
+        y += self.vy[:n]
+        size = BULLET_SIZE
+        alive = ~((x + size < 0) | (x > self.map_width) | (y + size < 0) | (y > MAP_HEIGHT))
+
+        killed = []
+        if enemies.alive.any():
+            hits = _overlaps(x[:, None], y[:, None], size, size,
+                             enemies.x[None, :], enemies.y[None, :], enemies.w[None, :], enemies.h[None, :])
+            hits &= enemies.alive[None, :]
+            hits &= alive[:, None]
+            hit_enemies = np.flatnonzero(hits.any(axis=0))
+            if hit_enemies.size:
+                killers = hits[:, hit_enemies].argmax(axis=0)
+                alive[killers] = False
+                killed = hit_enemies.tolist()
+
+        if not alive.all():
+            # compacta os vivos no começo dos arrays; as views mortas vão para o fim (slots livres)
+            keep = np.flatnonzero(alive)
+            dead = np.flatnonzero(~alive)
+            m = keep.size
+            for arr in (self.x, self.y, self.vx, self.vy, self.prev_x, self.prev_y):
+                arr[:m] = arr[keep]
+            views = self.views
+            dead_views = [views[i] for i in dead.tolist()]
+            for view in dead_views:
+                view.alive = False
+            views[:m] = [views[i] for i in keep.tolist()]
+            views[m:n] = dead_views
+            self.count = m
+        return killed
+
+    def between(self, left, right):
+        """Views sincronizadas dos tiros entre as colunas left e right."""
+        n = self.count
+        x = self.x[:n]
+        idx = np.flatnonzero((x + BULLET_SIZE >= left) & (x <= right))
+        result = []
+        for i in idx.tolist():
+            view = self.views[i]
+            view.rect.x = int(self.x[i])
+            view.rect.y = int(self.y[i])
+            view.prev_x = int(self.prev_x[i])
+            view.prev_y = int(self.prev_y[i])
+            result.append(view)
+        return result